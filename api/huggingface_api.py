@@ -3,17 +3,48 @@
 """
 
 import os
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datasets import load_dataset
 import pandas as pd
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+import faiss
 import json
 
+# SimSIMD: AVX-512/NEON 커널 기반 유사도 계산 (선택 의존성)
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# pyahocorasick: 다중 패턴 매칭 자동자 (선택 의존성)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson: C 구현 JSON 파서 (선택 의존성, stdlib json 대비 2~5배)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class HuggingFaceAPI:
     """허깅페이스 데이터셋을 사용하는 법률 검색 API"""
-    
+
+    # 검색 필터용 사건 유형 → data_type 매핑
+    CASE_TYPE_MAP = {
+        "해석례": "해석례_QA",
+        "판결문": "판결문_QA",
+        "결정례": "결정례_QA",
+        "법령": "법령_QA"
+    }
+
+    # 키워드 필터 가중치용 법률 용어
+    LEGAL_KEYWORDS = ['조', '항', '호', '법', '죄', '형법', '민법', '상법',
+                      '스토킹', '성범죄', '사기']
+
     def __init__(self, dataset_name=None):
         """
         Args:
@@ -24,11 +55,35 @@ class HuggingFaceAPI:
         self.hf_token = self._get_hf_token()
         self.dataset = None
         self.encoder = None
-        self.embeddings_cache = {}
-        
+        self.device = 'cpu'
+
         # 데이터프레임들 (복수 소스)
         self.df = pd.DataFrame()
         self.curated_df = pd.DataFrame()
+
+        # 사전 계산된 코퍼스 임베딩 행렬 (N x D)
+        self.corpus_emb = None
+        self.curated_emb = None
+
+        # int8 양자화 임베딩 (메모리 4배 절감, 행별 max-abs 스케일)
+        self.corpus_int8 = None
+        self.corpus_scale = None
+        self.curated_int8 = None
+        self.curated_scale = None
+
+        # 대용량 코퍼스용 FAISS HNSW 인덱스
+        self.index = None
+
+        # CUDA 사용 시 VRAM에 상주하는 코퍼스 임베딩 텐서
+        self.corpus_gpu = None
+
+        # 사건 유형별 행 번호 인덱스 (쿼리마다 str.contains 재실행 방지)
+        self.type_idx = {}
+        self.curated_type_idx = {}
+
+        # 행별 법률 용어 비트마스크 (다중 패턴 매칭을 로드 시 1회로 이동)
+        self.kw_mask = None
+        self.curated_kw_mask = None
         
         # 모델 초기화
         self._initialize_encoder()
@@ -60,30 +115,75 @@ class HuggingFaceAPI:
         return os.getenv('HUGGINGFACE_API_TOKEN', None)
 
     def _initialize_encoder(self):
-        """한국어 문장 임베딩 모델 초기화"""
+        """한국어 문장 임베딩 모델 초기화 (CUDA 사용 가능 시 GPU 오프로드)"""
         try:
-            self.encoder = SentenceTransformer('snunlp/KR-SBERT-V40K-klueNLI')
-            print("✅ 한국어 SBERT 모델 로드 완료")
+            import torch
+            self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+
+            if self.device == 'cpu':
+                # Streamlit 이벤트 루프와 스레드 경합 방지 (코어 절반만 사용)
+                torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+
+            self.encoder = SentenceTransformer(
+                'snunlp/KR-SBERT-V40K-klueNLI', device=self.device
+            )
+
+            # CUDA에서는 FP16 가중치로 메모리/대역폭 절반 + 텐서코어 경로 활성화
+            if self.device == 'cuda':
+                self.encoder = self.encoder.half()
+            self.encoder.eval()
+
+            print(f"✅ 한국어 SBERT 모델 로드 완료 (device: {self.device})")
         except Exception as e:
             print(f"❌ 임베딩 모델 로드 실패: {e}")
             self.encoder = None
+            self.device = 'cpu'
     
     def _load_dataset(self):
         """허깅페이스에서 데이터셋 로드"""
         try:
-            print(f"📥 허깅페이스에서 데이터셋 로딩: {self.dataset_name}")
-            self.dataset = load_dataset(self.dataset_name)
-            print(f"✅ 데이터셋 로드 완료: {len(self.dataset['all'])}개 데이터")
-            
-            # 데이터프레임으로 변환 (검색 성능 향상)
-            self.df = self.dataset['all'].to_pandas()
-            print(f"✅ 데이터프레임 변환 완료")
-            
+            # 이전 실행에서 저장한 Parquet 캐시가 있으면 HF 변환 없이 바로 읽기
+            parquet_cache = "corpus.parquet"
+            if os.path.exists(parquet_cache):
+                try:
+                    self.df = pd.read_parquet(parquet_cache)
+                    print(f"✅ Parquet 캐시 로드 완료: {len(self.df)}개 데이터")
+                except Exception as e:
+                    print(f"⚠️ Parquet 캐시 로드 실패: {e}")
+                    self.df = pd.DataFrame()
+
+            if self.df.empty:
+                print(f"📥 허깅페이스에서 데이터셋 로딩: {self.dataset_name}")
+                self.dataset = load_dataset(self.dataset_name)
+                print(f"✅ 데이터셋 로드 완료: {len(self.dataset['all'])}개 데이터")
+
+                # 데이터프레임으로 변환 (검색 성능 향상)
+                self.df = self.dataset['all'].to_pandas()
+                print(f"✅ 데이터프레임 변환 완료")
+
+                # data_type을 카테고리로 사전 인코딩 후 Parquet(zstd)으로 저장
+                # (다음 실행부터 문자열 재구성 없이 컬럼 단위로 바로 로드)
+                try:
+                    self.df['data_type'] = self.df['data_type'].astype('category')
+                    self.df.to_parquet(parquet_cache, compression='zstd')
+                    print(f"✅ Parquet 캐시 저장 완료: {parquet_cache}")
+                except Exception as e:
+                    print(f"⚠️ Parquet 캐시 저장 실패: {e}")
+
+            # 코퍼스 전체를 한 번에 배치 인코딩 (쿼리마다 재인코딩 방지)
+            self.corpus_emb = self._encode_corpus(self.df, "corpus_emb.npy")
+            self.corpus_int8, self.corpus_scale = self._quantize_int8(self.corpus_emb)
+            self.index = self._build_ann_index(self.corpus_emb, "corpus_hnsw.index")
+            self.type_idx = self._build_type_index(self.df)
+            self._add_lowercase_columns(self.df)
+            self.kw_mask = self._build_keyword_mask(self.df)
+            self.corpus_gpu = self._to_gpu(self.corpus_emb)
+
         except Exception as e:
             print(f"❌ 데이터셋 로드 실패: {e}")
             print("💡 로컬 데이터셋을 사용합니다...")
             self._load_local_dataset()
-    
+
     def _load_local_dataset(self):
         """로컬 데이터셋 로드 (백업)"""
         try:
@@ -91,11 +191,227 @@ class HuggingFaceAPI:
             self.dataset = load_from_disk("korean_legal_dataset")
             self.df = self.dataset['all'].to_pandas()
             print(f"✅ 로컬 데이터셋 로드 완료: {len(self.df)}개 데이터")
+
+            self.corpus_emb = self._encode_corpus(self.df, "corpus_emb.npy")
+            self.corpus_int8, self.corpus_scale = self._quantize_int8(self.corpus_emb)
+            self.index = self._build_ann_index(self.corpus_emb, "corpus_hnsw.index")
+            self.type_idx = self._build_type_index(self.df)
+            self._add_lowercase_columns(self.df)
+            self.kw_mask = self._build_keyword_mask(self.df)
+            self.corpus_gpu = self._to_gpu(self.corpus_emb)
         except Exception as e:
             print(f"❌ 로컬 데이터셋 로드도 실패: {e}")
             self.dataset = None
             self.df = pd.DataFrame()
-    
+
+    def _encode_corpus(self, df: pd.DataFrame, cache_file: str) -> Optional[np.ndarray]:
+        """
+        코퍼스 임베딩 사전 계산 (디스크 캐시 지원)
+
+        Args:
+            df: 인코딩할 데이터프레임
+            cache_file: 임베딩 캐시 파일 경로 (.npy)
+
+        Returns:
+            정규화된 임베딩 행렬 (N x D) 또는 None
+        """
+        if df.empty or self.encoder is None:
+            return None
+
+        try:
+            # 이전 실행에서 저장한 임베딩이 있으면 memmap으로 재사용 (재인코딩 방지)
+            if os.path.exists(cache_file):
+                corpus_emb = np.load(cache_file, mmap_mode='r')
+                if corpus_emb.shape[0] == len(df) and corpus_emb.dtype == np.float16:
+                    print(f"✅ 임베딩 캐시 로드 완료: {cache_file} ({corpus_emb.shape[0]}개)")
+                    return corpus_emb
+
+            # input/output을 각각 배치 인코딩 후 평균 풀링
+            # (연결된 긴 문자열 대비 시퀀스 길이가 절반 → O(L²) attention 비용 절감)
+            encode_kwargs = dict(
+                batch_size=1024,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            e_in = self.encoder.encode(df['input'].astype(str).tolist(), **encode_kwargs)
+            e_out = self.encoder.encode(df['output'].astype(str).tolist(), **encode_kwargs)
+
+            corpus_emb = (e_in + e_out).astype(np.float32)
+            norms = np.linalg.norm(corpus_emb, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            corpus_emb /= norms
+
+            # 저장은 FP16 (대역폭/메모리 절반), 연산 시점에 FP32로 승격해 누적
+            corpus_emb = corpus_emb.astype(np.float16)
+
+            # 디스크에 저장 후 memmap으로 다시 열기 (다음 실행 시 재인코딩 생략)
+            np.save(cache_file, corpus_emb)
+            print(f"✅ 코퍼스 임베딩 생성 완료: {corpus_emb.shape}")
+            return np.load(cache_file, mmap_mode='r')
+
+        except Exception as e:
+            print(f"❌ 코퍼스 임베딩 생성 실패: {e}")
+            return None
+
+    def _add_lowercase_columns(self, df: pd.DataFrame):
+        """키워드 필터용 소문자 컬럼 사전 계산 (쿼리마다 lower() 재실행 방지)"""
+        if df.empty:
+            return
+
+        try:
+            df['_lc_input'] = df['input'].astype(str).str.lower()
+            df['_lc_output'] = df['output'].astype(str).str.lower()
+            df['_lc_case_name'] = df['case_name'].astype(str).str.lower()
+        except Exception as e:
+            print(f"❌ 소문자 컬럼 사전 계산 실패: {e}")
+
+    def _to_gpu(self, corpus_emb: Optional[np.ndarray]):
+        """CUDA 사용 가능 시 코퍼스 임베딩을 VRAM에 상주시켜 GEMV를 GPU로 오프로드"""
+        if corpus_emb is None or self.device != 'cuda':
+            return None
+
+        try:
+            import torch
+            return torch.from_numpy(
+                np.asarray(corpus_emb, dtype=np.float32)
+            ).to(self.device)
+        except Exception as e:
+            print(f"❌ GPU 임베딩 적재 실패: {e}")
+            return None
+
+    def _build_keyword_mask(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        행별 법률 용어 비트마스크 사전 계산
+
+        pyahocorasick이 설치되어 있으면 문서당 단일 패스로 모든 패턴을
+        동시에 매칭하고, 없으면 키워드별 벡터화 스캔으로 대체한다.
+        쿼리 시에는 비트 AND 한 번으로 법률 용어 가중치를 계산할 수 있다.
+        """
+        if df.empty:
+            return None
+
+        try:
+            texts = (df['input'].astype(str) + ' ' + df['output'].astype(str)).str.lower()
+            masks = np.zeros(len(df), dtype=np.int32)
+
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for bit, keyword in enumerate(self.LEGAL_KEYWORDS):
+                    automaton.add_word(keyword, bit)
+                automaton.make_automaton()
+
+                for i, text in enumerate(texts):
+                    mask = 0
+                    for _, bit in automaton.iter(text):
+                        mask |= 1 << bit
+                    masks[i] = mask
+            else:
+                # 자동자 없이 키워드별 벡터화 스캔 (로드 시 1회)
+                for bit, keyword in enumerate(self.LEGAL_KEYWORDS):
+                    hits = texts.str.contains(keyword, regex=False).to_numpy()
+                    masks |= hits.astype(np.int32) << bit
+
+            return masks
+
+        except Exception as e:
+            print(f"❌ 법률 용어 마스크 구축 실패: {e}")
+            return None
+
+    def _build_type_index(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """사건 유형별 행 번호 배열 사전 계산 (쿼리 시 str.contains 패스 제거)"""
+        type_idx = {}
+        if df.empty or 'data_type' not in df.columns:
+            return type_idx
+
+        try:
+            if isinstance(df['data_type'].dtype, pd.CategoricalDtype):
+                # 카테고리 dtype이면 고유값에만 문자열 매칭 후 정수 코드 비교
+                # (행 수가 아니라 카테고리 수에 비례하는 문자열 스캔)
+                codes = df['data_type'].cat.codes.to_numpy()
+                categories = df['data_type'].cat.categories.astype(str)
+                for mapped_type in self.CASE_TYPE_MAP.values():
+                    hit_codes = np.where(
+                        categories.str.contains(mapped_type, regex=False)
+                    )[0]
+                    type_idx[mapped_type] = np.where(np.isin(codes, hit_codes))[0]
+                return type_idx
+
+            data_types = df['data_type'].astype(str)
+            for mapped_type in self.CASE_TYPE_MAP.values():
+                type_idx[mapped_type] = np.where(
+                    data_types.str.contains(mapped_type, regex=False)
+                )[0]
+            return type_idx
+
+        except Exception as e:
+            print(f"❌ 사건 유형 인덱스 구축 실패: {e}")
+            return {}
+
+    def _quantize_int8(self, corpus_emb: Optional[np.ndarray]):
+        """
+        임베딩 행렬 int8 스칼라 양자화
+
+        행별 max-abs 스케일로 [-127, 127] 범위에 맞춰 양자화한다.
+        float32 대비 메모리 1/4, int8 내적 경로로 ALU 처리량도 높아진다.
+
+        Returns:
+            (int8 행렬, float32 스케일 벡터) 또는 (None, None)
+        """
+        if corpus_emb is None:
+            return None, None
+
+        try:
+            emb = np.asarray(corpus_emb, dtype=np.float32)
+            scales = np.abs(emb).max(axis=1)
+            scales[scales == 0] = 1.0
+            int8_emb = np.round(emb * (127.0 / scales[:, None])).astype(np.int8)
+            return int8_emb, scales.astype(np.float32)
+
+        except Exception as e:
+            print(f"❌ 임베딩 양자화 실패: {e}")
+            return None, None
+
+    def _build_ann_index(self, corpus_emb: Optional[np.ndarray], index_file: str):
+        """
+        FAISS HNSW 인덱스 구축 (정규화 벡터 + 내적 == 코사인 유사도)
+
+        Args:
+            corpus_emb: 사전 계산된 임베딩 행렬
+            index_file: 인덱스 캐시 파일 경로
+
+        Returns:
+            FAISS 인덱스 또는 None
+        """
+        if corpus_emb is None:
+            return None
+
+        try:
+            # 저장된 인덱스가 있으면 재사용
+            # mmap 모드로 열어 여러 프로세스가 페이지 캐시를 공유 (워커당 복사본 방지)
+            if os.path.exists(index_file):
+                try:
+                    index = faiss.read_index(
+                        index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                    )
+                except Exception:
+                    index = faiss.read_index(index_file)
+                if index.ntotal == corpus_emb.shape[0]:
+                    print(f"✅ FAISS 인덱스 로드 완료: {index_file} ({index.ntotal}개)")
+                    return index
+
+            dim = corpus_emb.shape[1]
+            index = faiss.IndexHNSWFlat(dim, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            index.add(np.ascontiguousarray(corpus_emb, dtype=np.float32))
+            faiss.write_index(index, index_file)
+            print(f"✅ FAISS HNSW 인덱스 구축 완료: {index.ntotal}개")
+            return index
+
+        except Exception as e:
+            print(f"❌ FAISS 인덱스 구축 실패: {e}")
+            return None
+
     def _load_curated_dataset(self):
         """큐레이티드 법률 데이터셋 로드"""
         try:
@@ -105,37 +421,71 @@ class HuggingFaceAPI:
                 return
             
             print("📥 큐레이티드 법률 데이터셋 로딩...")
+
+            if orjson is not None:
+                with open(curated_file, 'rb') as f:
+                    curated_data = orjson.loads(f.read())
+            else:
+                with open(curated_file, 'r', encoding='utf-8') as f:
+                    curated_data = json.load(f)
             
-            with open(curated_file, 'r', encoding='utf-8') as f:
-                curated_data = json.load(f)
-            
-            # 큐레이티드 데이터를 검색 가능한 형태로 변환
-            curated_records = []
-            
-            for case_id, case_data in curated_data.get('precedents', {}).items():
-                record = {
-                    'id': case_id,
-                    'case_number': case_id,
-                    'case_name': case_data.get('title', ''),
-                    'court_code': case_data.get('court', ''),
-                    'final_date': case_data.get('date', ''),
-                    'input': f"{case_data.get('title', '')} {case_data.get('summary', '')}",
-                    'output': f"판결 요지: {case_data.get('summary', '')}\n"
-                             f"핵심 법리: {'; '.join(case_data.get('key_legal_points', []))}\n"
-                             f"적용 법령: {'; '.join(case_data.get('applicable_laws', []))}\n"
-                             f"형량: {case_data.get('sentence', '')}\n"
-                             f"손해배상: {case_data.get('compensation', '')}",
-                    'data_type': f"큐레이티드_{case_data.get('category', '일반')}",
-                    'law_class': case_data.get('category', ''),
-                    'importance': case_data.get('importance', '보통'),
-                    'applicable_laws': case_data.get('applicable_laws', []),
-                    'key_legal_points': case_data.get('key_legal_points', [])
-                }
-                curated_records.append(record)
-            
-            self.curated_df = pd.DataFrame(curated_records)
+            # 큐레이티드 데이터를 검색 가능한 형태로 변환 (컬럼 단위 벡터화 구성)
+            precedents = curated_data.get('precedents', {})
+            if not precedents:
+                print("⚠️ 큐레이티드 데이터셋에 판례가 없습니다.")
+                self.curated_df = pd.DataFrame()
+                return
+
+            base = pd.DataFrame.from_dict(precedents, orient='index')
+
+            # 누락 컬럼/결측값 기본값 채우기
+            for col, default in (('title', ''), ('court', ''), ('date', ''),
+                                 ('summary', ''), ('category', ''),
+                                 ('sentence', ''), ('compensation', ''),
+                                 ('importance', '보통')):
+                if col not in base.columns:
+                    base[col] = default
+                else:
+                    base[col] = base[col].fillna(default)
+
+            for col in ('key_legal_points', 'applicable_laws'):
+                if col not in base.columns:
+                    base[col] = [[] for _ in range(len(base))]
+                else:
+                    base[col] = base[col].apply(
+                        lambda v: v if isinstance(v, list) else []
+                    )
+
+            title = base['title'].astype(str)
+            summary = base['summary'].astype(str)
+            category = base['category'].astype(str)
+
+            self.curated_df = pd.DataFrame({
+                'id': base.index,
+                'case_number': base.index,
+                'case_name': title,
+                'court_code': base['court'].astype(str),
+                'final_date': base['date'].astype(str),
+                'input': title + ' ' + summary,
+                'output': ('판결 요지: ' + summary + '\n'
+                           + '핵심 법리: ' + base['key_legal_points'].str.join('; ') + '\n'
+                           + '적용 법령: ' + base['applicable_laws'].str.join('; ') + '\n'
+                           + '형량: ' + base['sentence'].astype(str) + '\n'
+                           + '손해배상: ' + base['compensation'].astype(str)),
+                'data_type': '큐레이티드_' + category.where(category != '', '일반'),
+                'law_class': base['category'],
+                'importance': base['importance'],
+                'applicable_laws': base['applicable_laws'],
+                'key_legal_points': base['key_legal_points']
+            }).reset_index(drop=True)
             print(f"✅ 큐레이티드 데이터셋 로드 완료: {len(self.curated_df)}개 고품질 판례")
-            
+
+            self.curated_emb = self._encode_corpus(self.curated_df, "curated_corpus_emb.npy")
+            self.curated_int8, self.curated_scale = self._quantize_int8(self.curated_emb)
+            self.curated_type_idx = self._build_type_index(self.curated_df)
+            self._add_lowercase_columns(self.curated_df)
+            self.curated_kw_mask = self._build_keyword_mask(self.curated_df)
+
         except Exception as e:
             print(f"❌ 큐레이티드 데이터셋 로드 실패: {e}")
             self.curated_df = pd.DataFrame()
@@ -184,132 +534,219 @@ class HuggingFaceAPI:
             return []
         
         try:
-            # 데이터 필터링
-            search_df = df.copy()
+            # 데이터 필터링 (복사 없이 사전 계산된 유형 인덱스로 선택)
+            search_df = df
             if case_type and case_type != "전체":
-                case_type_map = {
-                    "해석례": "해석례_QA",
-                    "판결문": "판결문_QA", 
-                    "결정례": "결정례_QA",
-                    "법령": "법령_QA"
-                }
-                if case_type in case_type_map:
-                    search_df = search_df[search_df['data_type'].str.contains(case_type_map[case_type])]
+                mapped_type = self.CASE_TYPE_MAP.get(case_type)
+                if mapped_type:
+                    type_idx = (self.curated_type_idx if source == "큐레이티드"
+                                else self.type_idx)
+                    if mapped_type in type_idx:
+                        search_df = df.iloc[type_idx[mapped_type]]
+                    else:
+                        search_df = df[df['data_type'].str.contains(mapped_type)]
             
             if search_df.empty:
                 return []
             
-            # 1단계: 키워드 기반 필터링 (빠른 검색)
+            # 1단계: 키워드 기반 필터링 (벡터화된 문자열 연산)
             query_lower = query.lower()
-            keyword_matches = []
-            
-            for idx, row in search_df.iterrows():
-                input_text = str(row['input']).lower()
-                output_text = str(row['output']).lower()
-                case_name = str(row['case_name']).lower()
-                
-                # 키워드 매칭 점수
-                keyword_score = 0
-                if query_lower in input_text or query_lower in output_text or query_lower in case_name:
-                    keyword_score += 3
-                
-                # 부분 키워드 매칭
-                query_words = query_lower.split()
-                for word in query_words:
-                    if len(word) > 1:  # 한 글자는 제외
-                        if word in input_text or word in output_text:
-                            keyword_score += 1
-                
-                # 특별 키워드 가중치 (법률 용어)
-                legal_keywords = ['조', '항', '호', '법', '죄', '형법', '민법', '상법', '스토킹', '성범죄', '사기']
-                for keyword in legal_keywords:
-                    if keyword in query_lower and keyword in input_text or keyword in output_text:
-                        keyword_score += 2
-                
-                if keyword_score > 0:
-                    keyword_matches.append((idx, keyword_score))
-            
-            # 2단계: 키워드 매칭된 것이 있으면 우선 처리
-            if keyword_matches:
-                # 키워드 점수 순으로 정렬
-                keyword_matches.sort(key=lambda x: x[1], reverse=True)
-                selected_indices = [idx for idx, score in keyword_matches[:top_k*3]]  # 더 많이 선택
-                filtered_df = search_df.loc[selected_indices]
+            query_words = [w for w in query_lower.split() if len(w) > 1]  # 한 글자는 제외
+
+            if '_lc_input' in search_df.columns:
+                lc_input = search_df['_lc_input']
+                lc_output = search_df['_lc_output']
+                lc_case_name = search_df['_lc_case_name']
             else:
-                # 키워드 매칭이 없으면 전체 데이터 사용 (큐레이티드는 작으니까 전체, 허깅페이스는 샘플링)
-                if source == "큐레이티드":
-                    filtered_df = search_df
-                else:
-                    filtered_df = search_df.sample(min(1000, len(search_df)))  # 성능을 위해 샘플링
-            
-            # 3단계: 임베딩 기반 유사도 검색
-            query_embedding = self.encoder.encode([query])
-            
-            text_embeddings = []
-            valid_indices = []
-            
-            for idx, row in filtered_df.iterrows():
-                text = f"{row['input']} {row['output']}"
-                cache_key = f"{row['id']}_{row['data_type']}_{source}"
-                
-                if cache_key in self.embeddings_cache:
-                    embedding = self.embeddings_cache[cache_key]
-                else:
-                    embedding = self.encoder.encode([text])[0]
-                    self.embeddings_cache[cache_key] = embedding
-                
-                text_embeddings.append(embedding)
-                valid_indices.append(idx)
+                lc_input = search_df['input'].astype(str).str.lower()
+                lc_output = search_df['output'].astype(str).str.lower()
+                lc_case_name = search_df['case_name'].astype(str).str.lower()
+
+            # 쿼리 전체 매칭 점수
+            keyword_score = 3 * (
+                lc_input.str.contains(query_lower, regex=False)
+                | lc_output.str.contains(query_lower, regex=False)
+                | lc_case_name.str.contains(query_lower, regex=False)
+            ).to_numpy(dtype=np.int32)
+
+            # 부분 키워드 매칭
+            for word in query_words:
+                keyword_score += lc_input.str.contains(word, regex=False).to_numpy(dtype=np.int32)
+                keyword_score += lc_output.str.contains(word, regex=False).to_numpy(dtype=np.int32)
+
+            # 특별 키워드 가중치 (법률 용어) — 사전 계산된 비트마스크와 AND 한 번
+            kw_mask = (self.curated_kw_mask if source == "큐레이티드"
+                       else self.kw_mask)
+            query_mask = 0
+            for bit, keyword in enumerate(self.LEGAL_KEYWORDS):
+                if keyword in query_lower:
+                    query_mask |= 1 << bit
+
+            if query_mask and kw_mask is not None:
+                matched = kw_mask[search_df.index.to_numpy()] & query_mask
+                for bit in range(len(self.LEGAL_KEYWORDS)):
+                    keyword_score += 2 * ((matched >> bit) & 1).astype(np.int32)
+            elif query_mask:
+                # 마스크가 없으면 키워드별 벡터화 스캔으로 대체
+                for bit, keyword in enumerate(self.LEGAL_KEYWORDS):
+                    if query_mask & (1 << bit):
+                        keyword_score += 2 * (
+                            lc_input.str.contains(keyword, regex=False)
+                            | lc_output.str.contains(keyword, regex=False)
+                        ).to_numpy(dtype=np.int32)
+
+            # 2단계: 키워드 매칭된 것이 있으면 상위 후보만 선택
+            if keyword_score.size and keyword_score.max() > 0:
+                n_candidates = min(top_k * 3, keyword_score.size)  # 더 많이 선택
+                top = np.argpartition(-keyword_score, n_candidates - 1)[:n_candidates]
+                top = top[keyword_score[top] > 0]
+                filtered_df = search_df.iloc[top]
+            else:
+                # 키워드 매칭이 없으면 전체 데이터 사용 (ANN 인덱스/행렬 내적으로 전량 검색 가능)
+                filtered_df = search_df
             
-            if not text_embeddings:
+            # 3단계: 임베딩 기반 유사도 검색 (사전 계산된 코퍼스 임베딩 활용)
+            query_vec = self._encode_query(query)
+
+            corpus_emb = self.curated_emb if source == "큐레이티드" else self.corpus_emb
+
+            # 전체 코퍼스 검색이면 HNSW 인덱스로 상위 후보만 O(log N) 조회
+            if (source != "큐레이티드" and self.index is not None
+                    and len(filtered_df) == len(self.df)):
+                scores, ids = self.index.search(query_vec.reshape(1, -1), top_k)
+                valid_indices = [int(i) for i in ids[0] if i >= 0]
+                if not valid_indices:
+                    return []
+                similarities = scores[0][:len(valid_indices)]
+                return self._build_results(
+                    search_df, valid_indices, similarities, top_k, source
+                )
+
+            valid_indices = list(filtered_df.index)
+
+            if not valid_indices:
                 return []
-            
-            # 유사도 계산
-            text_embeddings = np.array(text_embeddings)
-            similarities = cosine_similarity(query_embedding, text_embeddings)[0]
-            
-            # 상위 결과 선택
-            top_indices = similarities.argsort()[-top_k:][::-1]
-            
-            results = []
-            for i, embedding_idx in enumerate(top_indices):
-                original_idx = valid_indices[embedding_idx]
-                row = search_df.loc[original_idx]
-                similarity_score = similarities[embedding_idx]
-                
-                # 최소 유사도 필터링 (큐레이티드는 더 관대하게)
-                min_similarity = 0.05 if source == "큐레이티드" else 0.1
-                if similarity_score < min_similarity:
-                    continue
-                
-                result = {
-                    'case_id': row['id'],
-                    'case_number': row['case_number'],
-                    'case_name': row['case_name'],
-                    'court_code': row['court_code'],
-                    'final_date': row['final_date'],
-                    'input': row['input'],
-                    'output': row['output'],
-                    'data_type': row['data_type'],
-                    'similarity': similarity_score,
-                    'source': source,
-                    'rank': i + 1
-                }
-                
-                # 큐레이티드 데이터에서 추가 정보 포함
-                if source == "큐레이티드" and 'applicable_laws' in row:
-                    result['applicable_laws'] = row.get('applicable_laws', [])
-                    result['key_legal_points'] = row.get('key_legal_points', [])
-                    result['importance'] = row.get('importance', '보통')
-                
-                results.append(result)
-            
-            return results
-            
+
+            int8_emb, int8_scale = (
+                (self.curated_int8, self.curated_scale) if source == "큐레이티드"
+                else (self.corpus_int8, self.corpus_scale)
+            )
+
+            rows = np.asarray(valid_indices, dtype=np.int64)
+
+            if source != "큐레이티드" and self.corpus_gpu is not None:
+                # VRAM 상주 행렬과 cuBLAS GEMV로 계산 (쿼리만 H2D 전송)
+                import torch
+                query_t = torch.from_numpy(query_vec).to(self.device)
+                rows_t = torch.from_numpy(rows).to(self.device)
+                similarities = (self.corpus_gpu[rows_t] @ query_t).cpu().numpy()
+            elif int8_emb is not None:
+                # int8 내적 (int32 누적) 후 스케일 복원 — 양자화된 행렬로 대역폭 절감
+                q_scale = float(np.abs(query_vec).max()) or 1.0
+                q_int8 = np.round(query_vec * (127.0 / q_scale)).astype(np.int8)
+                dots = int8_emb[rows].astype(np.int32) @ q_int8.astype(np.int32)
+                similarities = dots.astype(np.float32) * (
+                    int8_scale[rows] * q_scale / (127.0 * 127.0)
+                )
+            elif corpus_emb is not None:
+                # 행 레이블 == 행렬 행 번호 (to_pandas의 RangeIndex 기준)
+                text_embeddings = np.ascontiguousarray(corpus_emb[rows], dtype=np.float32)
+                similarities = self._batch_cosine(query_vec, text_embeddings)
+            else:
+                # 사전 계산 임베딩이 없으면 미스 전체를 단일 배치로 인코딩
+                # (행당 encode([text]) 호출 대신 한 번의 forward — 토크나이저/런치 오버헤드 제거)
+                texts = (filtered_df['input'].astype(str) + ' '
+                         + filtered_df['output'].astype(str)).tolist()
+                text_embeddings = self.encoder.encode(
+                    texts,
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                ).astype(np.float32)
+                similarities = self._batch_cosine(query_vec, text_embeddings)
+
+            # 상위 결과 선택 (전체 정렬 대신 부분 분할 후 k개만 정렬)
+            k = min(top_k, similarities.size)
+            part = np.argpartition(-similarities, k - 1)[:k]
+            top_indices = part[np.argsort(-similarities[part])]
+
+            return self._build_results(
+                search_df,
+                [valid_indices[i] for i in top_indices],
+                similarities[top_indices],
+                top_k,
+                source
+            )
+
         except Exception as e:
             print(f"❌ {source} 검색 오류: {e}")
             return []
-    
+
+    @lru_cache(maxsize=1024)
+    def _encode_query_cached(self, query: str) -> bytes:
+        """쿼리 임베딩 LRU 캐시 (불변 bytes로 저장)"""
+        return self.encoder.encode(
+            [query], normalize_embeddings=True
+        )[0].astype(np.float32).tobytes()
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        """정규화된 쿼리 임베딩 반환 (동일 쿼리는 transformer를 한 번만 통과)"""
+        return np.frombuffer(self._encode_query_cached(query), dtype=np.float32)
+
+    @staticmethod
+    def _batch_cosine(query_vec: np.ndarray, text_embeddings: np.ndarray) -> np.ndarray:
+        """
+        쿼리 벡터와 임베딩 행렬 간 코사인 유사도 일괄 계산
+
+        SimSIMD가 설치되어 있으면 AVX-512/NEON 커널을 사용하고,
+        없으면 정규화 벡터 가정 하의 단일 BLAS GEMV로 계산한다.
+        """
+        if simsimd is not None:
+            return 1.0 - np.asarray(
+                simsimd.cdist(query_vec.reshape(1, -1), text_embeddings, metric='cosine')
+            )[0].astype(np.float32)
+
+        # 양쪽 모두 정규화된 벡터이므로 내적 한 번이 곧 코사인 유사도
+        return text_embeddings @ query_vec
+
+    def _build_results(self, search_df: pd.DataFrame, indices: List[int],
+                       similarities: np.ndarray, top_k: int, source: str) -> List[Dict]:
+        """유사도 순으로 정렬된 인덱스/점수를 결과 딕셔너리 리스트로 변환"""
+        results = []
+        for i, original_idx in enumerate(indices[:top_k]):
+            row = search_df.loc[original_idx]
+            similarity_score = float(similarities[i])
+
+            # 최소 유사도 필터링 (큐레이티드는 더 관대하게)
+            min_similarity = 0.05 if source == "큐레이티드" else 0.1
+            if similarity_score < min_similarity:
+                continue
+
+            result = {
+                'case_id': row['id'],
+                'case_number': row['case_number'],
+                'case_name': row['case_name'],
+                'court_code': row['court_code'],
+                'final_date': row['final_date'],
+                'input': row['input'],
+                'output': row['output'],
+                'data_type': row['data_type'],
+                'similarity': similarity_score,
+                'source': source,
+                'rank': i + 1
+            }
+
+            # 큐레이티드 데이터에서 추가 정보 포함
+            if source == "큐레이티드" and 'applicable_laws' in row:
+                result['applicable_laws'] = row.get('applicable_laws', [])
+                result['key_legal_points'] = row.get('key_legal_points', [])
+                result['importance'] = row.get('importance', '보통')
+
+            results.append(result)
+
+        return results
+
+
     def get_legal_interpretation(self, query: str) -> Dict:
         """법률 해석 검색"""
         # 해석례 데이터만 검색
@@ -328,21 +765,56 @@ class HuggingFaceAPI:
             return {}
     
     def get_enhanced_case_analysis(self, case_description: str) -> Dict:
-        """종합 사건 분석"""
+        """종합 사건 분석 (쿼리 인코딩 1회 + 단일 유사도 벡터로 전 항목 추출)"""
         try:
-            # 1. 사건 분류 (데이터 타입별 유사도 확인)
-            case_classification = self._classify_case(case_description)
-            
-            # 2. 유사 판례 검색
-            similar_precedents = self.search_similar_cases(case_description, top_k=5)
-            
-            # 3. 관련 법령 검색
-            applicable_laws = self.search_similar_cases(case_description, top_k=3, case_type="법령")
-            
-            # 4. 법률 해석
-            legal_interpretations = self.search_similar_cases(case_description, top_k=2, case_type="해석례")
-            
-            # 5. 데이터 소스 정보
+            # 사전 계산 임베딩이 없으면 검색별 개별 경로로 대체
+            if self.corpus_emb is None or self.encoder is None or self.df.empty:
+                case_classification = self._classify_case(case_description)
+                similar_precedents = self.search_similar_cases(case_description, top_k=5)
+                applicable_laws = self.search_similar_cases(
+                    case_description, top_k=3, case_type="법령")
+                legal_interpretations = self.search_similar_cases(
+                    case_description, top_k=2, case_type="해석례")
+            else:
+                # 유사도 벡터 하나를 계산하고 상위 50개 후보를 한 번만 정렬
+                query_vec = self._encode_query(case_description)
+                if self.corpus_gpu is not None:
+                    import torch
+                    query_t = torch.from_numpy(query_vec).to(self.device)
+                    sims = (self.corpus_gpu @ query_t).cpu().numpy()
+                else:
+                    sims = np.asarray(self.corpus_emb, dtype=np.float32) @ query_vec
+
+                n = min(50, sims.size)
+                part = np.argpartition(-sims, n - 1)[:n]
+                top_sorted = part[np.argsort(-sims[part])]
+
+                # 후보 목록을 한 번 순회하며 판례/법령/해석례 버킷을 채우기
+                prec_idx, law_idx, interp_idx = [], [], []
+                dtype_col = self.df['data_type']
+                for idx in top_sorted:
+                    i = int(idx)
+                    if len(prec_idx) < 5:
+                        prec_idx.append(i)
+                    dt = str(dtype_col.iloc[i])
+                    if '법령_QA' in dt and len(law_idx) < 3:
+                        law_idx.append(i)
+                    elif '해석례_QA' in dt and len(interp_idx) < 2:
+                        interp_idx.append(i)
+                    if (len(prec_idx) >= 5 and len(law_idx) >= 3
+                            and len(interp_idx) >= 2):
+                        break
+
+                similar_precedents = self._build_results(
+                    self.df, prec_idx, sims[prec_idx], 5, "허깅페이스")
+                applicable_laws = self._build_results(
+                    self.df, law_idx, sims[law_idx], 3, "허깅페이스")
+                legal_interpretations = self._build_results(
+                    self.df, interp_idx, sims[interp_idx], 2, "허깅페이스")
+
+                # 분류도 같은 유사도 벡터에서 유형별 최대값으로 계산 (재인코딩 없음)
+                case_classification = self._classify_from_sims(sims)
+
             data_sources = ["허깅페이스 한국어 법률 데이터셋", "형사법 LLM 사전학습 데이터"]
             
             return {
@@ -362,28 +834,39 @@ class HuggingFaceAPI:
             return {'error': str(e)}
     
     def _classify_case(self, case_description: str) -> str:
-        """사건 분류"""
+        """사건 분류 (단일 쿼리 인코딩 + 유형별 마스크 최대값)"""
         try:
-            # 각 데이터 타입별로 유사도 계산
-            data_types = ['결정례_QA', '법령_QA', '판결문_QA', '해석례_QA']
-            type_scores = {}
-            
-            for data_type in data_types:
-                results = self.search_similar_cases(case_description, top_k=1, case_type=data_type.split('_')[0])
-                if results:
-                    type_scores[data_type] = results[0]['similarity_score']
-                else:
-                    type_scores[data_type] = 0
-            
-            # 가장 높은 점수의 타입 반환
-            if type_scores:
-                best_type = max(type_scores, key=type_scores.get)
-                return best_type.replace('_QA', '').replace('_SUM', '')
-            else:
+            if self.corpus_emb is None or self.encoder is None or not self.type_idx:
                 return "분류 불가"
-                
+
+            # 쿼리를 한 번만 인코딩하고 유사도 벡터 하나를 유형별로 나눠서 평가
+            query_vec = self._encode_query(case_description)
+            if self.corpus_gpu is not None:
+                import torch
+                query_t = torch.from_numpy(query_vec).to(self.device)
+                sims = (self.corpus_gpu @ query_t).cpu().numpy()
+            else:
+                sims = np.asarray(self.corpus_emb, dtype=np.float32) @ query_vec
+
+            return self._classify_from_sims(sims)
+
         except Exception as e:
             return f"분류 오류: {e}"
+
+    def _classify_from_sims(self, sims: np.ndarray) -> str:
+        """사전 계산된 유사도 벡터에서 유형별 최대값으로 사건 분류"""
+        if not self.type_idx:
+            return "분류 불가"
+
+        type_scores = {}
+        for data_type, idx in self.type_idx.items():
+            type_scores[data_type] = float(sims[idx].max()) if idx.size else 0.0
+
+        # 가장 높은 점수의 타입 반환
+        if type_scores:
+            best_type = max(type_scores, key=type_scores.get)
+            return best_type.replace('_QA', '').replace('_SUM', '')
+        return "분류 불가"
     
     def get_dataset_info(self) -> Dict:
         """데이터셋 정보 반환 (허깅페이스 + 큐레이티드 통합)"""
@@ -1,10 +1,596 @@
+import io
+import sys
+import copy
+import time
+import functools
+import itertools
+import threading
+import concurrent.futures
 import requests
 import json
 import xmltodict
+import asyncio
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from datetime import datetime
+from types import MappingProxyType
 import urllib.parse
 import re
+from xml.etree.ElementTree import iterparse as _et_iterparse
+
+import logging
+
+# 지연 포매팅 로거 — 레벨이 꺼져 있으면 메시지 조립 비용조차 없음
+logger = logging.getLogger(__name__)
+
+# lxml: C 기반 iterparse 백엔드 (설치되어 있으면 목록 추출 기본값)
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+# aiohttp: 비동기 HTTP 클라이언트 (선택 의존성, 동시 다발 조회용)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# ijson: 증분 JSON 파서 (선택 의존성, 대용량 응답에서 필요한 앞부분만 파싱)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pyahocorasick: 다중 패턴 매칭 자동자 (선택 의존성)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# OpenAI 래퍼 — 모듈 로드 시 1회 임포트 (호출마다 sys.modules 조회 방지)
+try:
+    from .openai_api import OpenAIAPI as _OpenAIAPI
+except Exception:
+    _OpenAIAPI = None
+
+def _ttl_cached(ttl: int = 600, maxsize: int = 1024):
+    """
+    TTL + LRU 응답 캐시 데코레이터 (네트워크 메서드용)
+
+    스크롤/재시도/중복 질의 시 동일 요청의 RTT를 제거한다. 만료 시각과
+    값을 OrderedDict에 저장하고 move_to_end로 LRU 순서를 유지하며,
+    maxsize 초과 시 가장 오래 쓰이지 않은 항목부터 밀어낸다.
+
+    반환값은 항상 deepcopy된 사본이다 — LawAPI는 세션 간 공유되는
+    싱글턴이므로, 호출부가 결과 dict를 수정해도(예: similarity 주입)
+    캐시에 저장된 원본과 다른 세션의 응답은 오염되지 않는다.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (id(self), args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    expiry, value = entry
+                    if expiry > now:
+                        cache.move_to_end(key)
+                        return copy.deepcopy(value)
+                    del cache[key]
+
+            value = func(self, *args, **kwargs)
+
+            with lock:
+                cache[key] = (now + ttl, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return copy.deepcopy(value)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+# 사건부호 목록 — 긴 부호 우선 정렬 ('고합'이 '고'보다 먼저 매칭되도록)
+_CASE_TYPES = sorted(
+    ['도', '바', '노', '마', '차', '러', '허', '므', '두', '후', '고합', '고단',
+     '초기', '재', '전', '누', '구', '나', '가', '재나', '재차', '재허', '재므',
+     '재두', '재후', '합', '단', '기', '전합', '전단', '전기', '누합', '누단',
+     '누기', '구합', '구단', '구기', '나합', '나단', '나기', '가합', '가단',
+     '가기'],
+    key=len, reverse=True
+)
+
+# 사건번호 패턴 — 모듈 로드 시 한 번만 컴파일 (호출마다 재컴파일 방지)
+_CASE_RE = re.compile(
+    r'^(\d{4})(' + '|'.join(map(re.escape, _CASE_TYPES)) + r')(\d+)$'
+)
+
+# 사건부호 → 사건 유형 이름 매핑
+_CASE_TYPE_NAME_MAP = MappingProxyType({
+    '도': '형사',
+    '바': '행정',
+    '노': '민사',
+    '마': '가사',
+    '고합': '형사(합의)',
+    '고단': '형사(단독)',
+    '합': '합의부',
+    '단': '단독',
+    '재': '재심',
+    '전': '전원합의체'
+})
+
+# 법률 조항 인용 패턴 (예: "형법 제243조", "정보통신망법 제44조의7조")
+_LAW_ARTICLE_RE = re.compile(r'^(.+?)\s*제(\d+(?:의\d+)?)조$')
+
+# 사건번호 인용에 허용되는 법원명 접두사
+_COURT_PREFIXES = ('대법원', '고등법원', '지방법원')
+
+# 량형 추출 패턴 (징역/벌금)
+_IMPRISONMENT_RE = re.compile(r'징역\s*(\d+)년\s*(\d+)월?')
+_FINE_RE = re.compile(r'벌금\s*(\d+)만원')
+
+# LLM 응답에서 첫 JSON 객체만 잘라 파싱할 때 재사용하는 디코더
+_JSON_DECODER = json.JSONDecoder()
+
+# 추출 필드 매핑 (출력 키, XML 태그) — 문자열을 인턴해 두면 레코드마다
+# 같은 키 객체가 재사용되어 dict 구성 시 해시 재계산이 사라진다
+_PREC_FIELD_MAP = tuple(
+    (sys.intern(out), sys.intern(src)) for out, src in (
+        ('title', '판례명'), ('case_number', '사건번호'), ('court', '법원명'),
+        ('date', '선고일자'), ('summary', '요약'), ('full_text', '전문'),
+        ('law_provisions', '관련조문'), ('keywords', '키워드'),
+        ('sentence', '선고형량'), ('compensation', '위자료')
+    )
+)
+_STATUTE_FIELD_MAP = tuple(
+    (sys.intern(out), sys.intern(src)) for out, src in (
+        ('title', '법령명'), ('law_number', '법령번호'),
+        ('enactment_date', '제정일자'), ('revision_date', '개정일자'),
+        ('content', '조문내용'), ('category', '분야')
+    )
+)
+
+
+def _build_trie(codes) -> Dict:
+    """사건부호 접두사 트라이 구성 (문자 단위 중첩 딕셔너리, 단말은 '' 키)"""
+    root = {}
+    for code in codes:
+        node = root
+        for ch in code:
+            node = node.setdefault(ch, {})
+        node[''] = code
+    return root
+
+
+# 사건부호 트라이 — 정규식 없이 O(부호 길이)로 최장 일치 탐색
+_TYPE_TRIE = _build_trie(_CASE_TYPE_NAME_MAP.keys())
+
+# 전체 사건부호 트라이 (인용 검증용)
+_CASE_CODE_TRIE = _build_trie(_CASE_TYPES)
+
+
+def _match_citation_case(citation: str) -> Optional[tuple]:
+    """
+    사건번호 인용 수작업 매처 (예: "대법원 2019도11772")
+
+    앵커된 유한 패턴이라 정규식 엔진 대신 문자 비교 루프 + 사건부호
+    트라이 최장 일치로 직접 스캔한다. 백트래킹과 매치 객체 할당이 없어
+    re 경유보다 훨씬 싸고, 불일치 시 조기 반환된다.
+
+    Returns:
+        (법원명 또는 None, 연도, 사건부호, 일련번호) 또는 None
+    """
+    n = len(citation)
+    court = None
+    i = 0
+
+    # 선택적 법원명 접두사
+    for prefix in _COURT_PREFIXES:
+        if citation.startswith(prefix):
+            court = prefix
+            i = len(prefix)
+            break
+
+    # 공백 건너뛰기
+    while i < n and citation[i].isspace():
+        i += 1
+
+    # 연도 4자리
+    year = citation[i:i + 4]
+    if len(year) != 4 or not year.isdigit():
+        return None
+    i += 4
+
+    # 사건부호 — 트라이 최장 일치
+    node = _CASE_CODE_TRIE
+    code = None
+    end = i
+    j = i
+    while j < n:
+        node = node.get(citation[j])
+        if node is None:
+            break
+        j += 1
+        if '' in node:
+            code = node['']
+            end = j
+    if code is None:
+        return None
+
+    # 나머지는 전부 일련번호 숫자여야 한다
+    num = citation[end:]
+    if not num or not num.isdigit():
+        return None
+
+    return court, year, code, num
+
+# 내장 법률 조항/샘플 판례 데이터 — 호출마다 리터럴을 재구성하지 않도록
+# 모듈 로드 시 1회 구성하고 읽기 전용 뷰로 공유
+_LAW_ALIASES = MappingProxyType({
+    "정통법": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
+    "정보통신망법": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
+    "개보법": "개인정보보호법",
+    "개인정보법": "개인정보보호법"
+})
+
+_LAW_ARTICLES = MappingProxyType({
+    "형법": {
+        "243": {
+            "title": "음화반포등",
+            "content": "음란한 문서, 도화, 필름 기타 물건을 반포, 판매 또는 임대하거나 공연히 전시 또는 상영한 자는 1년 이하의 징역 또는 500만원 이하의 벌금에 처한다.",
+            "law_number": "형법 제243조",
+            "category": "사회에 대한 죄",
+            "subcategory": "성풍속에 관한 죄"
+        },
+        "347": {
+            "title": "사기",
+            "content": "사람을 기망하여 재물의 교부를 받거나 재산상의 이익을 취득한 자는 10년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
+            "law_number": "형법 제347조", 
+            "category": "재산에 대한 죄",
+            "subcategory": "사기와 공갈의 죄"
+        },
+        "1": {
+            "title": "범죄의 성립과 처벌",
+            "content": "죄형법정주의에 따라 법률이 정하지 아니하면 범죄가 되지 아니하고 형벌을 과하지 아니한다.",
+            "law_number": "형법 제1조",
+            "category": "통칙",
+            "subcategory": "기본원칙"
+        }
+    },
+    "민법": {
+        "750": {
+            "title": "불법행위의 내용",
+            "content": "고의 또는 과실로 인한 위법행위로 타인에게 손해를 가한 자는 그 손해를 배상할 책임이 있다.",
+            "law_number": "민법 제750조",
+            "category": "채권",
+            "subcategory": "불법행위로 인한 채권"
+        },
+        "751": {
+            "title": "재산 이외의 손해의 배상",
+            "content": "타인의 신체, 자유 또는 인격권을 침해한 경우에는 재산 이외의 손해에 대하여도 배상할 책임이 있다.",
+            "law_number": "민법 제751조",
+            "category": "채권",
+            "subcategory": "불법행위로 인한 채권"
+        },
+        "1": {
+            "title": "권리능력의 시기",
+            "content": "사람은 생존하는 동안 권리와 의무의 주체가 된다.",
+            "law_number": "민법 제1조",
+            "category": "일반규정",
+            "subcategory": "기본원칙"
+        }
+    },
+    "정보통신망 이용촉진 및 정보보호 등에 관한 법률": {
+        "44의7": {
+            "title": "불법정보의 유통금지 등",
+            "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다. 이 법을 위반하여 불법정보를 유통한 자는 2년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
+            "law_number": "정보통신망 이용촉진 및 정보보호 등에 관한 법률 제44조의7",
+            "category": "정보통신망 관련 특별법",
+            "subcategory": "불법정보 유통 금지"
+        }
+    },
+    "정보통신망법": {
+        "44의7": {
+            "title": "불법정보의 유통금지 등",
+            "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다. 이 법을 위반하여 불법정보를 유통한 자는 2년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
+            "law_number": "정보통신망법 제44조의7",
+            "category": "정보통신망 관련 특별법",
+            "subcategory": "불법정보 유통 금지"
+        }
+    },
+    "개인정보보호법": {
+        "71": {
+            "title": "벌칙",
+            "content": "다음 각 호의 어느 하나에 해당하는 자는 5년 이하의 징역 또는 5천만원 이하의 벌금에 처한다.",
+            "law_number": "개인정보보호법 제71조",
+            "category": "개인정보보호",
+            "subcategory": "벌칙"
+        }
+    },
+    "상법": {
+        "1": {
+            "title": "상법의 적용범위",
+            "content": "상인의 영업에 관하여는 다른 법률에 특별한 규정이 있는 경우를 제외하고는 이 법이 정하는 바에 의한다.",
+            "law_number": "상법 제1조",
+            "category": "총칙",
+            "subcategory": "기본원칙"
+        }
+    }
+})
+
+_SAMPLE_CASES = MappingProxyType({
+    "2019도11772": {
+        "exists": True,
+        "title": "음란물 유포죄 관련 판례",
+        "court": "대법원",
+        "date": "2019-12-26",
+        "case_type": "형사",
+        "summary": "정보통신망을 이용하여 음란물을 유포한 행위에 대한 처벌 기준을 명확히 한 판례",
+        "main_issue": "음란물 유포의 구성요건과 처벌 기준",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제243조", "정보통신망 이용촉진 및 정보보호 등에 관한 법률"],
+        "keywords": ["음란물", "유포", "정보통신망", "형법 제243조"]
+    },
+    "2020도5432": {
+        "exists": True,
+        "title": "전자상거래 사기 판례",
+        "court": "대법원",
+        "date": "2020-03-15",
+        "case_type": "형사",
+        "summary": "온라인 쇼핑몰을 통한 사기 행위의 법적 판단 기준",
+        "main_issue": "전자상거래에서의 사기 구성요건",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제347조"],
+        "keywords": ["사기", "전자상거래", "온라인"]
+    },
+    "2021도3456": {
+        "exists": True,
+        "title": "해킹 관련 판례",
+        "court": "대법원",
+        "date": "2021-06-20",
+        "case_type": "형사",
+        "summary": "타인의 컴퓨터 시스템에 무단으로 접근하여 정보를 빼낸 행위에 대한 법적 판단",
+        "main_issue": "해킹 행위의 구성요건과 처벌 수준",
+        "verdict": "유죄",
+        "applicable_law": ["정보통신망법 제48조", "형법 제347조의2"],
+        "keywords": ["해킹", "무단접근", "정보통신망", "컴퓨터범죄"]
+    },
+    "2018도9876": {
+        "exists": True,
+        "title": "스토킹 처벌 판례",
+        "court": "대법원",
+        "date": "2018-11-10",
+        "case_type": "형사",
+        "summary": "지속적인 접근 및 괴롭힘 행위에 대한 처벌 기준",
+        "main_issue": "스토킹 행위의 범위와 처벌 수준",
+        "verdict": "유죄",
+        "applicable_law": ["스토킹범죄의 처벌 등에 관한 법률"],
+        "keywords": ["스토킹", "괴롭힘", "접근금지", "특별법"]
+    },
+    "2022고합57": {
+        "exists": True,
+        "title": "특수강도 사건",
+        "court": "서울중앙지방법원",
+        "date": "2022-07-07",
+        "case_type": "형사",
+        "summary": "야간에 주거지에 침입하여 폭력을 행사하고 금품을 갈취한 특수강도 사건",
+        "main_issue": "특수강도죄의 구성요건 및 형량 결정",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제334조", "형법 제335조"],
+        "keywords": ["특수강도", "주거침입", "폭력", "금품갈취"]
+    },
+    "2022고단1234": {
+        "exists": True,
+        "title": "사기 사건",
+        "court": "대전지방법원",
+        "date": "2022-08-15",
+        "case_type": "형사",
+        "summary": "가상화폐 투자를 빙자한 다단계 사기 사건",
+        "main_issue": "가상화폐 관련 사기죄의 적용",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제347조", "방문판매법"],
+        "keywords": ["사기", "가상화폐", "다단계", "투자"]
+    },
+    "2022고합144": {
+        "exists": True,
+        "title": "성폭력 사건",
+        "court": "수원지방법원",
+        "date": "2022-12-23",
+        "case_type": "형사",
+        "summary": "직장 내 성폭력 사건에 대한 법적 판단",
+        "main_issue": "직장 내 성폭력의 처벌 기준",
+        "verdict": "유죄",
+        "applicable_law": ["성폭력처벌법", "형법 제297조"],
+        "keywords": ["성폭력", "직장", "처벌", "피해자보호"]
+    },
+    "2022고합600": {
+        "exists": True,
+        "title": "마약 사건",
+        "court": "서울중앙지방법원",
+        "date": "2022-11-15",
+        "case_type": "형사",
+        "summary": "대량 마약 유통 및 판매 사건",
+        "main_issue": "마약 판매의 처벌 수준 및 몰수·추징",
+        "verdict": "유죄",
+        "applicable_law": ["마약류 관리에 관한 법률"],
+        "keywords": ["마약", "유통", "판매", "몰수추징"]
+    },
+    "2022고합660": {
+        "exists": True,
+        "title": "특수절도 사건",
+        "court": "서울중앙지방법원",
+        "date": "2024-11-15",
+        "case_type": "형사",
+        "summary": "차량 절도 및 연쇄 절도 사건",
+        "main_issue": "특수절도죄의 구성요건 및 상습성",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제331조", "형법 제332조"],
+        "keywords": ["특수절도", "차량절도", "상습", "연쇄범죄"]
+    },
+    "2022고합3692": {
+        "exists": True,
+        "title": "횡령 사건",
+        "court": "서울남부지방법원",
+        "date": "2024-05-16",
+        "case_type": "형사",
+        "summary": "회사 자금 횡령 및 배임 사건",
+        "main_issue": "횡령죄와 배임죄의 구별 및 처벌",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제355조", "형법 제356조"],
+        "keywords": ["횡령", "배임", "회사자금", "업무상배임"]
+    },
+    "2023고합88": {
+        "exists": True,
+        "title": "살인 사건",
+        "court": "광주지방법원",
+        "date": "2023-09-12",
+        "case_type": "형사",
+        "summary": "동거인 살해 사건",
+        "main_issue": "살인죄의 구성요건 및 정당방위 여부",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제250조"],
+        "keywords": ["살인", "동거인", "정당방위", "고의"]
+    },
+    "2021고합456": {
+        "exists": True,
+        "title": "방화 사건",
+        "court": "부산지방법원",
+        "date": "2021-10-08",
+        "case_type": "형사",
+        "summary": "아파트 방화 사건",
+        "main_issue": "현주건조물 방화죄의 적용",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제164조"],
+        "keywords": ["방화", "현주건조물", "아파트", "위험"]
+    },
+    "2020고합789": {
+        "exists": True,
+        "title": "뇌물 사건",
+        "court": "대구지방법원",
+        "date": "2020-12-18",
+        "case_type": "형사",
+        "summary": "공무원 뇌물 수수 사건",
+        "main_issue": "뇌물죄의 구성요건 및 처벌",
+        "verdict": "유죄",
+        "applicable_law": ["형법 제129조", "형법 제130조"],
+        "keywords": ["뇌물", "공무원", "수수", "직무관련"]
+    }
+})
+
+# 법률 조항별 관련 법령 매핑 — 호출마다 중첩 딕셔너리를 재할당하지 않도록
+# 모듈 로드 시 1회 구성 (값은 튜플이라 원본이 변형되지 않는다)
+_RELATED_LAWS = MappingProxyType({
+    "형법 제243조": (
+        {
+            "law_name": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
+            "article": "44조의7",
+            "title": "불법정보의 유통금지 등",
+            "relation": "온라인 음란물 유포 시 적용되는 특별법"
+        },
+        {
+            "law_name": "형법",
+            "article": "244조",
+            "title": "음화제조등",
+            "relation": "음란물 제조 관련 조항"
+        }
+    ),
+    "형법 제347조": (
+        {
+            "law_name": "형법",
+            "article": "350조",
+            "title": "공갈",
+            "relation": "재산범죄 관련 조항"
+        },
+        {
+            "law_name": "전자상거래 등에서의 소비자보호에 관한 법률",
+            "article": "21조",
+            "title": "금지행위",
+            "relation": "전자상거래 사기 관련 특별법"
+        }
+    )
+})
+
+# 키워드 검색용 샘플 법률 데이터 — 호출마다 재구성하던 리터럴을 1회 구성
+_LAWS_DATA = (
+    {
+        "law_name": "형법",
+        "article": "243",
+        "title": "음화반포등",
+        "content": "음란한 문서, 도화, 필름 기타 물건을 반포, 판매 또는 임대하거나 공연히 전시 또는 상영한 자는 1년 이하의 징역 또는 500만원 이하의 벌금에 처한다.",
+        "type": "criminal",
+        "keywords": ["음란물", "유포", "반포", "판매", "임대", "전시", "상영"]
+    },
+    {
+        "law_name": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
+        "article": "44조의7",
+        "title": "불법정보의 유통금지 등",
+        "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다.",
+        "type": "administrative",
+        "keywords": ["정보통신망", "음란정보", "유통금지", "인터넷"]
+    },
+    {
+        "law_name": "형법",
+        "article": "347",
+        "title": "사기",
+        "content": "사람을 기망하여 재물의 교부를 받거나 재산상의 이익을 취득한 자는 10년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
+        "type": "criminal",
+        "keywords": ["사기", "기망", "재물", "교부", "재산상 이익"]
+    }
+)
+
+
+def _build_law_search_index():
+    """법률 검색 인덱스 구성 (유형별 인덱스 + 키워드 역색인 + SoA 컬럼)
+
+    소문자 캐시는 레코드별 튜플(AoS)이 아니라 필드별 평행 튜플(SoA)로
+    구성해 스캔 시 컬럼 단위의 연속 접근이 되게 한다. 원본 레코드는
+    건드리지 않으므로 검색 결과 dict에 내부 필드가 섞이지 않는다.
+    """
+    by_type = {}
+    keyword_index = {}
+    content_lower = []
+    title_lower = []
+    keywords_lower = []
+    for idx, law in enumerate(_LAWS_DATA):
+        by_type.setdefault(law["type"], []).append(idx)
+        content_lower.append(law["content"].lower())
+        title_lower.append(law["title"].lower())
+        keywords_lower.append(tuple(kw.lower() for kw in law["keywords"]))
+        for kw in law["keywords"]:
+            keyword_index.setdefault(kw.lower(), set()).add(idx)
+    return (by_type, keyword_index,
+            tuple(content_lower), tuple(title_lower), tuple(keywords_lower))
+
+
+# 모듈 로드 시 1회 구성 — 질의마다의 .lower() 할당과 선형 탐색을 대체
+(_LAWS_BY_TYPE, _LAW_KEYWORD_INDEX,
+ _LAW_CONTENT_LOWER, _LAW_TITLE_LOWER, _LAW_KEYWORDS_LOWER) = _build_law_search_index()
+
+
+def _build_keyword_automaton():
+    """법률 키워드 Aho-Corasick 자동자 구성
+
+    여러 단어로 된 질의문 안에 등장하는 모든 법률 키워드를 질의 길이에
+    비례하는 단일 패스로 찾는다. pyahocorasick 미설치 시 None.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw_lower, law_ids in _LAW_KEYWORD_INDEX.items():
+        automaton.add_word(kw_lower, law_ids)
+    automaton.make_automaton()
+    return automaton
+
+
+_LAW_KEYWORD_AC = _build_keyword_automaton()
 
 from utils.legal_data_processor import LegalDataProcessor
 from setup_vector_db import AdvancedLegalVectorDB
@@ -14,7 +600,7 @@ try:
     from config import Config
     CONFIG_AVAILABLE = True
 except Exception as e:
-    print(f"⚠️ Config 모듈 로딩 오류: {e}")
+    logger.error("⚠️ Config 모듈 로딩 오류: %s", e)
     CONFIG_AVAILABLE = False
     
     # Fallback 설정값들
@@ -63,7 +649,7 @@ class LawAPI:
                 self.kakao_api_key = None
                 
         except Exception as e:
-            print(f"⚠️ API 설정 초기화 오류: {e} - 기본값 사용")
+            logger.error("⚠️ API 설정 초기화 오류: %s - 기본값 사용", e)
             # 기본값 설정
             self.law_oc_code = "guest"
             self.law_api_url = "http://www.law.go.kr/DRF/lawSearch.do"
@@ -79,9 +665,45 @@ class LawAPI:
         self.session.headers.update({
             'User-Agent': 'LawMatchAgent/1.0 (https://github.com/user/law-match-agent)',
             'Accept': 'application/json, application/xml, text/plain, */*',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            'Connection': 'keep-alive'
         })
+
+        # 커넥션 풀 확장 + GET 재시도 (keep-alive 재사용으로 TLS 핸드셰이크 절감)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+            max_retries=requests.adapters.Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 고정 파라미터를 미리 인코딩한 URL 템플릿
+        # (호출마다 params dict → 쿼리스트링 재인코딩 생략, query/display만 덧붙임)
+        oc_quoted = urllib.parse.quote(str(self.law_oc_code))
+        self._prec_url_base = f"{self.base_url}?OC={oc_quoted}&target=prec&type=XML"
+        self._law_url_base = f"{self.base_url}?OC={oc_quoted}&target=law&type=XML"
         
+        # 비동기 HTTP 세션 (이벤트 루프 안에서 지연 생성)
+        self.async_session = None
+
+        # 동일 키 동시 요청 합치기 (중복 HTTP 요청 방지)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._async_inflight = {}
+
+        # 동기 호출자용 스레드 풀 (requests는 소켓 I/O 중 GIL을 놓으므로
+        # 네트워크 바운드 조회는 스레드로 선형 확장)
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=16, thread_name_prefix='LawAPI'
+        )
+
         # 고급 벡터 데이터베이스 초기화
         self.vector_db = None
         self._init_vector_db()
@@ -96,14 +718,15 @@ class LawAPI:
             
             # 기존 인덱스 로드 시도
             if self.vector_db.load_index() and self.vector_db.load_metadata():
-                print("벡터 데이터베이스 로드 성공")
+                logger.info("벡터 데이터베이스 로드 성공")
             else:
-                print("벡터 데이터베이스를 찾을 수 없음. setup_vector_db.py를 실행하세요.")
+                logger.warning("벡터 데이터베이스를 찾을 수 없음. setup_vector_db.py를 실행하세요.")
                 
         except Exception as e:
-            print(f"벡터 데이터베이스 초기화 실패: {e}")
+            logger.error("벡터 데이터베이스 초기화 실패: %s", e)
             self.vector_db = None
     
+    @_ttl_cached(ttl=600)
     def search_precedents(self, query: str, limit: int = 10) -> List[Dict]:
         """
         판례 검색 메서드
@@ -116,67 +739,173 @@ class LawAPI:
             판례 검색 결과 리스트
         """
         try:
-            # 국가법령정보센터 판례 API 호출
-            params = {
-                'OC': self.law_oc_code,
-                'target': 'prec',
-                'query': query,
-                'display': str(limit),
-                'type': 'XML'
-            }
-            
-            response = self.session.get(self.base_url, params=params)
-            response.raise_for_status()
-            
-            # XML을 딕셔너리로 변환
-            xml_data = xmltodict.parse(response.text)
-            
-            # 판례 데이터 추출
-            precedents = self._extract_precedents(xml_data)
-            
+            # 국가법령정보센터 판례 API 호출 (사전 인코딩된 URL 템플릿)
+            url = (f"{self._prec_url_base}&display={limit}"
+                   f"&query={urllib.parse.quote(query)}")
+
+            # 스트리밍 응답: 수신과 파싱을 겹치고 전체 트리 생성을 생략
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                precedents = self._stream_precedents(response.raw)
+
             return precedents
             
         except requests.exceptions.RequestException as e:
-            print(f"API 요청 오류: {e}")
+            logger.error("API 요청 오류: %s", e)
             return []
         except Exception as e:
-            print(f"판례 검색 오류: {e}")
+            logger.error("판례 검색 오류: %s", e)
             return []
     
+    @staticmethod
+    def _parse_xml(xml_bytes: bytes) -> Dict:
+        """
+        XML 응답 바이트를 딕셔너리로 변환 (모든 추출 경로 공용)
+
+        바이트를 그대로 넘겨 Expat이 선언된 인코딩으로 C 레벨에서 한 번만
+        디코딩하게 한다 (.text 경유 시 requests의 문자셋 추정 + 재디코딩 비용).
+        """
+        return xmltodict.parse(
+            xml_bytes, process_namespaces=False, dict_constructor=dict
+        )
+
+    @staticmethod
+    def _prec_record(prec: Dict) -> Dict:
+        """판례 XML 노드 하나를 결과 딕셔너리로 변환 (필드 맵 기반)"""
+        return {out: prec.get(src, '') for out, src in _PREC_FIELD_MAP}
+
+    @staticmethod
+    def _statute_record(law: Dict) -> Dict:
+        """법령 XML 노드 하나를 결과 딕셔너리로 변환 (필드 맵 기반)"""
+        return {out: law.get(src, '') for out, src in _STATUTE_FIELD_MAP}
+
+    @classmethod
+    def _stream_records(cls, source, record_tag: str, builder) -> List[Dict]:
+        """
+        스트리밍 XML 추출 (트리 전체를 메모리에 올리지 않음)
+
+        item_depth=2로 <prec>/<law> 노드가 닫힐 때마다 콜백이 호출되어
+        최대 메모리가 전체 응답이 아닌 레코드 1건 크기로 유지된다.
+        source가 응답 스트림이면 네트워크 수신과 파싱이 겹쳐서 진행된다.
+        """
+        records = []
+
+        def _on_item(path, item):
+            if path and path[-1][0] == record_tag and isinstance(item, dict):
+                records.append(builder(item))
+            return True
+
+        xmltodict.parse(source, item_depth=2, item_callback=_on_item,
+                        process_namespaces=False, dict_constructor=dict)
+        return records
+
+    # lxml/ElementTree 추출용 — 모듈 수준 필드 맵을 그대로 공유
+    _PREC_FIELDS = _PREC_FIELD_MAP
+    _STATUTE_FIELDS = _STATUTE_FIELD_MAP
+
+    @staticmethod
+    def _xml_backend() -> str:
+        """
+        목록 추출 백엔드 선택
+
+        Config.XML_BACKEND('lxml'|'etree'|'xmltodict')가 있으면 그대로,
+        Config.XML_FAST_PATH=False면 xmltodict로 강제, 아니면 lxml →
+        표준 라이브러리 ElementTree 순으로 빠른 경로를 쓴다.
+        """
+        backend = getattr(Config, 'XML_BACKEND', None)
+        if backend in ('lxml', 'etree', 'xmltodict'):
+            return backend
+        if not getattr(Config, 'XML_FAST_PATH', True):
+            return 'xmltodict'
+        return 'lxml' if _lxml_etree is not None else 'etree'
+
+    @staticmethod
+    def _extract_records_et(source, record_tag: str, fields) -> List[Dict]:
+        """
+        표준 라이브러리 ElementTree iterparse 기반 목록 추출
+
+        스키마가 고정·얕은 목록 응답에서 중간 딕셔너리 트리 없이 바로
+        결과 딕셔너리를 만든다. 추가 의존성 없이 C 구현 경로를 탄다.
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+
+        records = []
+        for _, elem in _et_iterparse(source, events=('end',)):
+            if elem.tag == record_tag:
+                records.append({out: (elem.findtext(src) or '') for out, src in fields})
+                elem.clear()
+        return records
+
+    @staticmethod
+    def _extract_records_lxml(source, record_tag: str, fields) -> List[Dict]:
+        """
+        lxml iterparse 기반 목록 추출
+
+        고정 스키마만 읽으므로 중간 딕셔너리 트리를 만들지 않고, 레코드를
+        읽는 즉시 elem.clear()와 선행 형제 제거로 메모리를 바로 반환한다.
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+
+        records = []
+        for _, elem in _lxml_etree.iterparse(source, tag=record_tag, events=('end',)):
+            records.append({out: (elem.findtext(src) or '') for out, src in fields})
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return records
+
+    def _stream_precedents(self, source) -> List[Dict]:
+        """판례 목록 스트리밍 추출"""
+        try:
+            backend = self._xml_backend()
+            if backend == 'lxml':
+                return self._extract_records_lxml(source, 'prec', self._PREC_FIELDS)
+            if backend == 'etree':
+                return self._extract_records_et(source, 'prec', self._PREC_FIELDS)
+            return self._stream_records(source, 'prec', self._prec_record)
+        except Exception as e:
+            logger.error("판례 데이터 추출 오류: %s", e)
+            return []
+
+    def _stream_statutes(self, source) -> List[Dict]:
+        """법령 목록 스트리밍 추출"""
+        try:
+            backend = self._xml_backend()
+            if backend == 'lxml':
+                return self._extract_records_lxml(source, 'law', self._STATUTE_FIELDS)
+            if backend == 'etree':
+                return self._extract_records_et(source, 'law', self._STATUTE_FIELDS)
+            return self._stream_records(source, 'law', self._statute_record)
+        except Exception as e:
+            logger.error("법령 데이터 추출 오류: %s", e)
+            return []
+
     def _extract_precedents(self, xml_data: Dict) -> List[Dict]:
         """XML 데이터에서 판례 정보 추출"""
         try:
             precedents = []
-            
+
             # XML 구조에 따라 판례 정보 추출
             if 'PrecService' in xml_data:
                 prec_list = xml_data['PrecService'].get('prec', [])
-                
+
                 # 단일 결과인 경우 리스트로 변환
                 if not isinstance(prec_list, list):
                     prec_list = [prec_list]
-                
+
                 for prec in prec_list:
-                    precedent = {
-                        'title': prec.get('판례명', ''),
-                        'case_number': prec.get('사건번호', ''),
-                        'court': prec.get('법원명', ''),
-                        'date': prec.get('선고일자', ''),
-                        'summary': prec.get('요약', ''),
-                        'full_text': prec.get('전문', ''),
-                        'law_provisions': prec.get('관련조문', ''),
-                        'keywords': prec.get('키워드', ''),
-                        'sentence': prec.get('선고형량', ''),
-                        'compensation': prec.get('위자료', '')
-                    }
-                    precedents.append(precedent)
-            
+                    precedents.append(self._prec_record(prec))
+
             return precedents
-            
+
         except Exception as e:
-            print(f"판례 데이터 추출 오류: {e}")
+            logger.error("판례 데이터 추출 오류: %s", e)
             return []
     
+    @_ttl_cached(ttl=600)
     def search_statutes(self, query: str) -> List[Dict]:
         """
         법령 검색 메서드
@@ -188,24 +917,19 @@ class LawAPI:
             법령 검색 결과 리스트
         """
         try:
-            params = {
-                'OC': self.law_oc_code,
-                'target': 'law',
-                'query': query,
-                'display': '20',
-                'type': 'XML'
-            }
-            
-            response = self.session.get(self.base_url, params=params)
-            response.raise_for_status()
-            
-            xml_data = xmltodict.parse(response.text)
-            statutes = self._extract_statutes(xml_data)
-            
+            url = (f"{self._law_url_base}&display=20"
+                   f"&query={urllib.parse.quote(query)}")
+
+            # 스트리밍 응답: 수신과 파싱을 겹치고 전체 트리 생성을 생략
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                statutes = self._stream_statutes(response.raw)
+
             return statutes
             
         except Exception as e:
-            print(f"법령 검색 오류: {e}")
+            logger.error("법령 검색 오류: %s", e)
             return []
     
     def _extract_statutes(self, xml_data: Dict) -> List[Dict]:
@@ -220,32 +944,200 @@ class LawAPI:
                     law_list = [law_list]
                 
                 for law in law_list:
-                    statute = {
-                        'title': law.get('법령명', ''),
-                        'law_number': law.get('법령번호', ''),
-                        'enactment_date': law.get('제정일자', ''),
-                        'revision_date': law.get('개정일자', ''),
-                        'content': law.get('조문내용', ''),
-                        'category': law.get('분야', '')
-                    }
-                    statutes.append(statute)
+                    statutes.append(self._statute_record(law))
             
             return statutes
             
         except Exception as e:
-            print(f"법령 데이터 추출 오류: {e}")
+            logger.error("법령 데이터 추출 오류: %s", e)
             return []
     
+    def _coalesce(self, key: str, fetch):
+        """
+        동일 키의 동시 요청 합치기 (DataLoader 방식)
+
+        같은 키로 이미 진행 중인 요청이 있으면 새 HTTP 요청을 보내는
+        대신 해당 결과를 기다려 공유한다. 첫 호출자만 네트워크를 탄다.
+        """
+        with self._inflight_lock:
+            entry = self._inflight.get(key)
+            if entry is None:
+                entry = {'event': threading.Event(), 'result': None}
+                self._inflight[key] = entry
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            entry['event'].wait()
+            return entry['result']
+
+        try:
+            entry['result'] = fetch()
+            return entry['result']
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            entry['event'].set()
+
+    @_ttl_cached(ttl=600)
     def get_case_details(self, case_number: str) -> Optional[Dict]:
         """
-        특정 판례의 상세 정보 조회
-        
+        특정 판례의 상세 정보 조회 (동시 중복 조회는 한 요청으로 합침)
+
         Args:
             case_number: 사건번호
-            
+
         Returns:
             판례 상세 정보
         """
+        return self._coalesce(
+            f"prec:{case_number}",
+            lambda: self._fetch_case_details(case_number)
+        )
+
+    def _fetch_case_details(self, case_number: str) -> Optional[Dict]:
+        """판례 상세 정보 실제 조회"""
+        try:
+            url = (f"{self._prec_url_base}&display=1"
+                   f"&query={urllib.parse.quote(case_number)}")
+
+            response = self.session.get(url)
+            response.raise_for_status()
+
+            xml_data = self._parse_xml(response.content)
+            precedents = self._extract_precedents(xml_data)
+            
+            return precedents[0] if precedents else None
+            
+        except Exception as e:
+            logger.error("판례 상세 정보 조회 오류: %s", e)
+            return None
+    
+    def get_case_details_bulk(self, case_numbers: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        여러 사건번호의 상세 정보를 한 번의 요청으로 조회
+
+        사건번호들을 '|'로 결합한 단일 목록 질의를 보내고 응답의
+        사건번호를 입력과 대조한다 (N회 왕복 → 1회). 질의에서 빠진
+        번호는 비동기 경로가 있으면 동시 조회로, 없으면 개별 조회로
+        보충한다.
+        """
+        if not case_numbers:
+            return {}
+
+        details = {cn: None for cn in case_numbers}
+
+        try:
+            url = (f"{self._prec_url_base}&display={len(case_numbers)}"
+                   f"&query={urllib.parse.quote('|'.join(case_numbers))}")
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                precedents = self._stream_precedents(response.raw)
+
+            for prec in precedents:
+                cn = prec.get('case_number', '')
+                if cn in details and details[cn] is None:
+                    details[cn] = prec
+
+        except Exception as e:
+            logger.error("판례 일괄 조회 오류: %s", e)
+
+        # 일괄 질의로 못 찾은 번호 보충 조회
+        missing = [cn for cn, v in details.items() if v is None]
+        if missing:
+            if aiohttp is not None:
+                results = self.gather_all(
+                    [self.get_case_details_async(cn) for cn in missing]
+                )
+                for cn, result in zip(missing, results):
+                    if isinstance(result, dict):
+                        details[cn] = result
+            else:
+                for cn in missing:
+                    details[cn] = self.get_case_details(cn)
+
+        return details
+
+    async def _ensure_async_session(self):
+        """비동기 세션 지연 생성 (keep-alive 커넥션 풀 공유)"""
+        if aiohttp is None:
+            raise RuntimeError("aiohttp가 설치되어 있지 않습니다.")
+
+        if self.async_session is None or self.async_session.closed:
+            self.async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                headers=dict(self.session.headers)
+            )
+        return self.async_session
+
+    async def _close_async_session(self):
+        """비동기 세션 정리 (이벤트 루프 종료 전에 호출)"""
+        if self.async_session is not None and not self.async_session.closed:
+            await self.async_session.close()
+        self.async_session = None
+
+    async def _get_bytes_async(self, url: str, params: Dict = None) -> bytes:
+        """비동기 GET 요청 후 본문 바이트 반환"""
+        session = await self._ensure_async_session()
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with session.get(url, params=params, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def search_precedents_async(self, query: str, limit: int = 10) -> List[Dict]:
+        """판례 검색 비동기 변형 (동시 다발 조회용)"""
+        try:
+            params = {
+                'OC': self.law_oc_code,
+                'target': 'prec',
+                'query': query,
+                'display': str(limit),
+                'type': 'XML'
+            }
+            body = await self._get_bytes_async(self.base_url, params)
+            return self._stream_precedents(body)
+        except Exception as e:
+            logger.error("판례 비동기 검색 오류: %s", e)
+            return []
+
+    async def search_statutes_async(self, query: str) -> List[Dict]:
+        """법령 검색 비동기 변형"""
+        try:
+            params = {
+                'OC': self.law_oc_code,
+                'target': 'law',
+                'query': query,
+                'display': '20',
+                'type': 'XML'
+            }
+            body = await self._get_bytes_async(self.base_url, params)
+            return self._stream_statutes(body)
+        except Exception as e:
+            logger.error("법령 비동기 검색 오류: %s", e)
+            return []
+
+    async def get_case_details_async(self, case_number: str) -> Optional[Dict]:
+        """판례 상세 정보 비동기 조회 (진행 중인 동일 조회 결과 공유)"""
+        key = f"prec:{case_number}"
+        pending = self._async_inflight.get(key)
+        if pending is not None:
+            return await pending
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_inflight[key] = future
+        try:
+            result = await self._fetch_case_details_async(case_number)
+            future.set_result(result)
+            return result
+        finally:
+            self._async_inflight.pop(key, None)
+            if not future.done():
+                future.set_result(None)
+
+    async def _fetch_case_details_async(self, case_number: str) -> Optional[Dict]:
+        """판례 상세 정보 실제 비동기 조회"""
         try:
             params = {
                 'OC': self.law_oc_code,
@@ -254,19 +1146,31 @@ class LawAPI:
                 'display': '1',
                 'type': 'XML'
             }
-            
-            response = self.session.get(self.base_url, params=params)
-            response.raise_for_status()
-            
-            xml_data = xmltodict.parse(response.text)
-            precedents = self._extract_precedents(xml_data)
-            
+            body = await self._get_bytes_async(self.base_url, params)
+            precedents = self._extract_precedents(self._parse_xml(body))
             return precedents[0] if precedents else None
-            
         except Exception as e:
-            print(f"판례 상세 정보 조회 오류: {e}")
+            logger.error("판례 상세 비동기 조회 오류: %s", e)
             return None
-    
+
+    def gather_all(self, coros: List) -> List:
+        """
+        여러 비동기 조회를 한 이벤트 루프에서 동시 실행 (동기 래퍼)
+
+        예: api.gather_all([api.search_precedents_async("사기"),
+                            api.search_statutes_async("형법")])
+
+        순차 RTT 합계 대신 가장 느린 요청 하나의 지연만 지불한다.
+        """
+        async def _run():
+            try:
+                return await asyncio.gather(*coros, return_exceptions=True)
+            finally:
+                await self._close_async_session()
+
+        results = asyncio.run(_run())
+        return [r if not isinstance(r, Exception) else [] for r in results]
+
     def search_by_keywords(self, keywords: List[str], limit: int = 10) -> List[Dict]:
         """
         키워드 리스트로 판례 검색
@@ -307,6 +1211,7 @@ class LawAPI:
         """
         return self.search_precedents(f"{punishment_type}", limit) 
 
+    @_ttl_cached(ttl=3600, maxsize=4096)
     def get_law_article(self, law_name: str, article_number: str) -> Dict:
         """
         법률 조항 검색 (Streamlit Cloud 완전 호환)
@@ -320,104 +1225,12 @@ class LawAPI:
         """
         try:
             # 🔧 확장된 법률 조항 데이터베이스 (Streamlit Cloud 내장)
-            law_articles = {
-                "형법": {
-                    "243": {
-                        "title": "음화반포등",
-                        "content": "음란한 문서, 도화, 필름 기타 물건을 반포, 판매 또는 임대하거나 공연히 전시 또는 상영한 자는 1년 이하의 징역 또는 500만원 이하의 벌금에 처한다.",
-                        "law_number": "형법 제243조",
-                        "category": "사회에 대한 죄",
-                        "subcategory": "성풍속에 관한 죄"
-                    },
-                    "347": {
-                        "title": "사기",
-                        "content": "사람을 기망하여 재물의 교부를 받거나 재산상의 이익을 취득한 자는 10년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
-                        "law_number": "형법 제347조", 
-                        "category": "재산에 대한 죄",
-                        "subcategory": "사기와 공갈의 죄"
-                    },
-                    "1": {
-                        "title": "범죄의 성립과 처벌",
-                        "content": "죄형법정주의에 따라 법률이 정하지 아니하면 범죄가 되지 아니하고 형벌을 과하지 아니한다.",
-                        "law_number": "형법 제1조",
-                        "category": "통칙",
-                        "subcategory": "기본원칙"
-                    }
-                },
-                "민법": {
-                    "750": {
-                        "title": "불법행위의 내용",
-                        "content": "고의 또는 과실로 인한 위법행위로 타인에게 손해를 가한 자는 그 손해를 배상할 책임이 있다.",
-                        "law_number": "민법 제750조",
-                        "category": "채권",
-                        "subcategory": "불법행위로 인한 채권"
-                    },
-                    "751": {
-                        "title": "재산 이외의 손해의 배상",
-                        "content": "타인의 신체, 자유 또는 인격권을 침해한 경우에는 재산 이외의 손해에 대하여도 배상할 책임이 있다.",
-                        "law_number": "민법 제751조",
-                        "category": "채권",
-                        "subcategory": "불법행위로 인한 채권"
-                    },
-                    "1": {
-                        "title": "권리능력의 시기",
-                        "content": "사람은 생존하는 동안 권리와 의무의 주체가 된다.",
-                        "law_number": "민법 제1조",
-                        "category": "일반규정",
-                        "subcategory": "기본원칙"
-                    }
-                },
-                "정보통신망 이용촉진 및 정보보호 등에 관한 법률": {
-                    "44의7": {
-                        "title": "불법정보의 유통금지 등",
-                        "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다. 이 법을 위반하여 불법정보를 유통한 자는 2년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
-                        "law_number": "정보통신망 이용촉진 및 정보보호 등에 관한 법률 제44조의7",
-                        "category": "정보통신망 관련 특별법",
-                        "subcategory": "불법정보 유통 금지"
-                    }
-                },
-                "정보통신망법": {
-                    "44의7": {
-                        "title": "불법정보의 유통금지 등",
-                        "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다. 이 법을 위반하여 불법정보를 유통한 자는 2년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
-                        "law_number": "정보통신망법 제44조의7",
-                        "category": "정보통신망 관련 특별법",
-                        "subcategory": "불법정보 유통 금지"
-                    }
-                },
-                "개인정보보호법": {
-                    "71": {
-                        "title": "벌칙",
-                        "content": "다음 각 호의 어느 하나에 해당하는 자는 5년 이하의 징역 또는 5천만원 이하의 벌금에 처한다.",
-                        "law_number": "개인정보보호법 제71조",
-                        "category": "개인정보보호",
-                        "subcategory": "벌칙"
-                    }
-                },
-                "상법": {
-                    "1": {
-                        "title": "상법의 적용범위",
-                        "content": "상인의 영업에 관하여는 다른 법률에 특별한 규정이 있는 경우를 제외하고는 이 법이 정하는 바에 의한다.",
-                        "law_number": "상법 제1조",
-                        "category": "총칙",
-                        "subcategory": "기본원칙"
-                    }
-                }
-            }
-            
             # 🔍 법률명 정규화 (별칭 처리)
-            law_aliases = {
-                "정통법": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
-                "정보통신망법": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
-                "개보법": "개인정보보호법",
-                "개인정보법": "개인정보보호법"
-            }
-            
-            normalized_law_name = law_aliases.get(law_name, law_name)
+            normalized_law_name = _LAW_ALIASES.get(law_name, law_name)
             
             # 검색 실행
-            if normalized_law_name in law_articles and article_number in law_articles[normalized_law_name]:
-                article_info = law_articles[normalized_law_name][article_number].copy()
+            if normalized_law_name in _LAW_ARTICLES and article_number in _LAW_ARTICLES[normalized_law_name]:
+                article_info = _LAW_ARTICLES[normalized_law_name][article_number].copy()
                 article_info["exists"] = True
                 article_info["source"] = "내장 데이터베이스"
                 return article_info
@@ -431,13 +1244,58 @@ class LawAPI:
                 }
                 
         except Exception as e:
-            print(f"⚠️ 법률 조항 검색 오류: {e}")
+            logger.error("⚠️ 법률 조항 검색 오류: %s", e)
             return {
                 "exists": False, 
                 "message": f"검색 중 오류가 발생했습니다: {e}",
                 "error": str(e)
             }
     
+    def verify_case_numbers(self, case_numbers: List[str],
+                            use_ai_search: bool = False) -> Dict[str, Dict]:
+        """여러 판례 번호를 스레드 풀에서 동시 검증 (동기 호출자용)"""
+        futures = {
+            cn: self._pool.submit(self.verify_case_number, cn, use_ai_search)
+            for cn in case_numbers
+        }
+        return {cn: fut.result() for cn, fut in futures.items()}
+
+    def get_case_details_many(self, case_numbers: List[str]) -> Dict[str, Optional[Dict]]:
+        """여러 사건번호 상세 정보를 스레드 풀에서 동시 조회"""
+        futures = {
+            cn: self._pool.submit(self.get_case_details, cn)
+            for cn in case_numbers
+        }
+        return {cn: fut.result() for cn, fut in futures.items()}
+
+    def search_precedents_many(self, queries: List[str],
+                               limit: int = 10) -> Dict[str, List[Dict]]:
+        """여러 질의의 판례 검색을 스레드 풀에서 동시 실행"""
+        futures = {
+            q: self._pool.submit(self.search_precedents, q, limit)
+            for q in queries
+        }
+        return {q: fut.result() for q, fut in futures.items()}
+
+    @functools.cached_property
+    def _not_found_template(self) -> Dict:
+        """검증 실패 응답의 고정 부분 (인스턴스당 1회 구성)
+
+        search_links는 일반 dict로 둔다 — mappingproxy는 deepcopy가
+        불가능해 _ttl_cached의 사본 생성에서 TypeError가 나고, 호출부
+        격리는 어차피 캐시 래퍼의 deepcopy가 보장한다.
+        """
+        return {
+            "exists": False,
+            "suggestion": "AI 검색을 시도했지만 결과를 찾을 수 없었습니다. 법원 홈페이지에서 직접 확인해보세요.",
+            "search_links": {
+                "대법원": "https://glaw.scourt.go.kr/",
+                "종합법률정보": "https://www.law.go.kr/",
+                "케이스노트": "https://casenote.kr/"
+            }
+        }
+
+    @_ttl_cached(ttl=3600, maxsize=4096)
     def verify_case_number(self, case_number: str, use_ai_search: bool = True) -> Dict:
         """
         판례 번호 검증
@@ -450,9 +1308,8 @@ class LawAPI:
             판례 정보 또는 존재 여부
         """
         try:
-            # 판례 번호 형식 검증 (더 많은 사건 유형 포함)
-            case_pattern = r'^(\d{4})(도|바|노|마|차|러|허|므|두|후|고합|고단|초기|재|전|누|구|나|가|재나|재차|재허|재므|재두|재후|합|단|기|전합|전단|전기|누합|누단|누기|구합|구단|구기|나합|나단|나기|가합|가단|가기)(\d+)$'
-            if not re.match(case_pattern, case_number):
+            # 판례 번호 형식 검증 (사전 컴파일된 패턴, 긴 사건부호 우선)
+            if not _CASE_RE.match(case_number):
                 return {
                     "exists": False,
                     "message": "잘못된 판례 번호 형식입니다. (예: 2019도11772)",
@@ -462,194 +1319,29 @@ class LawAPI:
                     # 1. 먼저 로컬 데이터베이스에서 검색 (가장 정확한 정보)
             
             # 2. 로컬 샘플 데이터에서 검색
-            sample_cases = {
-                "2019도11772": {
-                    "exists": True,
-                    "title": "음란물 유포죄 관련 판례",
-                    "court": "대법원",
-                    "date": "2019-12-26",
-                    "case_type": "형사",
-                    "summary": "정보통신망을 이용하여 음란물을 유포한 행위에 대한 처벌 기준을 명확히 한 판례",
-                    "main_issue": "음란물 유포의 구성요건과 처벌 기준",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제243조", "정보통신망 이용촉진 및 정보보호 등에 관한 법률"],
-                    "keywords": ["음란물", "유포", "정보통신망", "형법 제243조"]
-                },
-                "2020도5432": {
-                    "exists": True,
-                    "title": "전자상거래 사기 판례",
-                    "court": "대법원",
-                    "date": "2020-03-15",
-                    "case_type": "형사",
-                    "summary": "온라인 쇼핑몰을 통한 사기 행위의 법적 판단 기준",
-                    "main_issue": "전자상거래에서의 사기 구성요건",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제347조"],
-                    "keywords": ["사기", "전자상거래", "온라인"]
-                },
-                "2021도3456": {
-                    "exists": True,
-                    "title": "해킹 관련 판례",
-                    "court": "대법원",
-                    "date": "2021-06-20",
-                    "case_type": "형사",
-                    "summary": "타인의 컴퓨터 시스템에 무단으로 접근하여 정보를 빼낸 행위에 대한 법적 판단",
-                    "main_issue": "해킹 행위의 구성요건과 처벌 수준",
-                    "verdict": "유죄",
-                    "applicable_law": ["정보통신망법 제48조", "형법 제347조의2"],
-                    "keywords": ["해킹", "무단접근", "정보통신망", "컴퓨터범죄"]
-                },
-                "2018도9876": {
-                    "exists": True,
-                    "title": "스토킹 처벌 판례",
-                    "court": "대법원",
-                    "date": "2018-11-10",
-                    "case_type": "형사",
-                    "summary": "지속적인 접근 및 괴롭힘 행위에 대한 처벌 기준",
-                    "main_issue": "스토킹 행위의 범위와 처벌 수준",
-                    "verdict": "유죄",
-                    "applicable_law": ["스토킹범죄의 처벌 등에 관한 법률"],
-                    "keywords": ["스토킹", "괴롭힘", "접근금지", "특별법"]
-                },
-                "2022고합57": {
-                    "exists": True,
-                    "title": "특수강도 사건",
-                    "court": "서울중앙지방법원",
-                    "date": "2022-07-07",
-                    "case_type": "형사",
-                    "summary": "야간에 주거지에 침입하여 폭력을 행사하고 금품을 갈취한 특수강도 사건",
-                    "main_issue": "특수강도죄의 구성요건 및 형량 결정",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제334조", "형법 제335조"],
-                    "keywords": ["특수강도", "주거침입", "폭력", "금품갈취"]
-                },
-                "2022고단1234": {
-                    "exists": True,
-                    "title": "사기 사건",
-                    "court": "대전지방법원",
-                    "date": "2022-08-15",
-                    "case_type": "형사",
-                    "summary": "가상화폐 투자를 빙자한 다단계 사기 사건",
-                    "main_issue": "가상화폐 관련 사기죄의 적용",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제347조", "방문판매법"],
-                    "keywords": ["사기", "가상화폐", "다단계", "투자"]
-                },
-                "2022고합144": {
-                    "exists": True,
-                    "title": "성폭력 사건",
-                    "court": "수원지방법원",
-                    "date": "2022-12-23",
-                    "case_type": "형사",
-                    "summary": "직장 내 성폭력 사건에 대한 법적 판단",
-                    "main_issue": "직장 내 성폭력의 처벌 기준",
-                    "verdict": "유죄",
-                    "applicable_law": ["성폭력처벌법", "형법 제297조"],
-                    "keywords": ["성폭력", "직장", "처벌", "피해자보호"]
-                },
-                "2022고합600": {
-                    "exists": True,
-                    "title": "마약 사건",
-                    "court": "서울중앙지방법원",
-                    "date": "2022-11-15",
-                    "case_type": "형사",
-                    "summary": "대량 마약 유통 및 판매 사건",
-                    "main_issue": "마약 판매의 처벌 수준 및 몰수·추징",
-                    "verdict": "유죄",
-                    "applicable_law": ["마약류 관리에 관한 법률"],
-                    "keywords": ["마약", "유통", "판매", "몰수추징"]
-                },
-                "2022고합660": {
-                    "exists": True,
-                    "title": "특수절도 사건",
-                    "court": "서울중앙지방법원",
-                    "date": "2024-11-15",
-                    "case_type": "형사",
-                    "summary": "차량 절도 및 연쇄 절도 사건",
-                    "main_issue": "특수절도죄의 구성요건 및 상습성",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제331조", "형법 제332조"],
-                    "keywords": ["특수절도", "차량절도", "상습", "연쇄범죄"]
-                },
-                "2022고합3692": {
-                    "exists": True,
-                    "title": "횡령 사건",
-                    "court": "서울남부지방법원",
-                    "date": "2024-05-16",
-                    "case_type": "형사",
-                    "summary": "회사 자금 횡령 및 배임 사건",
-                    "main_issue": "횡령죄와 배임죄의 구별 및 처벌",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제355조", "형법 제356조"],
-                    "keywords": ["횡령", "배임", "회사자금", "업무상배임"]
-                },
-                "2023고합88": {
-                    "exists": True,
-                    "title": "살인 사건",
-                    "court": "광주지방법원",
-                    "date": "2023-09-12",
-                    "case_type": "형사",
-                    "summary": "동거인 살해 사건",
-                    "main_issue": "살인죄의 구성요건 및 정당방위 여부",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제250조"],
-                    "keywords": ["살인", "동거인", "정당방위", "고의"]
-                },
-                "2021고합456": {
-                    "exists": True,
-                    "title": "방화 사건",
-                    "court": "부산지방법원",
-                    "date": "2021-10-08",
-                    "case_type": "형사",
-                    "summary": "아파트 방화 사건",
-                    "main_issue": "현주건조물 방화죄의 적용",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제164조"],
-                    "keywords": ["방화", "현주건조물", "아파트", "위험"]
-                },
-                "2020고합789": {
-                    "exists": True,
-                    "title": "뇌물 사건",
-                    "court": "대구지방법원",
-                    "date": "2020-12-18",
-                    "case_type": "형사",
-                    "summary": "공무원 뇌물 수수 사건",
-                    "main_issue": "뇌물죄의 구성요건 및 처벌",
-                    "verdict": "유죄",
-                    "applicable_law": ["형법 제129조", "형법 제130조"],
-                    "keywords": ["뇌물", "공무원", "수수", "직무관련"]
-                }
-            }
-            
-            if case_number in sample_cases:
-                return sample_cases[case_number]
+            hit = _SAMPLE_CASES.get(case_number)
+            if hit is not None:
+                return hit
             
             # 로컬 데이터에 없으면 AI 검색 시도 (실시간 검색)
-            if use_ai_search:
+            if use_ai_search and _OpenAIAPI is not None:
                 try:
-                    from . import OpenAIAPI
-                    openai_api = OpenAIAPI()
+                    openai_api = _OpenAIAPI()
                     ai_result = self._search_case_with_ai(case_number, openai_api)
                     if ai_result.get("exists"):
                         return ai_result
                 except Exception as e:
-                    print(f"AI 검색 중 오류: {e}")
+                    logger.error("AI 검색 중 오류: %s", e)
             
-            # 찾을 수 없는 경우
+            # 찾을 수 없는 경우 — 사전 구성된 템플릿에 가변 필드만 얹기
             return {
-                "exists": False,
+                **self._not_found_template,
                 "message": f"판례 번호 '{case_number}'를 시스템에서 찾을 수 없습니다.",
-                "case_number": case_number,
-                "suggestion": "AI 검색을 시도했지만 결과를 찾을 수 없었습니다. 법원 홈페이지에서 직접 확인해보세요.",
-                "search_links": {
-                    "대법원": "https://glaw.scourt.go.kr/",
-                    "종합법률정보": "https://www.law.go.kr/",
-                    "케이스노트": "https://casenote.kr/"
-                }
+                "case_number": case_number
             }
                 
         except Exception as e:
-            print(f"판례 번호 검증 오류: {e}")
+            logger.error("판례 번호 검증 오류: %s", e)
             return {"exists": False, "message": f"검증 중 오류가 발생했습니다: {e}"}
     
     def _search_case_with_ai(self, case_number: str, openai_api) -> Dict:
@@ -690,17 +1382,15 @@ class LawAPI:
             # AI에게 질의
             response = openai_api.get_completion(prompt)
             
-            # JSON 파싱 시도
-            import json
+            # JSON 파싱 시도 (json은 모듈 상단에서 임포트됨)
             try:
-                # 응답에서 JSON 부분만 추출
+                # 첫 '{'에서 raw_decode로 바로 파싱 (rfind 재스캔/슬라이스 생략,
+                # JSON 뒤에 설명 텍스트가 붙어 있어도 허용)
                 json_start = response.find('{')
-                json_end = response.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_str = response[json_start:json_end]
-                    result = json.loads(json_str)
-                    
+
+                if json_start != -1:
+                    result, _ = _JSON_DECODER.raw_decode(response, json_start)
+
                     # 결과 검증 및 정리
                     if result.get("exists"):
                         return {
@@ -720,15 +1410,16 @@ class LawAPI:
                         return {"exists": False, "source": "AI 검색"}
                 
             except json.JSONDecodeError:
-                print(f"AI 응답 JSON 파싱 실패: {response}")
+                logger.error("AI 응답 JSON 파싱 실패: %s", response)
                 return {"exists": False, "error": "AI 응답 파싱 실패"}
             
             return {"exists": False, "error": "AI 응답에서 유효한 JSON을 찾을 수 없음"}
             
         except Exception as e:
-            print(f"AI 판례 검색 오류: {e}")
+            logger.error("AI 판례 검색 오류: %s", e)
             return {"exists": False, "error": f"AI 검색 실패: {e}"}
     
+    @_ttl_cached(ttl=600)
     def search_case_with_scourt_api(self, case_number: str) -> Dict:
         """
         대법원 포털 API를 사용한 판례 검색
@@ -751,47 +1442,45 @@ class LawAPI:
                 'pageNum': 1
             }
             
-            # API 요청
-            response = self.session.get(search_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('resultList') and len(data['resultList']) > 0:
-                    case_info = data['resultList'][0]
-                    
-                    return {
-                        "exists": True,
-                        "title": case_info.get('caseTitle', ''),
-                        "court": case_info.get('courtName', ''),
-                        "date": case_info.get('judgeDate', ''),
-                        "case_type": self._get_case_type_from_number(case_number),
-                        "summary": case_info.get('caseSummary', ''),
-                        "main_issue": case_info.get('mainIssue', ''),
-                        "verdict": case_info.get('verdict', ''),
-                        "applicable_law": case_info.get('applicableLaw', []),
-                        "keywords": case_info.get('keywords', []),
-                        "source": "대법원 포털 API",
-                        "full_text": case_info.get('fullText', ''),
-                        "case_url": case_info.get('caseUrl', '')
-                    }
-                else:
-                    return {"exists": False, "source": "대법원 포털 API", "message": "검색 결과 없음"}
-            
-            else:
-                print(f"대법원 API 응답 오류: {response.status_code}")
-                return {"exists": False, "error": f"API 응답 오류: {response.status_code}"}
-                
+            # API 요청 (스트리밍: 첫 결과만 필요하므로 꼬리 파싱을 생략)
+            with self.session.get(search_url, params=params, timeout=10,
+                                  stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("대법원 API 응답 오류: %s", response.status_code)
+                    return {"exists": False, "error": f"API 응답 오류: {response.status_code}"}
+
+                case_info = next(self._iter_scourt_items(response), None)
+
+            if case_info is not None:
+                return {
+                    "exists": True,
+                    "title": case_info.get('caseTitle', ''),
+                    "court": case_info.get('courtName', ''),
+                    "date": case_info.get('judgeDate', ''),
+                    "case_type": self._get_case_type_from_number(case_number),
+                    "summary": case_info.get('caseSummary', ''),
+                    "main_issue": case_info.get('mainIssue', ''),
+                    "verdict": case_info.get('verdict', ''),
+                    "applicable_law": case_info.get('applicableLaw', []),
+                    "keywords": case_info.get('keywords', []),
+                    "source": "대법원 포털 API",
+                    "full_text": case_info.get('fullText', ''),
+                    "case_url": case_info.get('caseUrl', '')
+                }
+
+            return {"exists": False, "source": "대법원 포털 API", "message": "검색 결과 없음"}
+
         except requests.exceptions.Timeout:
-            print("대법원 API 요청 시간 초과")
+            logger.error("대법원 API 요청 시간 초과")
             return {"exists": False, "error": "요청 시간 초과"}
         except requests.exceptions.RequestException as e:
-            print(f"대법원 API 요청 오류: {e}")
+            logger.error("대법원 API 요청 오류: %s", e)
             return {"exists": False, "error": f"네트워크 오류: {e}"}
         except Exception as e:
-            print(f"대법원 API 처리 오류: {e}")
+            logger.error("대법원 API 처리 오류: %s", e)
             return {"exists": False, "error": f"처리 오류: {e}"}
     
+    @_ttl_cached(ttl=600)
     def search_precedents_by_keyword_scourt(self, keyword: str, limit: int = 10) -> List[Dict]:
         """
         대법원 포털에서 키워드로 판례 검색
@@ -813,13 +1502,17 @@ class LawAPI:
                 'pageNum': 1
             }
             
-            response = self.session.get(search_url, params=params, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
+            # 스트리밍 응답: limit개를 읽으면 나머지 본문 파싱을 중단
+            with self.session.get(search_url, params=params, timeout=15,
+                                  stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("대법원 키워드 검색 API 오류: %s", response.status_code)
+                    return []
+
                 precedents = []
-                
-                for case_info in data.get('resultList', []):
+
+                for case_info in itertools.islice(
+                        self._iter_scourt_items(response), limit):
                     precedent = {
                         'title': case_info.get('caseTitle', ''),
                         'case_number': case_info.get('caseNo', ''),
@@ -832,16 +1525,28 @@ class LawAPI:
                         'case_url': case_info.get('caseUrl', '')
                     }
                     precedents.append(precedent)
-                
+
                 return precedents
-            else:
-                print(f"대법원 키워드 검색 API 오류: {response.status_code}")
-                return []
-                
+
         except Exception as e:
-            print(f"대법원 키워드 검색 오류: {e}")
+            logger.error("대법원 키워드 검색 오류: %s", e)
             return []
-    
+
+    @staticmethod
+    def _iter_scourt_items(response):
+        """
+        대법원 포털 응답의 resultList 항목 반복자
+
+        ijson이 설치되어 있으면 응답 스트림에서 항목을 증분 파싱해
+        필요한 만큼만 읽고 중단할 수 있다. 없으면 전체 JSON 파싱으로 대체.
+        """
+        if ijson is not None:
+            response.raw.decode_content = True
+            return ijson.items(response.raw, 'resultList.item')
+        # 한국 법령 API는 UTF-8 고정 — 선언해 두면 chardet 스캔을 건너뜀
+        response.encoding = 'utf-8'
+        return iter(response.json().get('resultList', []))
+
     def _get_case_type_from_number(self, case_number: str) -> str:
         """
         사건번호에서 사건 유형 추출
@@ -852,27 +1557,34 @@ class LawAPI:
         Returns:
             사건 유형
         """
-        case_type_map = {
-            '도': '형사',
-            '바': '행정',
-            '노': '민사',
-            '마': '가사',
-            '고합': '형사(합의)',
-            '고단': '형사(단독)',
-            '합': '합의부',
-            '단': '단독',
-            '재': '재심',
-            '전': '전원합의체'
-        }
-        
-        # 정규식으로 사건 유형 추출
-        match = re.search(r'\d{4}([가-힣]+)\d+', case_number)
-        if match:
-            case_type_code = match.group(1)
-            return case_type_map.get(case_type_code, case_type_code)
-        
-        return '알 수 없음'
+        if len(case_number) < 5 or not case_number[:4].isdigit():
+            return '알 수 없음'
+
+        # 트라이를 걸어 최장 일치 사건부호 탐색 (정규식/한글 클래스 스캔 제거)
+        node = _TYPE_TRIE
+        best = None
+        best_end = 4
+        for i, ch in enumerate(case_number[4:], start=4):
+            node = node.get(ch)
+            if node is None:
+                break
+            if '' in node:
+                best = node['']
+                best_end = i + 1
+
+        # 부호 바로 뒤가 숫자일 때만 확정 — '전합'·'재나'처럼 매핑에 없는
+        # 더 긴 부호의 접두사('전'·'재')를 잘못 매칭하지 않도록
+        if (best is not None and best_end < len(case_number)
+                and case_number[best_end].isdigit()):
+            return _CASE_TYPE_NAME_MAP[best]
+
+        # 알려진 부호가 아니면 한글 구간을 그대로 반환 (기존 동작 유지)
+        end = 4
+        while end < len(case_number) and '가' <= case_number[end] <= '힣':
+            end += 1
+        return case_number[4:end] if end > 4 else '알 수 없음'
     
+    @_ttl_cached(ttl=600)
     def search_law_with_openlaw_api(self, query: str, target: str = "law") -> List[Dict]:
         """
         국가법령정보센터 오픈 API를 사용한 법령 검색
@@ -886,7 +1598,7 @@ class LawAPI:
         """
         try:
             if not self.law_api_key:
-                print("국가법령정보센터 API 키가 설정되지 않았습니다.")
+                logger.warning("국가법령정보센터 API 키가 설정되지 않았습니다.")
                 return []
             
             # API 파라미터 설정
@@ -902,7 +1614,8 @@ class LawAPI:
             response = self.session.get(self.law_api_url, params=params, timeout=10)
             response.raise_for_status()
             
-            # JSON 응답 파싱
+            # JSON 응답 파싱 (UTF-8 고정 선언으로 문자셋 추정 생략)
+            response.encoding = 'utf-8'
             data = response.json()
             
             results = []
@@ -942,13 +1655,13 @@ class LawAPI:
             return results
             
         except requests.exceptions.Timeout:
-            print("국가법령정보센터 API 요청 시간 초과")
+            logger.error("국가법령정보센터 API 요청 시간 초과")
             return []
         except requests.exceptions.RequestException as e:
-            print(f"국가법령정보센터 API 요청 오류: {e}")
+            logger.error("국가법령정보센터 API 요청 오류: %s", e)
             return []
         except Exception as e:
-            print(f"국가법령정보센터 API 처리 오류: {e}")
+            logger.error("국가법령정보센터 API 처리 오류: %s", e)
             return []
     
     def search_precedents_with_openlaw_api(self, query: str, limit: int = 10) -> List[Dict]:
@@ -976,49 +1689,45 @@ class LawAPI:
             관련 법률 목록
         """
         try:
-            # 샘플 법률 데이터
-            laws_data = [
-                {
-                    "law_name": "형법",
-                    "article": "243",
-                    "title": "음화반포등",
-                    "content": "음란한 문서, 도화, 필름 기타 물건을 반포, 판매 또는 임대하거나 공연히 전시 또는 상영한 자는 1년 이하의 징역 또는 500만원 이하의 벌금에 처한다.",
-                    "type": "criminal",
-                    "keywords": ["음란물", "유포", "반포", "판매", "임대", "전시", "상영"]
-                },
-                {
-                    "law_name": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
-                    "article": "44조의7",
-                    "title": "불법정보의 유통금지 등",
-                    "content": "누구든지 정보통신망을 통하여 음란정보를 유통하여서는 아니 된다.",
-                    "type": "administrative",
-                    "keywords": ["정보통신망", "음란정보", "유통금지", "인터넷"]
-                },
-                {
-                    "law_name": "형법",
-                    "article": "347",
-                    "title": "사기",
-                    "content": "사람을 기망하여 재물의 교부를 받거나 재산상의 이익을 취득한 자는 10년 이하의 징역 또는 2천만원 이하의 벌금에 처한다.",
-                    "type": "criminal",
-                    "keywords": ["사기", "기망", "재물", "교부", "재산상 이익"]
-                }
+            # 소문자 변환은 질의당 1회 (레코드별 .lower() 재계산 제거)
+            kw_lower = keyword.lower()
+            # 첫 글자 프리필터 — 길이 1 needle의 in 검사는 CPython이
+            # memchr 수준으로 처리하므로, 첫 글자조차 없는 레코드는
+            # 본 부분 일치 검사 없이 걸러낸다
+            first = kw_lower[:1]
+
+            # 유형 필터를 문자열 비교 전에 적용
+            if law_type == "all":
+                candidates = range(len(_LAWS_DATA))
+            else:
+                candidates = _LAWS_BY_TYPE.get(law_type, ())
+
+            # 1차: 키워드 역색인 정확 일치 — O(1) 조회
+            hits = set(_LAW_KEYWORD_INDEX.get(kw_lower, ()))
+
+            # 1.5차: 자동자가 있으면 여러 단어 질의문 속 법률 키워드를
+            # 단일 패스로 수집 (질의 길이에 비례, 키워드 수와 무관)
+            if _LAW_KEYWORD_AC is not None:
+                for _, law_ids in _LAW_KEYWORD_AC.iter(kw_lower):
+                    hits.update(law_ids)
+
+            # 2차: 캐시된 소문자 컬럼에 대한 부분 일치 스캔
+            return [
+                _LAWS_DATA[idx]
+                for idx in candidates
+                if idx in hits
+                or ((first in _LAW_CONTENT_LOWER[idx]
+                     or first in _LAW_TITLE_LOWER[idx])
+                    and (kw_lower in _LAW_CONTENT_LOWER[idx]
+                         or kw_lower in _LAW_TITLE_LOWER[idx]))
+                or any(kw_lower in kw for kw in _LAW_KEYWORDS_LOWER[idx])
             ]
-            
-            # 키워드로 필터링
-            filtered_laws = []
-            for law in laws_data:
-                if (law_type == "all" or law["type"] == law_type) and \
-                   (keyword.lower() in law["content"].lower() or \
-                    keyword.lower() in law["title"].lower() or \
-                    any(keyword.lower() in kw.lower() for kw in law["keywords"])):
-                    filtered_laws.append(law)
-            
-            return filtered_laws
-            
+
         except Exception as e:
-            print(f"법률 키워드 검색 오류: {e}")
+            logger.error("법률 키워드 검색 오류: %s", e)
             return []
 
+    @_ttl_cached(ttl=3600, maxsize=4096)
     def get_related_laws(self, law_reference: str) -> List[Dict]:
         """
         관련 법률 조항 검색
@@ -1030,52 +1739,18 @@ class LawAPI:
             관련 법률 목록
         """
         try:
-            # 법률 참조 파싱
-            law_match = re.match(r'(.+?)\s*제(\d+(?:의\d+)?)조', law_reference)
-            if not law_match:
+            # 법률 참조 파싱 (모듈 로드 시 컴파일된 패턴 재사용)
+            if not _LAW_ARTICLE_RE.match(law_reference):
                 return []
-            
-            law_name = law_match.group(1)
-            article_num = law_match.group(2)
-            
-            # 관련 법률 매핑
-            related_laws = {
-                "형법 제243조": [
-                    {
-                        "law_name": "정보통신망 이용촉진 및 정보보호 등에 관한 법률",
-                        "article": "44조의7",
-                        "title": "불법정보의 유통금지 등",
-                        "relation": "온라인 음란물 유포 시 적용되는 특별법"
-                    },
-                    {
-                        "law_name": "형법",
-                        "article": "244조",
-                        "title": "음화제조등",
-                        "relation": "음란물 제조 관련 조항"
-                    }
-                ],
-                "형법 제347조": [
-                    {
-                        "law_name": "형법",
-                        "article": "350조",
-                        "title": "공갈",
-                        "relation": "재산범죄 관련 조항"
-                    },
-                    {
-                        "law_name": "전자상거래 등에서의 소비자보호에 관한 법률",
-                        "article": "21조",
-                        "title": "금지행위",
-                        "relation": "전자상거래 사기 관련 특별법"
-                    }
-                ]
-            }
-            
-            return related_laws.get(law_reference, [])
-            
+
+            # 모듈 상수 조회만 남는다 — 호출마다의 중첩 dict 할당 제거
+            return list(_RELATED_LAWS.get(law_reference, ()))
+
         except Exception as e:
-            print(f"관련 법률 검색 오류: {e}")
+            logger.error("관련 법률 검색 오류: %s", e)
             return []
 
+    @_ttl_cached(ttl=3600, maxsize=4096)
     def validate_legal_citation(self, citation: str) -> Dict:
         """
         법률 인용 형식 검증
@@ -1094,9 +1769,8 @@ class LawAPI:
                 "details": {}
             }
             
-            # 법률 조항 패턴 검증
-            law_pattern = r'^(.+?)\s*제(\d+(?:의\d+)?)조$'
-            law_match = re.match(law_pattern, citation)
+            # 법률 조항 패턴 검증 (모듈 로드 시 컴파일된 패턴 재사용)
+            law_match = _LAW_ARTICLE_RE.match(citation)
             
             if law_match:
                 law_name = law_match.group(1)
@@ -1118,15 +1792,12 @@ class LawAPI:
                 
                 return result
             
-            # 판례 번호 패턴 검증 (더 많은 사건 유형 포함)
-            case_pattern = r'^(대법원|고등법원|지방법원)?\s*(\d{4})(도|바|노|마|차|러|허|므|두|후|고합|고단|초기|재|전|누|구|나|가|재나|재차|재허|재므|재두|재후|합|단|기|전합|전단|전기|누합|누단|누기|구합|구단|구기|나합|나단|나기|가합|가단|가기)(\d+)$'
-            case_match = re.match(case_pattern, citation)
-            
-            if case_match:
-                court = case_match.group(1) or "대법원"
-                year = case_match.group(2)
-                case_type = case_match.group(3)
-                case_num = case_match.group(4)
+            # 판례 번호 검증 — 정규식 대신 수작업 스캐너 (더 많은 사건 유형 포함)
+            case_match = _match_citation_case(citation)
+
+            if case_match is not None:
+                court = case_match[0] or "대법원"
+                year, case_type, case_num = case_match[1:]
                 full_case_num = f"{year}{case_type}{case_num}"
                 
                 result["type"] = "case_number"
@@ -1153,7 +1824,7 @@ class LawAPI:
             return result
             
         except Exception as e:
-            print(f"법률 인용 검증 오류: {e}")
+            logger.error("법률 인용 검증 오류: %s", e)
             return {
                 "citation": citation,
                 "is_valid": False,
@@ -1182,44 +1853,84 @@ class LawAPI:
                 )
                 
                 # 결과 가공
-                precedents = []
-                for result in vector_results:
-                    metadata = result.get('metadata', {})
-                    
-                    precedent = {
-                        'case_id': metadata.get('case_id', ''),
-                        'case_type': metadata.get('type', 'Unknown'),
-                        'title': metadata.get('query', '')[:100] if metadata.get('query') else '',
-                        'summary': result.get('text', '')[:500],
-                        'similarity_score': result.get('similarity_score', 0),
-                        'rank': result.get('rank', 0),
-                        'source': 'LLM_Dataset',
-                        'full_text': result.get('text', ''),
-                        'query': metadata.get('query', ''),
-                        'answer': metadata.get('answer', ''),
-                        'context': metadata.get('context', '')
-                    }
-                    
-                    precedents.append(precedent)
-                
+                precedents = [self._vector_precedent(result) for result in vector_results]
+
                 if precedents:
-                    print(f"벡터 검색 성공: {len(precedents)}건")
+                    logger.info("벡터 검색 성공: %d건", len(precedents))
                     return precedents
             
             # 폴백: 기존 API 검색
             api_results = self._search_precedents_api(case_description)
             
             if api_results:
-                print(f"API 검색 성공: {len(api_results)}건")
+                logger.info("API 검색 성공: %d건", len(api_results))
                 return api_results
             
             # 최종 폴백: 기본 데이터
             return self._get_fallback_precedents(case_description)
             
         except Exception as e:
-            print(f"유사 판례 검색 오류: {e}")
+            logger.error("유사 판례 검색 오류: %s", e)
             return self._get_fallback_precedents(case_description)
-    
+
+    @staticmethod
+    def _vector_precedent(result: Dict) -> Dict:
+        """벡터 검색 결과 한 건을 판례 dict로 변환"""
+        metadata = result.get('metadata', {})
+        return {
+            'case_id': metadata.get('case_id', ''),
+            'case_type': metadata.get('type', 'Unknown'),
+            'title': metadata.get('query', '')[:100] if metadata.get('query') else '',
+            'summary': result.get('text', '')[:500],
+            'similarity_score': result.get('similarity_score', 0),
+            'rank': result.get('rank', 0),
+            'source': 'LLM_Dataset',
+            'full_text': result.get('text', ''),
+            'query': metadata.get('query', ''),
+            'answer': metadata.get('answer', ''),
+            'context': metadata.get('context', '')
+        }
+
+    def batch_search_similar(self, queries: List[str], case_types: List[str] = None,
+                             k: int = 10) -> List[List[Dict]]:
+        """
+        여러 질의에 대한 유사 판례 일괄 검색
+
+        질의 전체를 한 번에 임베딩하고 벡터 인덱스도 한 번만 조회하므로
+        질의별 search_similar_precedents 반복 호출보다 효율적이다.
+
+        Args:
+            queries: 사건 설명/질의 리스트
+            case_types: 질의별 사건 유형 (None이면 전체 검색)
+            k: 질의당 반환할 결과 수
+
+        Returns:
+            질의 순서를 유지한 판례 리스트의 리스트
+        """
+        if not queries:
+            return []
+
+        if case_types is None:
+            case_types = [None] * len(queries)
+
+        try:
+            if self.vector_db:
+                batches = self.vector_db.search_similar_cases_batch(
+                    queries, top_k=k, case_types=case_types
+                )
+                return [
+                    [self._vector_precedent(result) for result in batch]
+                    for batch in batches
+                ]
+        except Exception as e:
+            logger.error("일괄 유사 판례 검색 오류: %s", e)
+
+        # 폴백: 질의별 순차 검색
+        return [
+            self.search_similar_precedents(query, case_type)
+            for query, case_type in zip(queries, case_types)
+        ]
+
     def get_legal_interpretation(self, legal_question: str) -> Dict:
         """
         법률 해석 질의응답 (형사법 LLM QA 데이터 활용)
@@ -1272,7 +1983,7 @@ class LawAPI:
             }
             
         except Exception as e:
-            print(f"법률 해석 오류: {e}")
+            logger.error("법률 해석 오류: %s", e)
             return {
                 'question': legal_question,
                 'answer': f'검색 중 오류가 발생했습니다: {str(e)}',
@@ -1343,7 +2054,7 @@ class LawAPI:
             return analysis_result
             
         except Exception as e:
-            print(f"향상된 사건 분석 오류: {e}")
+            logger.error("향상된 사건 분석 오류: %s", e)
             return {
                 'error': str(e),
                 'case_classification': 'Unknown',
@@ -1373,14 +2084,8 @@ class LawAPI:
                     text = result.get('text', '')
                     
                     # 간단한 량형 패턴 추출 (실제로는 더 정교한 NLP 필요)
-                    import re
-                    
-                    # 징역, 벌금 패턴
-                    imprisonment_pattern = r'징역\s*(\d+)년\s*(\d+)월?'
-                    fine_pattern = r'벌금\s*(\d+)만원'
-                    
-                    imprisonment_matches = re.findall(imprisonment_pattern, text)
-                    fine_matches = re.findall(fine_pattern, text)
+                    imprisonment_matches = _IMPRISONMENT_RE.findall(text)
+                    fine_matches = _FINE_RE.findall(text)
                     
                     for match in imprisonment_matches:
                         years = int(match[0])
@@ -1416,7 +2121,7 @@ class LawAPI:
             return trends
             
         except Exception as e:
-            print(f"량형 동향 분석 오류: {e}")
+            logger.error("량형 동향 분석 오류: %s", e)
             return []
     
     def _generate_recommendations(self, analysis_result: Dict) -> List[str]:
@@ -1459,7 +2164,7 @@ class LawAPI:
                 ])
             
         except Exception as e:
-            print(f"권고사항 생성 오류: {e}")
+            logger.error("권고사항 생성 오류: %s", e)
             recommendations.append("분석 중 오류가 발생했습니다. 전문가 상담을 권합니다.")
         
         return recommendations 
\ No newline at end of file
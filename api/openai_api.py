@@ -1,44 +1,451 @@
 import openai
 from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
 from config import Config
+import asyncio
+import functools
+import hashlib
 import json
+import threading
+import time
 import tiktoken
 
+# 재시도 대상 일시 오류 — 한도 초과/타임아웃/연결 오류는 지수 백오프 후
+# 다시 시도하면 대부분 성공한다 (그 외 오류는 즉시 전파)
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError,
+                     openai.APIConnectionError)
+_MAX_ATTEMPTS = 4
+
+# 모델별 컨텍스트 창 크기 — max_tokens 동적 산정용
+_MODEL_CTX = {
+    "gpt-4-turbo-preview": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+_DEFAULT_CTX = 8192
+
+# 모든 요청의 첫 번째 system 메시지로 들어가는 공통 프리앰블.
+# 핸들러 간에 바이트 단위로 동일한 접두사가 유지되어야 OpenAI의
+# 서버측 프롬프트 캐시가 프리픽스를 재사용할 수 있으므로, 요청별
+# 동적 텍스트는 절대 이 안에 넣지 않는다.
+LEGAL_SYSTEM_PROMPT = (
+    "당신은 한국 법률 전문 AI 어시스턴트입니다. 형법, 민법, 형사소송법 등 "
+    "한국 법령과 판례를 기준으로 정확하고 신중하게 분석하며, 단정적인 법률 "
+    "조언 대신 일반적인 법률 정보를 제공합니다. 답변은 한국어로 작성합니다."
+)
+_LEGAL_SYSTEM_MSG = {"role": "system", "content": LEGAL_SYSTEM_PROMPT}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델별 tiktoken 인코딩 — BPE 병합 파일 로드/파싱은 1회면 충분하다"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+# 디스크 캐시는 선택 의존성 — 없으면 프로세스 내 LRU로 대체
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# 동일 프롬프트 재요청 시 API 왕복(수 초)을 건너뛰기 위한 응답 캐시.
+# diskcache가 있으면 프로세스 재시작 후에도 유지된다.
+_RESPONSE_CACHE_MAX = 512
+if diskcache is not None:
+    _response_cache = diskcache.Cache(".openai_cache", size_limit=64 * 1024 * 1024)
+else:
+    _response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """응답 캐시 조회 (LRU 갱신 포함)"""
+    with _response_cache_lock:
+        if diskcache is not None:
+            return _response_cache.get(key)
+        value = _response_cache.get(key)
+        if value is not None:
+            _response_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: str, value: str):
+    """응답 캐시 저장 (LRU 초과분 제거)"""
+    with _response_cache_lock:
+        _response_cache[key] = value
+        if diskcache is None and len(_response_cache) > _RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+
+
+# 공유 OpenAI 클라이언트 — 인스턴스마다 httpx.Client를 새로 만들면
+# 첫 호출 때마다 TCP+TLS 핸드셰이크를 다시 치른다. 요청 단위로
+# OpenAIAPI()를 생성하는 앱 경로에서도 커넥션 풀이 재사용되도록
+# 모듈 수준에서 지연 생성해 공유한다.
+_shared_client = None
+_shared_async_client = None
+_shared_async_client_loop = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client():
+    """동기 OpenAI 클라이언트 싱글턴"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = openai.OpenAI(
+                    api_key=Config.get_api_key("openai"))
+    return _shared_client
+
+
+def _get_shared_async_client():
+    """비동기 OpenAI 클라이언트 — 실행 중인 이벤트 루프당 하나
+
+    asyncio.run은 호출마다 새 루프를 만들고 닫으므로, 클라이언트를 루프
+    경계 너머로 재사용하면 httpx 풀의 커넥션이 이미 닫힌 루프에 묶여
+    다음 호출이 'Event loop is closed' RuntimeError로 실패한다. 루프가
+    바뀌었으면 새 클라이언트를 만든다.
+    """
+    global _shared_async_client, _shared_async_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_async_client is None or _shared_async_client_loop is not loop:
+        with _shared_client_lock:
+            if _shared_async_client is None or _shared_async_client_loop is not loop:
+                _shared_async_client = openai.AsyncOpenAI(
+                    api_key=Config.get_api_key("openai"))
+                _shared_async_client_loop = loop
+    return _shared_async_client
+
+
+async def _close_shared_async_client():
+    """공유 비동기 클라이언트 정리 (루프가 닫히기 전에 호출)"""
+    global _shared_async_client, _shared_async_client_loop
+    with _shared_client_lock:
+        client, _shared_async_client = _shared_async_client, None
+        _shared_async_client_loop = None
+    if client is not None:
+        await client.close()
+
+
 class OpenAIAPI:
     """OpenAI API를 사용한 법률 문서 분석 클래스"""
-    
+
     def __init__(self):
-        self.client = openai.OpenAI(api_key=Config.get_api_key("openai"))
+        self.client = _get_shared_client()
         self.model = Config.OPENAI_MODEL
         self.max_tokens = Config.MAX_TOKENS
         self.temperature = Config.TEMPERATURE
-    
+
+    # JSON 모드 호출 앞에 붙는 고정 system 메시지
+    _SYS_JSON_ONLY = {"role": "system",
+                      "content": "반드시 유효한 JSON으로만 응답하세요."}
+
+    # 호출마다 user 메시지에 반복 전송되던 고정 지시문을 system 메시지로
+    # 분리 — 접두사가 안정되어야 OpenAI 프롬프트 캐시(프리픽스 단위)가
+    # 적중하고, 반복 토큰 비용/지연이 줄어든다
+    _SYS_SUMMARIZE = """다음 판례를 요약해주세요. 핵심 내용을 포함하여 간결하게 정리해주세요.
+
+다음 형식으로 요약해주세요:
+1. 사건 개요
+2. 적용 법령
+3. 판결 결과 (형량)
+4. 주요 쟁점
+5. 판결 의미"""
+
+    _SYS_ANALYZE = """다음 사건을 분석하여 핵심 요소를 추출해주세요.
+
+다음 JSON 형식으로 분석 결과를 제공해주세요:
+{
+    "crime_types": ["추정되는 범죄 유형들"],
+    "key_facts": ["주요 사실들"],
+    "applicable_laws": ["적용 가능한 법령들"],
+    "keywords": ["검색에 유용한 키워드들"],
+    "victim_damages": ["피해 내용"],
+    "evidence_needed": ["필요한 증거들"],
+    "estimated_punishment": "예상 형량",
+    "case_severity": "경중 판단 (경미/보통/중대)"
+}"""
+
+    _SYS_COMPARE = """다음 두 사건을 비교 분석해주세요.
+
+다음 JSON 형식으로 비교 결과를 제공해주세요:
+{
+    "similarity_score": "유사도 점수 (0-100)",
+    "similarities": ["유사한 점들"],
+    "differences": ["차이점들"],
+    "applicable_precedent": "이 판례가 적용 가능한지 여부 (true/false)",
+    "expected_outcome": "예상 결과",
+    "legal_reasoning": "법적 근거",
+    "recommendations": ["권고사항들"]
+}"""
+
+    _SYS_REPORT = """다음 정보를 바탕으로 종합 분석 리포트를 작성해주세요.
+
+다음 구조로 리포트를 작성해주세요:
+
+# 🔍 사건 분석 결과
+
+## 📋 사건 개요
+[사건의 핵심 내용 요약]
+
+## ⚖️ 적용 가능한 법령
+[관련 법령들과 해당 조항들]
+
+## 📊 유사 판례 분석
+[각 판례별 유사도와 시사점]
+
+## 🎯 예상 결과
+[형량 예측과 근거]
+
+## 💡 법적 조언
+[권고사항과 대응 방안]
+
+## 📈 위자료 관련
+[위자료 청구 가능성과 예상 금액]
+
+리포트는 구체적이고 실용적으로 작성해주세요."""
+
+    _SYS_KEYWORDS = """다음 텍스트에서 법률 검색에 유용한 키워드들을 추출해주세요.
+
+범죄 유형, 법령, 행위, 피해 등과 관련된 키워드를 다음 JSON 형식으로 제공해주세요:
+{"keywords": ["키워드1", "키워드2", "키워드3", ...]}"""
+
+    _SYS_PUNISHMENT = """다음 정보를 바탕으로 형량을 예측해주세요.
+
+다음 JSON 형식으로 예측 결과를 제공해주세요:
+{
+    "min_punishment": "최소 예상 형량",
+    "max_punishment": "최대 예상 형량",
+    "most_likely": "가장 가능성 높은 형량",
+    "factors": ["형량에 영향을 미치는 요인들"],
+    "mitigation_factors": ["감경 요인들"],
+    "aggravation_factors": ["가중 요인들"],
+    "confidence": "예측 신뢰도 (0-100)"
+}"""
+
+    _SYS_QUESTION_ANALYZE = """법률 질문과 기존 답변을 분석하여 추가적인 인사이트를 제공해주세요.
+
+다음 관점에서 추가 분석을 해주세요:
+1. 기존 답변의 핵심 포인트 요약
+2. 추가로 고려해야 할 법적 쟁점
+3. 실무상 주의사항
+4. 관련 법령이나 판례 추천
+
+한국 법률 전문가의 관점에서 답변해주세요."""
+
+    _SYS_ANSWER = """법률 질문에 대해 한국 법률을 기준으로 답변해주세요.
+
+답변 시 다음 사항을 포함해주세요:
+1. 관련 법령 및 조항
+2. 일반적인 법적 해석
+3. 실무상 고려사항
+4. 주의사항 및 면책조항
+
+반드시 "이 답변은 일반적인 정보 제공 목적이며, 구체적인 법률 조언은 전문 변호사와 상담하시기 바랍니다."라는 면책 조항을 포함해주세요."""
+
+    @staticmethod
+    def _cap_max_tokens(model: str, messages: List[Dict],
+                        max_tokens: int) -> int:
+        """
+        max_tokens를 컨텍스트 잔여분에 맞춰 제한
+
+        하드코딩된 예산이 컨텍스트 창을 넘으면 context_length_exceeded
+        400으로 호출 자체가 버려진다. 프롬프트 토큰 수를 세어
+        모델 창 - 프롬프트 - 여유분 이내로 줄인다.
+        """
+        try:
+            encoding = _get_encoding(model)
+            prompt_tokens = sum(
+                len(encoding.encode(m.get("content", ""))) for m in messages
+            ) + 8 * len(messages)  # 역할/구분 토큰 여유분
+            ctx = _MODEL_CTX.get(model, _DEFAULT_CTX)
+            return max(1, min(max_tokens, ctx - prompt_tokens - 8))
+        except Exception:
+            return max_tokens
+
+    @staticmethod
+    def _cache_key(model: str, messages: List[Dict],
+                   max_tokens: int, temperature: float,
+                   json_mode: bool = False) -> str:
+        """모델·메시지·파라미터의 SHA256 해시를 캐시 키로 사용"""
+        return hashlib.sha256(json.dumps(
+            [model, messages, max_tokens, temperature, json_mode],
+            ensure_ascii=False, sort_keys=True
+        ).encode('utf-8')).hexdigest()
+
+    def _chat(self, messages: List[Dict], model: str = None,
+              max_tokens: int = None, temperature: float = None,
+              json_mode: bool = False) -> str:
+        """
+        응답 캐시를 거치는 chat completion 공통 경로
+
+        동일한 요청은 네트워크를 타지 않고 즉시 반환된다.
+        json_mode=True면 OpenAI JSON 모드를 켜서 산문 접두사로 인한
+        json.loads 실패(조용히 폴백 딕셔너리로 끝나던 낭비)를 제거한다.
+        """
+        messages = [_LEGAL_SYSTEM_MSG] + messages
+        model = model or self.model
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = self._cap_max_tokens(model, messages, max_tokens)
+
+        key = self._cache_key(model, messages, max_tokens, temperature, json_mode)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        kwargs = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+            # 공통 프리앰블 뒤에 삽입해 프리픽스 공유를 깨지 않는다
+            messages = messages[:1] + [self._SYS_JSON_ONLY] + messages[1:]
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                response = self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(min(30, 2 ** attempt))
+        content = response.choices[0].message.content
+        _cache_put(key, content)
+        return content
+
+    def _chat_stream(self, messages: List[Dict], model: str = None,
+                     max_tokens: int = None, temperature: float = None):
+        """
+        스트리밍 chat completion — 토큰이 도착하는 대로 yield한다
+
+        전체 생성(수 초~수십 초)을 기다리지 않고 첫 토큰부터 UI에 흘려보낼
+        수 있어 체감 지연이 크게 줄어든다. 캐시 적중 시에는 전체 문자열을
+        한 번에 yield하고, 완주한 스트림은 합쳐서 캐시에 저장한다.
+        """
+        messages = [_LEGAL_SYSTEM_MSG] + messages
+        model = model or self.model
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = self._cap_max_tokens(model, messages, max_tokens)
+
+        key = self._cache_key(model, messages, max_tokens, temperature)
+        cached = _cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                response = self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True
+                )
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(min(30, 2 ** attempt))
+        parts = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content or ""
+            if delta:
+                parts.append(delta)
+                yield delta
+        _cache_put(key, "".join(parts))
+
+    def _ensure_async_client(self):
+        """비동기 클라이언트 지연 연결 (동시 호출 경로에서만 필요)
+
+        인스턴스에 캐싱하지 않는다 — 루프가 바뀌면 새 클라이언트가
+        필요하므로 루프별 공유 클라이언트를 매번 조회한다.
+        """
+        return _get_shared_async_client()
+
+    async def _chat_async(self, messages: List[Dict], model: str = None,
+                          max_tokens: int = None, temperature: float = None,
+                          json_mode: bool = False) -> str:
+        """_chat의 비동기 버전 — 동일한 응답 캐시를 공유한다"""
+        messages = [_LEGAL_SYSTEM_MSG] + messages
+        model = model or self.model
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = self._cap_max_tokens(model, messages, max_tokens)
+
+        key = self._cache_key(model, messages, max_tokens, temperature, json_mode)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        kwargs = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+            # 공통 프리앰블 뒤에 삽입해 프리픽스 공유를 깨지 않는다
+            messages = messages[:1] + [self._SYS_JSON_ONLY] + messages[1:]
+
+        client = self._ensure_async_client()
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+                break
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(30, 2 ** attempt))
+        content = response.choices[0].message.content
+        _cache_put(key, content)
+        return content
+
     def get_completion(self, prompt: str, temperature: float = None) -> str:
         """
         간단한 completion을 위한 메서드
-        
+
         Args:
             prompt: 요청할 프롬프트
             temperature: 온도 설정 (기본값: 클래스 기본값)
-            
+
         Returns:
             AI 응답 텍스트
         """
         try:
-            temp = temperature if temperature is not None else self.temperature
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=temp
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
+            return self._chat([{"role": "user", "content": prompt}],
+                              temperature=temperature)
+
+        except (openai.OpenAIError, ValueError) as e:
             print(f"OpenAI completion 오류: {e}")
             return f"API 요청 실패: {e}"
+
+    def get_completion_stream(self, prompt: str, temperature: float = None):
+        """
+        get_completion의 스트리밍 버전 (st.write_stream 등에 바로 전달 가능)
+
+        Yields:
+            생성되는 대로의 응답 토큰 문자열
+        """
+        try:
+            yield from self._chat_stream([{"role": "user", "content": prompt}],
+                                         temperature=temperature)
+        except (openai.OpenAIError, ValueError) as e:
+            print(f"OpenAI 스트리밍 오류: {e}")
+            yield f"API 요청 실패: {e}"
         
     def summarize_precedent(self, precedent: Dict) -> str:
         """
@@ -51,36 +458,23 @@ class OpenAIAPI:
             요약된 판례 문자열
         """
         try:
-            prompt = f"""
-다음 판례를 요약해주세요. 핵심 내용을 포함하여 간결하게 정리해주세요.
-
+            user_content = f"""
 판례명: {precedent.get('title', '')}
 사건번호: {precedent.get('case_number', '')}
 법원: {precedent.get('court', '')}
 선고일자: {precedent.get('date', '')}
 요약: {precedent.get('summary', '')}
-전문: {precedent.get('full_text', '')[:2000]}...
+전문: {self._truncate_to_tokens(precedent.get('full_text', ''), 800)}...
 관련조문: {precedent.get('law_provisions', '')}
 선고형량: {precedent.get('sentence', '')}
-
-다음 형식으로 요약해주세요:
-1. 사건 개요
-2. 적용 법령
-3. 판결 결과 (형량)
-4. 주요 쟁점
-5. 판결 의미
 """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
+
+            return self._chat([
+                {"role": "system", "content": self._SYS_SUMMARIZE},
+                {"role": "user", "content": user_content}
+            ])
+
+        except (openai.OpenAIError, ValueError) as e:
             print(f"판례 요약 오류: {e}")
             return "요약 생성에 실패했습니다."
     
@@ -95,47 +489,47 @@ class OpenAIAPI:
             분석 결과 딕셔너리
         """
         try:
-            prompt = f"""
-다음 사건을 분석하여 핵심 요소를 추출해주세요:
-
-사건 내용:
-{case_text}
+            result = json.loads(self._chat(self._analyze_messages(case_text),
+                                           json_mode=True))
+            return result
 
-다음 JSON 형식으로 분석 결과를 제공해주세요:
-{{
-    "crime_types": ["추정되는 범죄 유형들"],
-    "key_facts": ["주요 사실들"],
-    "applicable_laws": ["적용 가능한 법령들"],
-    "keywords": ["검색에 유용한 키워드들"],
-    "victim_damages": ["피해 내용"],
-    "evidence_needed": ["필요한 증거들"],
-    "estimated_punishment": "예상 형량",
-    "case_severity": "경중 판단 (경미/보통/중대)"
-}}
-"""
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
+        except (openai.OpenAIError, ValueError) as e:
+            print(f"사건 분석 오류: {e}")
+            return dict(self._ANALYZE_FALLBACK)
+
+    @classmethod
+    def _analyze_messages(cls, case_text: str) -> List[Dict]:
+        """사건 분석 메시지 구성 (고정 지시문은 system, 사건만 user)"""
+        return [
+            {"role": "system", "content": cls._SYS_ANALYZE},
+            {"role": "user", "content": f"사건 내용:\n{case_text}"}
+        ]
+
+    _ANALYZE_FALLBACK = {
+        "crime_types": [],
+        "key_facts": [],
+        "applicable_laws": [],
+        "keywords": [],
+        "victim_damages": [],
+        "evidence_needed": [],
+        "estimated_punishment": "분석 불가",
+        "case_severity": "판단 불가"
+    }
+
+    async def analyze_case_async(self, case_text: str) -> Dict:
+        """analyze_case의 비동기 버전
+
+        느린 OpenAI 분석과 법령/판례 HTTP 검색(law_api의 *_async 메서드)을
+        asyncio.gather로 묶어 동시에 진행할 수 있게 한다.
+        """
+        try:
+            return json.loads(
+                await self._chat_async(self._analyze_messages(case_text),
+                                       json_mode=True)
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            return result
-            
-        except Exception as e:
+        except (openai.OpenAIError, ValueError) as e:
             print(f"사건 분석 오류: {e}")
-            return {
-                "crime_types": [],
-                "key_facts": [],
-                "applicable_laws": [],
-                "keywords": [],
-                "victim_damages": [],
-                "evidence_needed": [],
-                "estimated_punishment": "분석 불가",
-                "case_severity": "판단 불가"
-            }
+            return dict(self._ANALYZE_FALLBACK)
     
     def compare_cases(self, my_case: str, precedent: Dict) -> Dict:
         """
@@ -149,9 +543,18 @@ class OpenAIAPI:
             비교 결과 딕셔너리
         """
         try:
-            prompt = f"""
-다음 두 사건을 비교 분석해주세요:
+            result = json.loads(self._chat(
+                self._compare_messages(my_case, precedent), json_mode=True))
+            return result
 
+        except (openai.OpenAIError, ValueError) as e:
+            print(f"사건 비교 오류: {e}")
+            return dict(self._COMPARE_FALLBACK)
+
+    @classmethod
+    def _compare_messages(cls, my_case: str, precedent: Dict) -> List[Dict]:
+        """사건-판례 비교 메시지 구성 (동기/비동기 경로 공용)"""
+        user_content = f"""
 내 사건:
 {my_case}
 
@@ -161,40 +564,59 @@ class OpenAIAPI:
 - 요약: {precedent.get('summary', '')}
 - 선고형량: {precedent.get('sentence', '')}
 - 관련조문: {precedent.get('law_provisions', '')}
-
-다음 JSON 형식으로 비교 결과를 제공해주세요:
-{{
-    "similarity_score": "유사도 점수 (0-100)",
-    "similarities": ["유사한 점들"],
-    "differences": ["차이점들"],
-    "applicable_precedent": "이 판례가 적용 가능한지 여부 (true/false)",
-    "expected_outcome": "예상 결과",
-    "legal_reasoning": "법적 근거",
-    "recommendations": ["권고사항들"]
-}}
 """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
+        return [
+            {"role": "system", "content": cls._SYS_COMPARE},
+            {"role": "user", "content": user_content}
+        ]
+
+    _COMPARE_FALLBACK = {
+        "similarity_score": "0",
+        "similarities": [],
+        "differences": [],
+        "applicable_precedent": False,
+        "expected_outcome": "분석 불가",
+        "legal_reasoning": "분석 실패",
+        "recommendations": []
+    }
+
+    async def compare_cases_async(self, my_case: str, precedent: Dict) -> Dict:
+        """compare_cases의 비동기 버전"""
+        try:
+            return json.loads(
+                await self._chat_async(
+                    self._compare_messages(my_case, precedent), json_mode=True)
             )
-            
-            result = json.loads(response.choices[0].message.content)
-            return result
-            
-        except Exception as e:
+        except (openai.OpenAIError, ValueError) as e:
             print(f"사건 비교 오류: {e}")
-            return {
-                "similarity_score": "0",
-                "similarities": [],
-                "differences": [],
-                "applicable_precedent": False,
-                "expected_outcome": "분석 불가",
-                "legal_reasoning": "분석 실패",
-                "recommendations": []
-            }
+            return dict(self._COMPARE_FALLBACK)
+
+    def compare_cases_many(self, my_case: str, precedents: List[Dict]) -> List[Dict]:
+        """
+        여러 판례와의 비교를 동시에 수행
+
+        판례별 비교는 서로 독립적인 네트워크 호출이므로 asyncio.gather로
+        병렬화하면 벽시계 시간이 판례 수에 비례해 줄어든다.
+        """
+        if not precedents:
+            return []
+
+        async def _run():
+            try:
+                return await asyncio.gather(
+                    *[self.compare_cases_async(my_case, prec)
+                      for prec in precedents]
+                )
+            finally:
+                # asyncio.run이 루프를 닫기 전에 풀 커넥션을 정리한다 —
+                # 닫힌 루프에 묶인 커넥션이 남으면 다음 호출이 실패한다
+                await _close_shared_async_client()
+
+        try:
+            return asyncio.run(_run())
+        except Exception as e:
+            print(f"판례 일괄 비교 오류: {e}")
+            return [self.compare_cases(my_case, prec) for prec in precedents]
     
     def generate_report(self, my_case: str, precedents: List[Dict], analysis: Dict) -> str:
         """
@@ -216,13 +638,11 @@ class OpenAIAPI:
 - 판례명: {prec.get('title', '')}
 - 사건번호: {prec.get('case_number', '')}
 - 선고형량: {prec.get('sentence', '')}
-- 요약: {prec.get('summary', '')[:200]}...
+- 요약: {self._truncate_to_tokens(prec.get('summary', ''), 150)}...
 """
                 precedent_summaries.append(summary)
             
-            prompt = f"""
-다음 정보를 바탕으로 종합 분석 리포트를 작성해주세요:
-
+            user_content = f"""
 내 사건:
 {my_case}
 
@@ -234,42 +654,14 @@ class OpenAIAPI:
 
 관련 판례들:
 {''.join(precedent_summaries)}
-
-다음 구조로 리포트를 작성해주세요:
-
-# 🔍 사건 분석 결과
-
-## 📋 사건 개요
-[사건의 핵심 내용 요약]
-
-## ⚖️ 적용 가능한 법령
-[관련 법령들과 해당 조항들]
-
-## 📊 유사 판례 분석
-[각 판례별 유사도와 시사점]
-
-## 🎯 예상 결과
-[형량 예측과 근거]
-
-## 💡 법적 조언
-[권고사항과 대응 방안]
-
-## 📈 위자료 관련
-[위자료 청구 가능성과 예상 금액]
-
-리포트는 구체적이고 실용적으로 작성해주세요.
 """
+
+            return self._chat([
+                {"role": "system", "content": self._SYS_REPORT},
+                {"role": "user", "content": user_content}
+            ])
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
+        except (openai.OpenAIError, ValueError) as e:
             print(f"리포트 생성 오류: {e}")
             return "리포트 생성에 실패했습니다."
     
@@ -284,28 +676,56 @@ class OpenAIAPI:
             키워드 리스트
         """
         try:
-            prompt = f"""
-다음 텍스트에서 법률 검색에 유용한 키워드들을 추출해주세요:
+            result = json.loads(self._chat(
+                [{"role": "system", "content": self._SYS_KEYWORDS},
+                 {"role": "user", "content": text}],
+                max_tokens=1000, temperature=0.3, json_mode=True
+            ))
+            return result.get("keywords", [])
+
+        except (openai.OpenAIError, ValueError) as e:
+            print(f"키워드 추출 오류: {e}")
+            return []
 
-{text}
+    _SYS_KEYWORDS_BATCH = """여러 텍스트에서 법률 검색에 유용한 키워드들을 추출해주세요.
 
-범죄 유형, 법령, 행위, 피해 등과 관련된 키워드를 JSON 배열 형태로 제공해주세요:
-["키워드1", "키워드2", "키워드3", ...]
-"""
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.3
+입력은 번호가 매겨진 텍스트 목록입니다. 텍스트별 키워드 배열을 입력과
+같은 순서로 다음 JSON 형식으로 제공해주세요:
+{"texts": [["키워드1", "키워드2", ...], ["키워드1", ...], ...]}"""
+
+    def extract_keywords_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        여러 텍스트의 키워드를 단일 호출로 일괄 추출
+
+        파이프라인에서 판례/청크마다 호출하면 N번의 왕복이 드는데,
+        번호 목록 하나로 묶으면 왕복 1번에 공통 지시문 토큰도 1회만 낸다.
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            입력 순서와 같은 텍스트별 키워드 리스트
+        """
+        if not texts:
+            return []
+        try:
+            numbered = "\n\n".join(
+                f"[{i}] {text}" for i, text in enumerate(texts, 1)
             )
-            
-            keywords = json.loads(response.choices[0].message.content)
-            return keywords
-            
+            result = json.loads(self._chat(
+                [{"role": "system", "content": self._SYS_KEYWORDS_BATCH},
+                 {"role": "user", "content": numbered}],
+                max_tokens=1000 * len(texts), temperature=0.3, json_mode=True
+            ))
+            keyword_lists = result.get("texts", [])
+            # 모델이 개수를 어기면 입력 길이에 맞춰 보정
+            keyword_lists = keyword_lists[:len(texts)]
+            keyword_lists += [[]] * (len(texts) - len(keyword_lists))
+            return keyword_lists
+
         except Exception as e:
-            print(f"키워드 추출 오류: {e}")
-            return []
+            print(f"키워드 일괄 추출 오류: {e}")
+            return [self.extract_keywords(text) for text in texts]
     
     def estimate_punishment(self, case_analysis: Dict, precedents: List[Dict]) -> Dict:
         """
@@ -324,9 +744,7 @@ class OpenAIAPI:
                 if prec.get('sentence'):
                     precedent_info.append(f"사건: {prec.get('title', '')}, 형량: {prec.get('sentence', '')}")
             
-            prompt = f"""
-다음 정보를 바탕으로 형량을 예측해주세요:
-
+            user_content = f"""
 사건 분석:
 - 범죄 유형: {', '.join(case_analysis.get('crime_types', []))}
 - 사건 경중: {case_analysis.get('case_severity', '')}
@@ -334,30 +752,15 @@ class OpenAIAPI:
 
 관련 판례 형량:
 {chr(10).join(precedent_info)}
-
-다음 JSON 형식으로 예측 결과를 제공해주세요:
-{{
-    "min_punishment": "최소 예상 형량",
-    "max_punishment": "최대 예상 형량",
-    "most_likely": "가장 가능성 높은 형량",
-    "factors": ["형량에 영향을 미치는 요인들"],
-    "mitigation_factors": ["감경 요인들"],
-    "aggravation_factors": ["가중 요인들"],
-    "confidence": "예측 신뢰도 (0-100)"
-}}
 """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            result = json.loads(response.choices[0].message.content)
+
+            result = json.loads(self._chat(
+                [{"role": "system", "content": self._SYS_PUNISHMENT},
+                 {"role": "user", "content": user_content}],
+                json_mode=True))
             return result
             
-        except Exception as e:
+        except (openai.OpenAIError, ValueError) as e:
             print(f"형량 예측 오류: {e}")
             return {
                 "min_punishment": "예측 불가",
@@ -370,73 +773,82 @@ class OpenAIAPI:
             }
     
     def _count_tokens(self, text: str) -> int:
-        """토큰 수를 계산하는 메서드"""
+        """토큰 수를 계산하는 메서드 (인스턴스 간 공유되는 캐시 인코딩 사용)"""
+        try:
+            return len(_get_encoding(self.model).encode(text))
+        except Exception:
+            return len(text) // 4  # 대략적인 추정
+
+    def _truncate_to_tokens(self, text: str, n_tokens: int) -> str:
+        """
+        텍스트를 토큰 수 기준으로 자르는 메서드
+
+        한국어는 글자 수와 토큰 수의 비율이 들쭉날쭉해서 문자 슬라이스로는
+        프롬프트 예산을 지키기 어렵다. 토큰 id를 잘라 다시 디코딩한다.
+        """
+        if not text:
+            return text
         try:
-            encoding = tiktoken.encoding_for_model(self.model)
-            return len(encoding.encode(text))
+            encoding = _get_encoding(self.model)
+            tokens = encoding.encode(text)
+            if len(tokens) <= n_tokens:
+                return text
+            return encoding.decode(tokens[:n_tokens])
         except Exception:
-            return len(text) // 4  # 대략적인 추정 
+            return text[:n_tokens * 2]  # 대략적인 폴백 (토큰당 ~2자)
 
     def analyze_legal_question(self, question: str, existing_answer: str, context: str) -> str:
         """법률 질문에 대한 AI 추가 분석"""
         try:
-            prompt = f"""
-다음 법률 질문과 기존 답변을 분석하여 추가적인 인사이트를 제공해주세요:
-
+            user_content = f"""
 **질문**: {question}
 
 **기존 답변**: {existing_answer}
 
 **관련 맥락**: {context}
-
-다음 관점에서 추가 분석을 해주세요:
-1. 기존 답변의 핵심 포인트 요약
-2. 추가로 고려해야 할 법적 쟁점
-3. 실무상 주의사항
-4. 관련 법령이나 판례 추천
-
-한국 법률 전문가의 관점에서 답변해주세요.
 """
-            
-            response = self.client.chat.completions.create(
+
+            return self._chat(
+                [{"role": "system", "content": self._SYS_QUESTION_ANALYZE},
+                 {"role": "user", "content": user_content}],
                 model="gpt-4-turbo-preview",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                temperature=0.3
-            )
+                max_tokens=1000, temperature=0.3)
             
-            return response.choices[0].message.content
-            
-        except Exception as e:
+        except (openai.OpenAIError, ValueError) as e:
             print(f"법률 질문 분석 오류: {e}")
             return f"분석 중 오류가 발생했습니다: {str(e)}"
     
+    @classmethod
+    def _answer_messages(cls, question: str) -> List[Dict]:
+        """법률 질문 답변 메시지 구성 (동기/스트리밍 경로 공용)"""
+        return [
+            {"role": "system", "content": cls._SYS_ANSWER},
+            {"role": "user", "content": f"**질문**: {question}"}
+        ]
+
     def answer_legal_question(self, question: str) -> str:
         """법률 질문에 대한 일반적인 AI 답변"""
         try:
-            prompt = f"""
-다음 법률 질문에 대해 한국 법률을 기준으로 답변해주세요:
-
-**질문**: {question}
+            return self._chat(
+                self._answer_messages(question),
+                model="gpt-4-turbo-preview",
+                max_tokens=1500, temperature=0.3)
+            
+        except (openai.OpenAIError, ValueError) as e:
+            print(f"법률 질문 답변 오류: {e}")
+            return f"답변 생성 중 오류가 발생했습니다: {str(e)}"
 
-답변 시 다음 사항을 포함해주세요:
-1. 관련 법령 및 조항
-2. 일반적인 법적 해석
-3. 실무상 고려사항
-4. 주의사항 및 면책조항
+    def answer_legal_question_stream(self, question: str):
+        """answer_legal_question의 스트리밍 버전
 
-반드시 "이 답변은 일반적인 정보 제공 목적이며, 구체적인 법률 조언은 전문 변호사와 상담하시기 바랍니다."라는 면책 조항을 포함해주세요.
-"""
-            
-            response = self.client.chat.completions.create(
+        Yields:
+            생성되는 대로의 답변 토큰 문자열
+        """
+        try:
+            yield from self._chat_stream(
+                self._answer_messages(question),
                 model="gpt-4-turbo-preview",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1500,
-                temperature=0.3
-            )
-            
-            return response.choices[0].message.content
-            
-        except Exception as e:
+                max_tokens=1500, temperature=0.3)
+        except (openai.OpenAIError, ValueError) as e:
             print(f"법률 질문 답변 오류: {e}")
-            return f"답변 생성 중 오류가 발생했습니다: {str(e)}" 
\ No newline at end of file
+            yield f"답변 생성 중 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
-import json
+import numpy as np
+import asyncio
+import hashlib
+import html
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 
@@ -10,18 +14,14 @@ from typing import List, Dict, Optional
 warnings.filterwarnings("ignore")
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
-# PyTorch 관련 경고 억제
 import sys
-if 'torch' in sys.modules:
-    import torch
-    torch.set_num_threads(1)
 
 # 보안을 위해 디버깅 정보 제거됨
 
 # 커스텀 모듈 임포트
+# (api/utils는 torch·sentence-transformers·faiss를 끌고 들어오므로
+#  앱 시작 시점이 아니라 init_components에서 지연 임포트한다)
 from config import Config
-from api import LawAPI, OpenAIAPI
-from utils import FileProcessor, TextAnalyzer
 
 # 페이지 설정
 st.set_page_config(
@@ -34,7 +34,21 @@ st.set_page_config(
 # 전역 변수
 @st.cache_resource
 def init_components():
-    """컴포넌트 초기화"""
+    """컴포넌트 초기화 (무거운 모듈은 이 시점에 지연 임포트)
+
+    st.cache_resource로 감싸므로 LawAPI/OpenAIAPI 인스턴스는 프로세스당
+    한 번만 생성된다 — rerun·페이지 전환 시에도 같은 객체가 재사용되어
+    내부 커넥션 풀(requests.Session / OpenAI 클라이언트)의 keep-alive
+    연결이 유지된다.
+    """
+    from api import LawAPI, OpenAIAPI
+    from utils import FileProcessor, TextAnalyzer
+
+    # PyTorch 관련 설정
+    if 'torch' in sys.modules:
+        import torch
+        torch.set_num_threads(1)
+
     try:
         # 🔧 임시: config 검증을 건너뛰고 강제로 초기화 시도
         st.sidebar.write("🔄 컴포넌트 초기화 시도 중...")
@@ -63,6 +77,162 @@ def init_components():
 
 # 세션 상태는 main() 함수 내에서 초기화됨
 
+# 세션당 검색 기록 보관 상한 — rerun마다 직렬화되는 세션 상태가
+# 무한정 커지지 않도록 오래된 항목부터 버린다
+_SEARCH_HISTORY_MAX = 100
+
+# 법률 유형 selectbox 표시 라벨 (format_func가 옵션마다 호출되므로
+# rerun마다 dict를 새로 만들지 않도록 모듈 상수로 둔다)
+_LAW_TYPE_LABELS = {
+    "all": "전체",
+    "criminal": "형사법",
+    "civil": "민사법",
+    "administrative": "행정법",
+}
+
+# LLM/검색 호출 결과 캐시
+# 같은 질의를 다시 제출해도 임베딩·LLM 호출을 반복하지 않도록
+# Streamlit 캐시로 감싼다. 첫 번째 인자는 언더스코어(_)로 시작하므로
+# 해시 대상에서 제외되고, "🗑️ 세션 초기화" 버튼에서 일괄 무효화된다.
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_enhanced_analysis(_law_api, case_input: str) -> Dict:
+    return _law_api.get_enhanced_case_analysis(case_input)
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_interpretation(_law_api, question: str) -> Dict:
+    return _law_api.get_legal_interpretation(question)
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_similar_precedents(_law_api, query: str, case_type: Optional[str]) -> List[Dict]:
+    return _law_api.search_similar_precedents(query, case_type=case_type)
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_question_analysis(_openai_api, question: str, answer: str, context: str) -> str:
+    return _openai_api.analyze_legal_question(question, answer, context)
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
+def _cached_legal_answer(_openai_api, question: str) -> str:
+    return _openai_api.answer_legal_question(question)
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _process_file(_file_processor, sha: str, name: str, _data: bytes) -> Dict:
+    # sha가 캐시 키 역할을 하므로 파일 원본(_data)은 해시 대상에서 제외
+    return _file_processor.process_uploaded_file(_data, name)
+
+def _analyze_case_bundle(openai_api, text_analyzer, case_text: str):
+    """사건 분석에 필요한 세 작업(AI 분석·구조 분석·키워드 추출)을 동시 실행
+
+    서로 독립적인 작업이므로 asyncio.gather로 병렬 실행해 전체 지연을
+    가장 느린 호출 하나 수준으로 줄인다. 실패 시 순차 실행으로 폴백.
+    """
+    async def _gather():
+        return await asyncio.gather(
+            openai_api.analyze_case_async(case_text),
+            asyncio.to_thread(text_analyzer.analyze_text_structure, case_text),
+            asyncio.to_thread(openai_api.extract_keywords, case_text),
+        )
+
+    try:
+        analysis, structure, keywords = asyncio.run(_gather())
+    except Exception:
+        # 폴백: 순차 실행
+        analysis = openai_api.analyze_case(case_text)
+        structure = text_analyzer.analyze_text_structure(case_text)
+        keywords = openai_api.extract_keywords(case_text)
+
+    return analysis, structure, keywords
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_case_bundle(_openai_api, _text_analyzer, case_text: str):
+    return _analyze_case_bundle(_openai_api, _text_analyzer, case_text)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_search_laws(_law_api, keyword: str, law_type: str) -> List[Dict]:
+    return _law_api.search_law_by_keyword(keyword, law_type)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_law_article(_law_api, law_name: str, article_number: str) -> Dict:
+    return _law_api.get_law_article(law_name, article_number)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_citation(_law_api, citation: str) -> Dict:
+    return _law_api.validate_legal_citation(citation)
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def _cached_related_laws(_law_api, law_reference: str) -> List[Dict]:
+    # 법령-조문 쌍의 관련 법률은 세션 내에서 사실상 불변이므로 길게 캐시
+    return _law_api.get_related_laws(law_reference)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _api_status_snapshot() -> Dict[str, bool]:
+    """서비스별 API 설정 여부를 한 번에 조회 (60초 캐시)"""
+    return {
+        service: Config.is_api_configured(service)
+        for service in ("openai", "law", "case_search", "kakao")
+    }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _data_sources_snapshot() -> List[str]:
+    return Config.get_data_sources()
+
+def _report_bundle(openai_api, case_text: str, precedents: List[Dict], analysis: Dict):
+    """리포트 생성과 형량 예측을 동시 실행
+
+    서로 의존성이 없는 두 OpenAI 호출이므로 스레드 풀에서 병렬로
+    보내 전체 대기 시간을 둘 중 느린 호출 수준으로 줄인다.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        report_future = pool.submit(
+            openai_api.generate_report, case_text, precedents, analysis
+        )
+        punishment_future = pool.submit(
+            openai_api.estimate_punishment, analysis, precedents
+        )
+        return report_future.result(), punishment_future.result()
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def _cached_report_bundle(_openai_api, case_text: str, precedents: List[Dict], analysis: Dict):
+    return _report_bundle(_openai_api, case_text, precedents, analysis)
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def _report_download_bytes(report: str, punishment_prediction: Dict) -> bytes:
+    """다운로드용 리포트 텍스트 조립·인코딩
+
+    청크 리스트를 한 번 join하고 utf-8로 한 번만 인코딩한다.
+    (report, punishment_prediction) 기준으로 캐시되므로 rerun마다
+    같은 문자열을 다시 조립하지 않는다.
+    """
+    chunks = [
+        "판례 검색 & 사건 분석 리포트",
+        "==============================",
+        "",
+        f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        report,
+        "",
+        "형량 예측 결과:",
+        f"- 최소 예상 형량: {punishment_prediction.get('min_punishment', '예측 불가')}",
+        f"- 최대 예상 형량: {punishment_prediction.get('max_punishment', '예측 불가')}",
+        f"- 가장 가능성 높은 형량: {punishment_prediction.get('most_likely', '예측 불가')}",
+        f"- 예측 신뢰도: {punishment_prediction.get('confidence', '0')}%",
+        "",
+    ]
+    return "\n".join(chunks).encode("utf-8")
+
+def _topk_indices(scores: np.ndarray, min_score: float, k: int) -> np.ndarray:
+    """점수 배열에서 min_score 이상 상위 k개 인덱스를 내림차순으로 반환"""
+    k = min(k, len(scores))
+    if not k:
+        return np.empty(0, dtype=np.intp)
+    top_idx = np.argpartition(-scores, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-scores[top_idx])]
+    return top_idx[scores[top_idx] >= min_score]
+
+def _use_cache() -> bool:
+    """사이드바의 캐시 사용 여부 설정을 반환"""
+    return st.session_state.get('use_cache', True)
+
+@st.fragment
 def show_enhanced_case_analysis(law_api, openai_api):
     """🚀 향상된 사건 분석 (형사법 LLM 데이터 활용)"""
     st.header("🚀 AI 기반 종합 사건 분석")
@@ -96,8 +266,11 @@ def show_enhanced_case_analysis(law_api, openai_api):
         
         with st.spinner("AI가 종합 분석 중입니다..."):
             try:
-                # 향상된 사건 분석 실행
-                analysis_result = law_api.get_enhanced_case_analysis(case_input)
+                # 향상된 사건 분석 실행 (캐시 사용 시 동일 질의 재호출 생략)
+                if _use_cache():
+                    analysis_result = _cached_enhanced_analysis(law_api, case_input)
+                else:
+                    analysis_result = law_api.get_enhanced_case_analysis(case_input)
                 
                 if 'error' in analysis_result:
                     st.error(f"분석 중 오류 발생: {analysis_result['error']}")
@@ -187,6 +360,7 @@ def show_enhanced_case_analysis(law_api, openai_api):
             except Exception as e:
                 st.error(f"분석 중 오류가 발생했습니다: {e}")
 
+@st.fragment
 def show_vector_search(law_api, openai_api):
     """🔍 고급 벡터 검색"""
     st.header("🔍 AI 벡터 유사 사례 검색")
@@ -218,64 +392,107 @@ def show_vector_search(law_api, openai_api):
         if not search_query.strip():
             st.error("검색 쿼리를 입력해주세요.")
             return
-        
+
         with st.spinner("AI가 유사 사례를 검색 중입니다..."):
             try:
-                # 벡터 검색 실행
+                # 벡터 검색 실행 — 원본 결과를 세션에 저장해두고
+                # 유사도/결과 수 필터는 아래에서 파이썬으로만 적용한다.
+                # (슬라이더 조정에 의한 rerun 시 백엔드를 다시 호출하지 않음)
                 search_type = None if case_type == "전체" else case_type
-                results = law_api.search_similar_precedents(
-                    search_query, 
-                    case_type=search_type
+                if _use_cache():
+                    results = _cached_similar_precedents(law_api, search_query, search_type)
+                else:
+                    results = law_api.search_similar_precedents(
+                        search_query,
+                        case_type=search_type
+                    )
+                # SoA 저장: 메타데이터 리스트와 점수 배열을 분리해두면
+                # rerun마다 dict 순회 없이 numpy 연산만으로 필터링 가능
+                st.session_state.vector_results = results
+                st.session_state.vector_scores = np.fromiter(
+                    (r.get('similarity_score', 0) for r in results),
+                    dtype=np.float32,
+                    count=len(results)
                 )
-                
-                # 유사도 필터링
-                filtered_results = [
-                    r for r in results 
-                    if r.get('similarity_score', 0) >= min_similarity
-                ][:num_results]
-                
-                if not filtered_results:
-                    st.warning("검색 조건에 맞는 결과가 없습니다. 조건을 완화해보세요.")
-                    return
-                
-                st.success(f"✅ {len(filtered_results)}건의 유사 사례를 찾았습니다!")
-                
-                # 결과 표시
-                for i, result in enumerate(filtered_results, 1):
-                    with st.expander(
-                        f"🏛️ 사례 {i} - {result.get('case_type', 'Unknown')} "
-                        f"(유사도: {result.get('similarity_score', 0):.3f})"
-                    ):
-                        # 기본 정보
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write(f"**사건번호:** {result.get('case_id', 'N/A')}")
-                            st.write(f"**사건 유형:** {result.get('case_type', 'Unknown')}")
-                            st.write(f"**출처:** {result.get('source', 'Unknown')}")
-                        
-                        with col2:
-                            st.metric("유사도", f"{result.get('similarity_score', 0):.3f}")
-                            st.metric("순위", result.get('rank', 'N/A'))
-                        
-                        # 내용
-                        if result.get('query'):
-                            st.write(f"**질의/제목:** {result['query']}")
-                        
-                        if result.get('answer'):
-                            st.write(f"**답변/판시사항:** {result['answer']}")
-                        
-                        if result.get('summary'):
-                            st.write(f"**요약:** {result['summary']}")
-                        
-                        # 전문 보기
-                        if result.get('full_text'):
-                            with st.expander("📄 전문 보기"):
-                                st.text(result['full_text'])
-                
             except Exception as e:
                 st.error(f"검색 중 오류가 발생했습니다: {e}")
+                return
+
+    # 검색 결과 표시 (저장된 결과에 슬라이더 필터만 적용)
+    results = st.session_state.get('vector_results')
+    if results is not None:
+        # 유사도 필터링 — 전체 정렬 대신 argpartition으로 상위 k개만 선별
+        scores = st.session_state.get('vector_scores')
+        if scores is None or len(scores) != len(results):
+            scores = np.fromiter(
+                (r.get('similarity_score', 0) for r in results),
+                dtype=np.float32,
+                count=len(results)
+            )
+        filtered_results = [
+            results[i] for i in _topk_indices(scores, min_similarity, num_results)
+        ]
+
+        if not filtered_results:
+            st.warning("검색 조건에 맞는 결과가 없습니다. 조건을 완화해보세요.")
+            return
+
+        st.success(f"✅ {len(filtered_results)}건의 유사 사례를 찾았습니다!")
 
+        # 결과 표시 — 건마다 expander를 만들지 않고 단일 dataframe으로
+        # 렌더링해 rerun당 위젯 수를 O(N)에서 O(1)로 줄인다
+        result_df = pd.DataFrame([
+            {
+                '사건번호': r.get('case_id', 'N/A'),
+                '사건 유형': r.get('case_type', 'Unknown'),
+                '유사도': round(r.get('similarity_score', 0), 3),
+                '출처': r.get('source', 'Unknown'),
+                '질의/제목': r.get('query', ''),
+            }
+            for r in filtered_results
+        ])
+        event = st.dataframe(
+            result_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select='rerun',
+            selection_mode='single-row'
+        )
+
+        # 선택한 행의 상세 정보만 렌더링
+        if event.selection.rows:
+            result = filtered_results[event.selection.rows[0]]
+
+            # 기본 정보
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.write(f"**사건번호:** {result.get('case_id', 'N/A')}")
+                st.write(f"**사건 유형:** {result.get('case_type', 'Unknown')}")
+                st.write(f"**출처:** {result.get('source', 'Unknown')}")
+
+            with col2:
+                st.metric("유사도", f"{result.get('similarity_score', 0):.3f}")
+                st.metric("순위", result.get('rank', 'N/A'))
+
+            # 내용
+            if result.get('query'):
+                st.write(f"**질의/제목:** {result['query']}")
+
+            if result.get('answer'):
+                st.write(f"**답변/판시사항:** {result['answer']}")
+
+            if result.get('summary'):
+                st.write(f"**요약:** {result['summary']}")
+
+            # 전문 보기
+            if result.get('full_text'):
+                with st.expander("📄 전문 보기"):
+                    st.text(result['full_text'])
+        else:
+            st.caption("표에서 행을 선택하면 상세 정보가 표시됩니다.")
+
+@st.fragment
 def show_legal_qa(law_api, openai_api):
     """❓ 법률 질의응답"""
     st.header("❓ AI 법률 질의응답")
@@ -309,7 +526,10 @@ def show_legal_qa(law_api, openai_api):
         with st.spinner("AI가 법률 데이터를 검색하고 답변을 준비 중입니다..."):
             try:
                 # 법률 해석 검색
-                interpretation = law_api.get_legal_interpretation(legal_question)
+                if _use_cache():
+                    interpretation = _cached_interpretation(law_api, legal_question)
+                else:
+                    interpretation = law_api.get_legal_interpretation(legal_question)
                 
                 if interpretation.get('answer'):
                     st.success("✅ 관련 법률 해석을 찾았습니다!")
@@ -342,11 +562,19 @@ def show_legal_qa(law_api, openai_api):
                     st.subheader("🤖 AI 추가 분석")
                     with st.spinner("OpenAI가 추가 분석 중..."):
                         try:
-                            ai_analysis = openai_api.analyze_legal_question(
-                                legal_question,
-                                interpretation.get('answer', ''),
-                                interpretation.get('context', '')
-                            )
+                            if _use_cache():
+                                ai_analysis = _cached_question_analysis(
+                                    openai_api,
+                                    legal_question,
+                                    interpretation.get('answer', ''),
+                                    interpretation.get('context', '')
+                                )
+                            else:
+                                ai_analysis = openai_api.analyze_legal_question(
+                                    legal_question,
+                                    interpretation.get('answer', ''),
+                                    interpretation.get('context', '')
+                                )
                             
                             if ai_analysis:
                                 st.write(ai_analysis)
@@ -361,7 +589,10 @@ def show_legal_qa(law_api, openai_api):
                     st.subheader("🤖 AI 일반 답변")
                     with st.spinner("OpenAI가 답변을 생성 중..."):
                         try:
-                            ai_answer = openai_api.answer_legal_question(legal_question)
+                            if _use_cache():
+                                ai_answer = _cached_legal_answer(openai_api, legal_question)
+                            else:
+                                ai_answer = openai_api.answer_legal_question(legal_question)
                             if ai_answer:
                                 st.write(ai_answer)
                                 st.warning("⚠️ 이 답변은 AI가 생성한 일반적인 정보입니다. 정확한 법률 조언은 전문가와 상담하세요.")
@@ -387,17 +618,6 @@ def main():
     st.title("⚖️ 판례 검색 & 사건 분석 에이전트")
     st.markdown("---")
     
-    # 컴포넌트 초기화
-    law_api, openai_api, file_processor, text_analyzer = init_components()
-    
-    # 🔧 임시: 부분 초기화도 허용
-    if not any([law_api, file_processor, text_analyzer]):
-        st.error("시스템 초기화에 완전히 실패했습니다. 설정을 확인해주세요.")
-        return
-    
-    if not openai_api:
-        st.warning("⚠️ OpenAI API가 초기화되지 않았습니다. 일부 기능이 제한됩니다.")
-    
     # 사이드바 메뉴
     with st.sidebar:
         st.header("🔧 메뉴")
@@ -419,29 +639,45 @@ def main():
         
         # 빠른 액션
         st.subheader("🚀 빠른 액션")
+        st.session_state.use_cache = st.checkbox(
+            "⚡ 결과 캐시 사용",
+            value=st.session_state.get('use_cache', True),
+            help="동일한 질의를 다시 제출할 때 저장된 분석 결과를 재사용합니다."
+        )
         if st.button("🗑️ 세션 초기화"):
+            st.cache_data.clear()
             st.session_state.clear()
             st.rerun()
-    
-    # 메인 컨텐츠
-    if menu == "🏠 홈":
-        show_home()
-    elif menu == "📄 사건 분석":
-        show_case_analysis(openai_api, file_processor, text_analyzer)
-    elif menu == "🔍 판례 검색":
-        show_precedent_search(law_api, openai_api, text_analyzer)
-    elif menu == "✅ 법률 정보 검증":
-        show_legal_verification(law_api, openai_api)
-    elif menu == "🚀 종합 분석":
-        show_enhanced_case_analysis(law_api, openai_api)
-    elif menu == "🔍 벡터 검색":
-        show_vector_search(law_api, openai_api)
-    elif menu == "❓ 법률 Q&A":
-        show_legal_qa(law_api, openai_api)
-    elif menu == "📊 종합 리포트":
-        show_comprehensive_report(openai_api)
-    elif menu == "⚙️ 설정":
-        show_settings()
+
+    # 컴포넌트 초기화 — 홈/설정 화면은 모델·API 클라이언트가 필요 없으므로
+    # 해당 메뉴를 실제로 열었을 때만 무거운 로딩을 수행한다
+    law_api = openai_api = file_processor = text_analyzer = None
+    if menu not in ("🏠 홈", "⚙️ 설정"):
+        law_api, openai_api, file_processor, text_analyzer = init_components()
+
+        # 🔧 임시: 부분 초기화도 허용
+        if not any([law_api, file_processor, text_analyzer]):
+            st.error("시스템 초기화에 완전히 실패했습니다. 설정을 확인해주세요.")
+            return
+
+        if not openai_api:
+            st.warning("⚠️ OpenAI API가 초기화되지 않았습니다. 일부 기능이 제한됩니다.")
+
+    # 메인 컨텐츠 — 메뉴별 핸들러 디스패치 테이블
+    menu_handlers = {
+        "🏠 홈": show_home,
+        "📄 사건 분석": lambda: show_case_analysis(openai_api, file_processor, text_analyzer),
+        "🔍 판례 검색": lambda: show_precedent_search(law_api, openai_api, text_analyzer),
+        "✅ 법률 정보 검증": lambda: show_legal_verification(law_api, openai_api),
+        "🚀 종합 분석": lambda: show_enhanced_case_analysis(law_api, openai_api),
+        "🔍 벡터 검색": lambda: show_vector_search(law_api, openai_api),
+        "❓ 법률 Q&A": lambda: show_legal_qa(law_api, openai_api),
+        "📊 종합 리포트": lambda: show_comprehensive_report(openai_api),
+        "⚙️ 설정": show_settings,
+    }
+    handler = menu_handlers.get(menu)
+    if handler:
+        handler()
 
 def show_home():
     """홈 페이지"""
@@ -505,9 +741,10 @@ def show_case_analysis(openai_api, file_processor, text_analyzer):
         )
         
         if uploaded_file is not None:
-            # 파일 처리
+            # 파일 처리 (내용 해시 기준 캐시 — rerun마다 PDF 재파싱 방지)
             file_data = uploaded_file.read()
-            result = file_processor.process_uploaded_file(file_data, uploaded_file.name)
+            file_sha = hashlib.sha256(file_data).hexdigest()
+            result = _process_file(file_processor, file_sha, uploaded_file.name, file_data)
             
             if result['success']:
                 case_text = result['content']
@@ -520,14 +757,15 @@ def show_case_analysis(openai_api, file_processor, text_analyzer):
     if case_text and st.button("🔍 사건 분석 실행"):
         with st.spinner("사건을 분석 중입니다..."):
             try:
-                # AI 분석
-                analysis = openai_api.analyze_case(case_text)
-                
-                # 텍스트 구조 분석
-                structure_analysis = text_analyzer.analyze_text_structure(case_text)
-                
-                # 키워드 추출
-                keywords = openai_api.extract_keywords(case_text)
+                # AI 분석 + 구조 분석 + 키워드 추출을 병렬 실행
+                if _use_cache():
+                    analysis, structure_analysis, keywords = _cached_case_bundle(
+                        openai_api, text_analyzer, case_text
+                    )
+                else:
+                    analysis, structure_analysis, keywords = _analyze_case_bundle(
+                        openai_api, text_analyzer, case_text
+                    )
                 
                 # 결과 저장
                 st.session_state.case_analysis = {
@@ -607,11 +845,11 @@ def show_case_analysis(openai_api, file_processor, text_analyzer):
             keywords = st.session_state.case_analysis['keywords']
             
             if keywords:
-                # 키워드를 태그 형태로 표시
-                keyword_html = ""
-                for keyword in keywords:
-                    keyword_html += f'<span style="background-color: #e1f5fe; padding: 2px 8px; margin: 2px; border-radius: 12px; font-size: 12px;">{keyword}</span> '
-                
+                # 키워드를 태그 형태로 표시 (한 번의 join, 사용자 입력은 escape)
+                keyword_html = " ".join(
+                    f'<span style="background-color: #e1f5fe; padding: 2px 8px; margin: 2px; border-radius: 12px; font-size: 12px;">{html.escape(str(keyword))}</span>'
+                    for keyword in keywords
+                )
                 st.markdown(keyword_html, unsafe_allow_html=True)
             else:
                 st.write("키워드를 추출하지 못했습니다.")
@@ -680,24 +918,55 @@ def show_precedent_search(law_api, openai_api, text_analyzer):
     
     # 검색 실행
     if search_query and st.button("🔍 판례 검색"):
+        progress_slot = st.empty()
         with st.spinner("판례를 검색 중입니다..."):
             try:
-                # 1. 국가법령정보센터 API에서 판례 검색
-                precedents = law_api.search_precedents_with_openlaw_api(search_query, max_results)
-                
-                # 2. 국가법령정보센터에서 결과가 없으면 기존 API 사용
+                # 두 검색을 동시에 실행하고, 빠른 키워드 검색 결과를
+                # 먼저 표시한 뒤 국가법령정보센터 결과로 교체한다.
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    openlaw_future = pool.submit(
+                        law_api.search_precedents_with_openlaw_api, search_query, max_results
+                    )
+                    keyword_future = pool.submit(
+                        law_api.search_precedents, search_query, max_results
+                    )
+
+                    # 1차: 키워드 검색 결과를 즉시 표시
+                    try:
+                        quick_results = keyword_future.result()
+                    except Exception:
+                        quick_results = []
+
+                    if quick_results:
+                        with progress_slot.container():
+                            st.info(f"⏳ 1차 키워드 검색 결과 {len(quick_results)}건 — 국가법령정보센터 검색 진행 중...")
+                            for quick in quick_results[:3]:
+                                st.write(f"• {quick.get('title', '제목 없음')}")
+
+                    # 2차: 국가법령정보센터 결과가 있으면 우선 사용
+                    try:
+                        precedents = openlaw_future.result()
+                    except Exception:
+                        precedents = []
+
                 if not precedents:
-                    precedents = law_api.search_precedents(search_query, max_results)
-                
+                    precedents = quick_results
+
+                progress_slot.empty()
+
                 if precedents:
                     st.session_state.precedents = precedents
-                    
-                    # 검색 기록 저장
+                    st.session_state.precedent_sims = None
+
+                    # 검색 기록 저장 (최근 _SEARCH_HISTORY_MAX건만 유지)
                     st.session_state.search_history.append({
                         'query': search_query,
                         'result_count': len(precedents),
                         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                     })
+                    if len(st.session_state.search_history) > _SEARCH_HISTORY_MAX:
+                        st.session_state.search_history = \
+                            st.session_state.search_history[-_SEARCH_HISTORY_MAX:]
                     
                     st.success(f"✅ {len(precedents)}개의 판례를 찾았습니다!")
                     
@@ -705,15 +974,21 @@ def show_precedent_search(law_api, openai_api, text_analyzer):
                     if st.session_state.case_analysis:
                         case_text = st.session_state.case_analysis['text']
                         
-                        # 각 판례와 유사도 계산
-                        for precedent in precedents:
-                            prec_text = f"{precedent.get('title', '')} {precedent.get('summary', '')}"
-                            similarity = text_analyzer.calculate_similarity(case_text, prec_text)
-                            precedent['similarity'] = similarity
-                        
-                        # 유사도 순으로 정렬
-                        precedents.sort(key=lambda x: x.get('similarity', 0), reverse=True)
+                        # 전체 판례와 유사도 일괄 계산 (임베딩 1회 + 행렬 내적)
+                        prec_texts = [
+                            f"{p.get('title', '')} {p.get('summary', '')}"
+                            for p in precedents
+                        ]
+                        similarities = text_analyzer.calculate_similarity_batch(case_text, prec_texts)
+                        sims = np.asarray(similarities, dtype=np.float32)
+
+                        # 유사도 순으로 정렬 (연속 float32 배열에 대한 argsort)
+                        # — 점수는 캐시된 dict에 쓰지 않고 병렬 배열로 유지
+                        # (vector_results/vector_scores와 같은 SoA 패턴)
+                        order = np.argsort(-sims)
+                        precedents = [precedents[i] for i in order]
                         st.session_state.precedents = precedents
+                        st.session_state.precedent_sims = sims[order]
                     
                 else:
                     st.warning("⚠️ 검색 결과가 없습니다.")
@@ -725,46 +1000,350 @@ def show_precedent_search(law_api, openai_api, text_analyzer):
     if st.session_state.precedents:
         st.markdown("---")
         st.subheader("📊 검색 결과")
-        
-        for i, precedent in enumerate(st.session_state.precedents, 1):
-            with st.expander(f"📋 {i}. {precedent.get('title', '제목 없음')}", expanded=(i <= 3)):
-                
-                # 기본 정보
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write(f"**사건번호**: {precedent.get('case_number', '정보 없음')}")
-                    st.write(f"**법원**: {precedent.get('court', '정보 없음')}")
-                    st.write(f"**선고일자**: {precedent.get('date', '정보 없음')}")
+
+        precedents = st.session_state.precedents
+        sims = st.session_state.get('precedent_sims')
+
+        # 판례마다 expander/columns 위젯을 만들지 않고 단일 dataframe으로
+        # 렌더링 — rerun당 위젯 수가 O(N)에서 O(1)로 줄어든다
+        precedent_df = pd.DataFrame([
+            {
+                '제목': p.get('title', '제목 없음'),
+                '사건번호': p.get('case_number', '정보 없음'),
+                '법원': p.get('court', '정보 없음'),
+                '선고일자': p.get('date', '정보 없음'),
+                '유사도': round(float(sims[i]), 2) if sims is not None else None,
+            }
+            for i, p in enumerate(precedents)
+        ])
+        event = st.dataframe(
+            precedent_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select='rerun',
+            selection_mode='single-row'
+        )
+
+        # 선택한 행의 상세 정보만 렌더링
+        if event.selection.rows:
+            idx = event.selection.rows[0]
+            precedent = precedents[idx]
+
+            # 기본 정보
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.write(f"**사건번호**: {precedent.get('case_number', '정보 없음')}")
+                st.write(f"**법원**: {precedent.get('court', '정보 없음')}")
+                st.write(f"**선고일자**: {precedent.get('date', '정보 없음')}")
+
+            with col2:
+                st.write(f"**선고형량**: {precedent.get('sentence', '정보 없음')}")
+                st.write(f"**위자료**: {precedent.get('compensation', '정보 없음')}")
+
+                # 유사도 표시
+                if sims is not None:
+                    st.metric("유사도", f"{float(sims[idx]):.2f}")
+
+            # 요약
+            if precedent.get('summary'):
+                st.markdown("**📝 요약**")
+                st.write(precedent['summary'])
+
+            # 관련 조문
+            if precedent.get('law_provisions'):
+                st.markdown("**⚖️ 관련 조문**")
+                st.write(precedent['law_provisions'])
+
+            # AI 요약 버튼
+            if st.button(f"🤖 AI 요약", key=f"summarize_{idx}"):
+                with st.spinner("AI가 판례를 요약하고 있습니다..."):
+                    try:
+                        summary = openai_api.summarize_precedent(precedent)
+                        st.markdown("**🤖 AI 요약**")
+                        st.write(summary)
+                    except Exception as e:
+                        st.error(f"AI 요약 실패: {e}")
+        else:
+            st.caption("표에서 행을 선택하면 상세 정보가 표시됩니다.")
+
+@st.fragment
+def _frag_verify_case_number(law_api):
+    """판례 번호 검증 프래그먼트"""
+    st.subheader("📋 판례 번호 검증")
+    
+    # 입력 예시
+    st.info("📌 **입력 예시**: 2019도11772, 2022고합57, 2020도5432, 2021도3456")
+    
+    # AI 검색 옵션
+    use_ai_search = st.checkbox(
+        "🤖 AI 실시간 검색 사용 (OpenAI API 필요)",
+        value=True,
+        help="체크하면 로컬 데이터에 없는 판례도 AI를 통해 실시간으로 검색합니다."
+    )
+    
+    case_number = st.text_input(
+        "판례 번호를 입력하세요",
+        placeholder="예: 2019도11772 또는 2022고합57"
+    )
+    
+    if st.button("🔍 판례 번호 검증"):
+        if case_number:
+            if use_ai_search:
+                with st.spinner("AI를 사용하여 판례를 검색 중입니다... (시간이 조금 걸릴 수 있습니다)"):
+                    result = law_api.verify_case_number(case_number, use_ai_search=True)
+            else:
+                with st.spinner("로컬 데이터에서 판례를 검색 중입니다..."):
+                    result = law_api.verify_case_number(case_number, use_ai_search=False)
                 
-                with col2:
-                    st.write(f"**선고형량**: {precedent.get('sentence', '정보 없음')}")
-                    st.write(f"**위자료**: {precedent.get('compensation', '정보 없음')}")
+                if result.get('exists'):
+                    # 검색 소스 표시
+                    if result.get('source') == '대법원 포털 API':
+                        st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 🏛️ (대법원 포털 API)")
+                        st.info("💡 이 결과는 대법원 포털 API를 통해 검색된 공식 정보입니다.")
+                    elif result.get('source') == 'AI 검색':
+                        st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 🤖 (AI 검색)")
+                        st.info("💡 이 결과는 AI를 통해 실시간으로 검색된 정보입니다. 정확성을 위해 공식 법원 사이트에서도 확인해보세요.")
+                    else:
+                        st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 📚 (로컬 데이터)")
+                    
+                    # 판례 정보 표시 — 항목별 st.metric 대신 표 하나로
+                    # 렌더링해 프런트엔드로 보내는 위젯 메시지 수를 줄인다
+                    detail_rows = [
+                        {"항목": "법원", "값": result.get('court', '정보 없음')},
+                        {"항목": "사건 유형", "값": result.get('case_type', '정보 없음')},
+                        {"항목": "판결일", "값": result.get('date', '정보 없음')},
+                        {"항목": "제목", "값": result.get('title', '정보 없음')},
+                        {"항목": "판결 결과", "값": result.get('verdict', '정보 없음')},
+                    ]
+                    if result.get('source'):
+                        detail_rows.append({"항목": "정보 출처", "값": result['source']})
+                    st.table(pd.DataFrame(detail_rows))
+                    
+                    # 상세 정보
+                    st.markdown("---")
+                    st.subheader("📄 판례 상세 정보")
                     
-                    # 유사도 표시
-                    if 'similarity' in precedent:
-                        similarity = precedent['similarity']
-                        st.metric("유사도", f"{similarity:.2f}")
+                    st.markdown(f"**📋 사건 개요**")
+                    st.write(result.get('summary', '정보 없음'))
+                    
+                    st.markdown(f"**🔍 주요 쟁점**")
+                    st.write(result.get('main_issue', '정보 없음'))
+                    
+                    # 적용 법률
+                    if result.get('applicable_law'):
+                        st.markdown("**⚖️ 적용 법률**")
+                        for law in result['applicable_law']:
+                            st.write(f"• {law}")
+                    
+                    # 키워드
+                    if result.get('keywords'):
+                        st.markdown("**🏷️ 키워드**")
+                        st.write(", ".join(result['keywords']))
+                    
+                else:
+                    if result.get('source') == '대법원 포털 API':
+                        st.error(f"❌ 판례 번호 '{case_number}'를 대법원 포털 API에서 찾을 수 없습니다.")
+                        st.warning("🏛️ 대법원 포털 API에서 해당 판례를 찾지 못했습니다. 판례 번호가 정확한지 확인하거나, 아래 공식 사이트에서 직접 검색해보세요.")
+                    elif use_ai_search and result.get('source') == 'AI 검색':
+                        st.error(f"❌ 판례 번호 '{case_number}'를 AI 검색에서도 찾을 수 없습니다.")
+                        st.warning("🤖 AI 검색을 시도했지만 해당 판례를 찾지 못했습니다. 판례 번호가 정확한지 확인하거나, 아래 공식 사이트에서 직접 검색해보세요.")
+                    else:
+                        st.error(f"❌ 판례 번호 '{case_number}'를 로컬 데이터에서 찾을 수 없습니다.")
+                        if not use_ai_search:
+                            st.info("💡 AI 실시간 검색을 활성화하면 더 많은 판례를 찾을 수 있습니다.")
+                    
+                    st.write(result.get('message', '알 수 없는 오류'))
+                    
+                    if result.get('suggestion'):
+                        st.info(f"💡 {result['suggestion']}")
+                    
+                    # 에러 정보 표시 (AI 검색 실패 시)
+                    if result.get('error') and use_ai_search:
+                        with st.expander("🔧 기술적 세부사항"):
+                            st.write(f"오류 내용: {result['error']}")
+                    
+                    # 검색 링크 제공
+                    if result.get('search_links'):
+                        st.markdown("---")
+                        st.subheader("🔍 직접 검색해보기")
+
+                        # 링크 3개를 markdown 한 번으로 렌더링 (위젯 수 절감)
+                        links = result['search_links']
+                        st.markdown(
+                            f"[🏛️ 대법원 판례]({links['대법원']}) | "
+                            f"[📖 종합법률정보]({links['종합법률정보']}) | "
+                            f"[⚖️ 케이스노트]({links['케이스노트']})"
+                        )
+        else:
+            st.warning("⚠️ 판례 번호를 입력해주세요.")
+
+@st.fragment
+def _frag_verify_law_article(law_api):
+    """법률 조항 검증 프래그먼트"""
+    st.subheader("📖 법률 조항 검증")
+    
+    # 입력 예시
+    st.info("📌 **입력 예시**: 형법 제243조, 민법 제750조, 정보통신망법 제44조의7")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        law_name = st.text_input(
+            "법률명을 입력하세요",
+            placeholder="예: 형법"
+        )
+    
+    with col2:
+        article_number = st.text_input(
+            "조항 번호를 입력하세요",
+            placeholder="예: 243 또는 44의7"
+        )
+    
+    if st.button("🔍 법률 조항 검증"):
+        if law_name and article_number:
+            with st.spinner("법률 조항을 검증 중입니다..."):
+                result = _cached_law_article(law_api, law_name, article_number)
                 
-                # 요약
-                if precedent.get('summary'):
-                    st.markdown("**📝 요약**")
-                    st.write(precedent['summary'])
+                if result.get('exists'):
+                    st.success(f"✅ {law_name} 제{article_number}조가 존재합니다!")
+                    
+                    # 조항 정보 표시
+                    st.markdown("---")
+                    st.subheader("📜 조항 내용")
+                    
+                    st.markdown(f"**📋 조항명**: {result.get('title', '정보 없음')}")
+                    st.markdown(f"**📖 조항 내용**")
+                    st.write(result.get('content', '정보 없음'))
+                    
+                    # 분류 정보
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.metric("대분류", result.get('category', '정보 없음'))
+                    with col2:
+                        st.metric("소분류", result.get('subcategory', '정보 없음'))
+                    
+                    # 관련 법률 검색
+                    st.markdown("---")
+                    st.subheader("🔗 관련 법률")
+                    
+                    law_reference = f"{law_name} 제{article_number}조"
+                    related_laws = _cached_related_laws(law_api, law_reference)
+                    
+                    if related_laws:
+                        for related in related_laws:
+                            with st.expander(f"📖 {related['law_name']} 제{related['article']}조 - {related['title']}"):
+                                st.write(f"**관련성**: {related['relation']}")
+                    else:
+                        st.info("관련 법률 정보가 없습니다.")
+                    
+                else:
+                    st.error(f"❌ {law_name} 제{article_number}조를 찾을 수 없습니다.")
+                    st.write(result.get('message', '알 수 없는 오류'))
+        else:
+            st.warning("⚠️ 법률명과 조항 번호를 모두 입력해주세요.")
+
+@st.fragment
+def _frag_verify_citation(law_api):
+    """종합 법률 인용 검증 프래그먼트"""
+    st.subheader("🔍 종합 법률 인용 검증")
+    
+    # 입력 예시
+    st.info("📌 **입력 예시**: 형법 제243조, 대법원 2019도11772")
+    
+    citation = st.text_input(
+        "법률 인용을 입력하세요",
+        placeholder="예: 형법 제243조 또는 대법원 2019도11772"
+    )
+    
+    if st.button("🔍 법률 인용 검증"):
+        if citation:
+            with st.spinner("법률 인용을 검증 중입니다..."):
+                result = _cached_citation(law_api, citation)
                 
-                # 관련 조문
-                if precedent.get('law_provisions'):
-                    st.markdown("**⚖️ 관련 조문**")
-                    st.write(precedent['law_provisions'])
+                if result.get('is_valid'):
+                    st.success(f"✅ '{citation}' 인용이 올바릅니다!")
+                    
+                    # 인용 유형별 정보 표시
+                    citation_type = result.get('type')
+                    details = result.get('details', {})
+                    
+                    st.markdown("---")
+                    st.subheader("📋 인용 정보")
+                    
+                    if citation_type == "law_article":
+                        st.markdown(f"**📖 유형**: 법률 조항")
+                        st.markdown(f"**📋 법률명**: {details.get('law_name', '정보 없음')}")
+                        st.markdown(f"**📄 조항번호**: {details.get('article_number', '정보 없음')}")
+                        st.markdown(f"**📜 조항명**: {details.get('title', '정보 없음')}")
+                        st.markdown(f"**📖 내용**:")
+                        st.write(details.get('content', '정보 없음'))
+                        
+                    elif citation_type == "case_number":
+                        st.markdown(f"**📋 유형**: 판례 번호")
+                        st.markdown(f"**🏛️ 법원**: {details.get('court', '정보 없음')}")
+                        st.markdown(f"**📅 연도**: {details.get('year', '정보 없음')}")
+                        st.markdown(f"**📋 사건유형**: {details.get('case_type', '정보 없음')}")
+                        st.markdown(f"**📄 제목**: {details.get('title', '정보 없음')}")
+                        st.markdown(f"**📖 요약**:")
+                        st.write(details.get('summary', '정보 없음'))
+                    
+                else:
+                    st.error(f"❌ '{citation}' 인용을 확인할 수 없습니다.")
+                    st.write(result.get('details', {}).get('error', '알 수 없는 오류'))
+                    
+                    # 형식 안내
+                    st.markdown("---")
+                    st.subheader("📝 올바른 형식")
+                    st.markdown("""
+                    **판례 번호**: 2019도11772, 2020도5432
+                    **법률 조항**: 형법 제243조, 민법 제750조
+                    """)
+        else:
+            st.warning("⚠️ 법률 인용을 입력해주세요.")
+
+@st.fragment
+def _frag_search_law_keyword(law_api):
+    """키워드 법률 검색 프래그먼트"""
+    st.subheader("🔎 키워드 법률 검색")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        keyword = st.text_input(
+            "검색 키워드를 입력하세요",
+            placeholder="예: 음란물, 사기, 불법행위"
+        )
+    
+    with col2:
+        law_type = st.selectbox(
+            "법률 유형 선택",
+            ["all", "criminal", "civil", "administrative"],
+            format_func=_LAW_TYPE_LABELS.get
+        )
+    
+    if st.button("🔍 법률 검색"):
+        if keyword:
+            with st.spinner("관련 법률을 검색 중입니다..."):
+                results = _cached_search_laws(law_api, keyword, law_type)
                 
-                # AI 요약 버튼
-                if st.button(f"🤖 AI 요약", key=f"summarize_{i}"):
-                    with st.spinner("AI가 판례를 요약하고 있습니다..."):
-                        try:
-                            summary = openai_api.summarize_precedent(precedent)
-                            st.markdown("**🤖 AI 요약**")
-                            st.write(summary)
-                        except Exception as e:
-                            st.error(f"AI 요약 실패: {e}")
+                if results:
+                    st.success(f"✅ '{keyword}' 관련 법률 {len(results)}개를 찾았습니다!")
+                    
+                    for i, law in enumerate(results):
+                        with st.expander(f"📖 {law['law_name']} 제{law['article']}조 - {law['title']}"):
+                            st.markdown(f"**📋 법률명**: {law['law_name']}")
+                            st.markdown(f"**📄 조항**: 제{law['article']}조")
+                            st.markdown(f"**📜 제목**: {law['title']}")
+                            st.markdown(f"**📖 내용**:")
+                            st.write(law['content'])
+                            st.markdown(f"**🏷️ 유형**: {law['type']}")
+                            st.markdown(f"**🔖 키워드**: {', '.join(law['keywords'])}")
+                else:
+                    st.warning(f"⚠️ '{keyword}' 관련 법률을 찾을 수 없습니다.")
+                    st.info("💡 다른 키워드로 검색해보세요.")
+        else:
+            st.warning("⚠️ 검색 키워드를 입력해주세요.")
 
 def show_legal_verification(law_api, openai_api):
     """법률 정보 검증 페이지"""
@@ -783,279 +1362,17 @@ def show_legal_verification(law_api, openai_api):
     st.markdown("---")
     
     if verification_type == "📋 판례 번호 검증":
-        st.subheader("📋 판례 번호 검증")
-        
-        # 입력 예시
-        st.info("📌 **입력 예시**: 2019도11772, 2022고합57, 2020도5432, 2021도3456")
-        
-        # AI 검색 옵션
-        use_ai_search = st.checkbox(
-            "🤖 AI 실시간 검색 사용 (OpenAI API 필요)",
-            value=True,
-            help="체크하면 로컬 데이터에 없는 판례도 AI를 통해 실시간으로 검색합니다."
-        )
-        
-        case_number = st.text_input(
-            "판례 번호를 입력하세요",
-            placeholder="예: 2019도11772 또는 2022고합57"
-        )
-        
-        if st.button("🔍 판례 번호 검증"):
-            if case_number:
-                if use_ai_search:
-                    with st.spinner("AI를 사용하여 판례를 검색 중입니다... (시간이 조금 걸릴 수 있습니다)"):
-                        result = law_api.verify_case_number(case_number, use_ai_search=True)
-                else:
-                    with st.spinner("로컬 데이터에서 판례를 검색 중입니다..."):
-                        result = law_api.verify_case_number(case_number, use_ai_search=False)
-                    
-                    if result.get('exists'):
-                        # 검색 소스 표시
-                        if result.get('source') == '대법원 포털 API':
-                            st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 🏛️ (대법원 포털 API)")
-                            st.info("💡 이 결과는 대법원 포털 API를 통해 검색된 공식 정보입니다.")
-                        elif result.get('source') == 'AI 검색':
-                            st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 🤖 (AI 검색)")
-                            st.info("💡 이 결과는 AI를 통해 실시간으로 검색된 정보입니다. 정확성을 위해 공식 법원 사이트에서도 확인해보세요.")
-                        else:
-                            st.success(f"✅ 판례 번호 '{case_number}'가 존재합니다! 📚 (로컬 데이터)")
-                        
-                        # 판례 정보 표시
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.metric("법원", result.get('court', '정보 없음'))
-                            st.metric("사건 유형", result.get('case_type', '정보 없음'))
-                            st.metric("판결일", result.get('date', '정보 없음'))
-                        
-                        with col2:
-                            st.metric("제목", result.get('title', '정보 없음'))
-                            st.metric("판결 결과", result.get('verdict', '정보 없음'))
-                            if result.get('source'):
-                                st.metric("정보 출처", result.get('source', '정보 없음'))
-                        
-                        # 상세 정보
-                        st.markdown("---")
-                        st.subheader("📄 판례 상세 정보")
-                        
-                        st.markdown(f"**📋 사건 개요**")
-                        st.write(result.get('summary', '정보 없음'))
-                        
-                        st.markdown(f"**🔍 주요 쟁점**")
-                        st.write(result.get('main_issue', '정보 없음'))
-                        
-                        # 적용 법률
-                        if result.get('applicable_law'):
-                            st.markdown("**⚖️ 적용 법률**")
-                            for law in result['applicable_law']:
-                                st.write(f"• {law}")
-                        
-                        # 키워드
-                        if result.get('keywords'):
-                            st.markdown("**🏷️ 키워드**")
-                            st.write(", ".join(result['keywords']))
-                        
-                    else:
-                        if result.get('source') == '대법원 포털 API':
-                            st.error(f"❌ 판례 번호 '{case_number}'를 대법원 포털 API에서 찾을 수 없습니다.")
-                            st.warning("🏛️ 대법원 포털 API에서 해당 판례를 찾지 못했습니다. 판례 번호가 정확한지 확인하거나, 아래 공식 사이트에서 직접 검색해보세요.")
-                        elif use_ai_search and result.get('source') == 'AI 검색':
-                            st.error(f"❌ 판례 번호 '{case_number}'를 AI 검색에서도 찾을 수 없습니다.")
-                            st.warning("🤖 AI 검색을 시도했지만 해당 판례를 찾지 못했습니다. 판례 번호가 정확한지 확인하거나, 아래 공식 사이트에서 직접 검색해보세요.")
-                        else:
-                            st.error(f"❌ 판례 번호 '{case_number}'를 로컬 데이터에서 찾을 수 없습니다.")
-                            if not use_ai_search:
-                                st.info("💡 AI 실시간 검색을 활성화하면 더 많은 판례를 찾을 수 있습니다.")
-                        
-                        st.write(result.get('message', '알 수 없는 오류'))
-                        
-                        if result.get('suggestion'):
-                            st.info(f"💡 {result['suggestion']}")
-                        
-                        # 에러 정보 표시 (AI 검색 실패 시)
-                        if result.get('error') and use_ai_search:
-                            with st.expander("🔧 기술적 세부사항"):
-                                st.write(f"오류 내용: {result['error']}")
-                        
-                        # 검색 링크 제공
-                        if result.get('search_links'):
-                            st.markdown("---")
-                            st.subheader("🔍 직접 검색해보기")
-                            
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                st.markdown(f"[🏛️ 대법원 판례]({result['search_links']['대법원']})")
-                            
-                            with col2:
-                                st.markdown(f"[📖 종합법률정보]({result['search_links']['종합법률정보']})")
-                            
-                            with col3:
-                                st.markdown(f"[⚖️ 케이스노트]({result['search_links']['케이스노트']})")
-            else:
-                st.warning("⚠️ 판례 번호를 입력해주세요.")
-    
+        _frag_verify_case_number(law_api)
+
     elif verification_type == "📖 법률 조항 검증":
-        st.subheader("📖 법률 조항 검증")
-        
-        # 입력 예시
-        st.info("📌 **입력 예시**: 형법 제243조, 민법 제750조, 정보통신망법 제44조의7")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            law_name = st.text_input(
-                "법률명을 입력하세요",
-                placeholder="예: 형법"
-            )
-        
-        with col2:
-            article_number = st.text_input(
-                "조항 번호를 입력하세요",
-                placeholder="예: 243 또는 44의7"
-            )
-        
-        if st.button("🔍 법률 조항 검증"):
-            if law_name and article_number:
-                with st.spinner("법률 조항을 검증 중입니다..."):
-                    result = law_api.get_law_article(law_name, article_number)
-                    
-                    if result.get('exists'):
-                        st.success(f"✅ {law_name} 제{article_number}조가 존재합니다!")
-                        
-                        # 조항 정보 표시
-                        st.markdown("---")
-                        st.subheader("📜 조항 내용")
-                        
-                        st.markdown(f"**📋 조항명**: {result.get('title', '정보 없음')}")
-                        st.markdown(f"**📖 조항 내용**")
-                        st.write(result.get('content', '정보 없음'))
-                        
-                        # 분류 정보
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.metric("대분류", result.get('category', '정보 없음'))
-                        with col2:
-                            st.metric("소분류", result.get('subcategory', '정보 없음'))
-                        
-                        # 관련 법률 검색
-                        st.markdown("---")
-                        st.subheader("🔗 관련 법률")
-                        
-                        law_reference = f"{law_name} 제{article_number}조"
-                        related_laws = law_api.get_related_laws(law_reference)
-                        
-                        if related_laws:
-                            for related in related_laws:
-                                with st.expander(f"📖 {related['law_name']} 제{related['article']}조 - {related['title']}"):
-                                    st.write(f"**관련성**: {related['relation']}")
-                        else:
-                            st.info("관련 법률 정보가 없습니다.")
-                        
-                    else:
-                        st.error(f"❌ {law_name} 제{article_number}조를 찾을 수 없습니다.")
-                        st.write(result.get('message', '알 수 없는 오류'))
-            else:
-                st.warning("⚠️ 법률명과 조항 번호를 모두 입력해주세요.")
-    
+        _frag_verify_law_article(law_api)
+
     elif verification_type == "🔍 종합 법률 인용 검증":
-        st.subheader("🔍 종합 법률 인용 검증")
-        
-        # 입력 예시
-        st.info("📌 **입력 예시**: 형법 제243조, 대법원 2019도11772")
-        
-        citation = st.text_input(
-            "법률 인용을 입력하세요",
-            placeholder="예: 형법 제243조 또는 대법원 2019도11772"
-        )
-        
-        if st.button("🔍 법률 인용 검증"):
-            if citation:
-                with st.spinner("법률 인용을 검증 중입니다..."):
-                    result = law_api.validate_legal_citation(citation)
-                    
-                    if result.get('is_valid'):
-                        st.success(f"✅ '{citation}' 인용이 올바릅니다!")
-                        
-                        # 인용 유형별 정보 표시
-                        citation_type = result.get('type')
-                        details = result.get('details', {})
-                        
-                        st.markdown("---")
-                        st.subheader("📋 인용 정보")
-                        
-                        if citation_type == "law_article":
-                            st.markdown(f"**📖 유형**: 법률 조항")
-                            st.markdown(f"**📋 법률명**: {details.get('law_name', '정보 없음')}")
-                            st.markdown(f"**📄 조항번호**: {details.get('article_number', '정보 없음')}")
-                            st.markdown(f"**📜 조항명**: {details.get('title', '정보 없음')}")
-                            st.markdown(f"**📖 내용**:")
-                            st.write(details.get('content', '정보 없음'))
-                            
-                        elif citation_type == "case_number":
-                            st.markdown(f"**📋 유형**: 판례 번호")
-                            st.markdown(f"**🏛️ 법원**: {details.get('court', '정보 없음')}")
-                            st.markdown(f"**📅 연도**: {details.get('year', '정보 없음')}")
-                            st.markdown(f"**📋 사건유형**: {details.get('case_type', '정보 없음')}")
-                            st.markdown(f"**📄 제목**: {details.get('title', '정보 없음')}")
-                            st.markdown(f"**📖 요약**:")
-                            st.write(details.get('summary', '정보 없음'))
-                        
-                    else:
-                        st.error(f"❌ '{citation}' 인용을 확인할 수 없습니다.")
-                        st.write(result.get('details', {}).get('error', '알 수 없는 오류'))
-                        
-                        # 형식 안내
-                        st.markdown("---")
-                        st.subheader("📝 올바른 형식")
-                        st.markdown("""
-                        **판례 번호**: 2019도11772, 2020도5432
-                        **법률 조항**: 형법 제243조, 민법 제750조
-                        """)
-            else:
-                st.warning("⚠️ 법률 인용을 입력해주세요.")
-    
+        _frag_verify_citation(law_api)
+
     elif verification_type == "🔎 키워드 법률 검색":
-        st.subheader("🔎 키워드 법률 검색")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            keyword = st.text_input(
-                "검색 키워드를 입력하세요",
-                placeholder="예: 음란물, 사기, 불법행위"
-            )
-        
-        with col2:
-            law_type = st.selectbox(
-                "법률 유형 선택",
-                ["all", "criminal", "civil", "administrative"],
-                format_func=lambda x: {"all": "전체", "criminal": "형사법", "civil": "민사법", "administrative": "행정법"}[x]
-            )
-        
-        if st.button("🔍 법률 검색"):
-            if keyword:
-                with st.spinner("관련 법률을 검색 중입니다..."):
-                    results = law_api.search_law_by_keyword(keyword, law_type)
-                    
-                    if results:
-                        st.success(f"✅ '{keyword}' 관련 법률 {len(results)}개를 찾았습니다!")
-                        
-                        for i, law in enumerate(results):
-                            with st.expander(f"📖 {law['law_name']} 제{law['article']}조 - {law['title']}"):
-                                st.markdown(f"**📋 법률명**: {law['law_name']}")
-                                st.markdown(f"**📄 조항**: 제{law['article']}조")
-                                st.markdown(f"**📜 제목**: {law['title']}")
-                                st.markdown(f"**📖 내용**:")
-                                st.write(law['content'])
-                                st.markdown(f"**🏷️ 유형**: {law['type']}")
-                                st.markdown(f"**🔖 키워드**: {', '.join(law['keywords'])}")
-                    else:
-                        st.warning(f"⚠️ '{keyword}' 관련 법률을 찾을 수 없습니다.")
-                        st.info("💡 다른 키워드로 검색해보세요.")
-            else:
-                st.warning("⚠️ 검색 키워드를 입력해주세요.")
-    
+        _frag_search_law_keyword(law_api)
+
     # 사용 팁
     st.markdown("---")
     st.subheader("💡 사용 팁")
@@ -1109,11 +1426,16 @@ def show_comprehensive_report(openai_api):
                 analysis = st.session_state.case_analysis['ai_analysis']
                 precedents = st.session_state.precedents[:5]  # 상위 5개 판례만 사용
                 
-                # 종합 리포트 생성
-                report = openai_api.generate_report(case_text, precedents, analysis)
-                
-                # 형량 예측
-                punishment_prediction = openai_api.estimate_punishment(analysis, precedents)
+                # 종합 리포트 생성 + 형량 예측을 병렬 실행
+                # (동일 입력 재생성은 캐시로 방지)
+                if _use_cache():
+                    report, punishment_prediction = _cached_report_bundle(
+                        openai_api, case_text, precedents, analysis
+                    )
+                else:
+                    report, punishment_prediction = _report_bundle(
+                        openai_api, case_text, precedents, analysis
+                    )
                 
                 st.success("✅ 종합 리포트가 생성되었습니다!")
                 
@@ -1136,9 +1458,13 @@ def show_comprehensive_report(openai_api):
                 with col3:
                     st.metric("가장 가능성 높은 형량", punishment_prediction.get('most_likely', '예측 불가'))
                 
-                # 신뢰도 표시
-                confidence = punishment_prediction.get('confidence', '0')
-                st.progress(int(confidence) / 100)
+                # 신뢰도 표시 — 한 번만 int 변환하고 [0, 100]으로 클램핑해
+                # 모델이 이상한 값을 내놓아도 예외 없이 렌더링한다
+                try:
+                    confidence = max(0, min(100, int(punishment_prediction.get('confidence', '0'))))
+                except (TypeError, ValueError):
+                    confidence = 0
+                st.progress(confidence / 100)
                 st.write(f"예측 신뢰도: {confidence}%")
                 
                 # 영향 요인들
@@ -1162,29 +1488,12 @@ def show_comprehensive_report(openai_api):
                         for factor in punishment_prediction['aggravation_factors']:
                             st.write(f"• {factor}")
                 
-                # 다운로드 버튼
+                # 다운로드 버튼 — 텍스트는 캐시된 빌더가 한 번만 조립
                 st.markdown("---")
-                
-                # 리포트 텍스트 생성
-                full_report = f"""
-판례 검색 & 사건 분석 리포트
-==============================
-
-생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{report}
 
-형량 예측 결과:
-- 최소 예상 형량: {punishment_prediction.get('min_punishment', '예측 불가')}
-- 최대 예상 형량: {punishment_prediction.get('max_punishment', '예측 불가')}
-- 가장 가능성 높은 형량: {punishment_prediction.get('most_likely', '예측 불가')}
-- 예측 신뢰도: {confidence}%
-
-"""
-                
                 st.download_button(
                     label="📥 리포트 다운로드",
-                    data=full_report,
+                    data=_report_download_bytes(report, punishment_prediction),
                     file_name=f"case_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
                     mime="text/plain"
                 )
@@ -1282,7 +1591,7 @@ def show_settings():
     st.markdown("---")
     st.subheader("🔍 현재 데이터 소스")
     
-    data_sources = Config.get_data_sources()
+    data_sources = _data_sources_snapshot()
     for i, source in enumerate(data_sources, 1):
         if "OpenAI" in source:
             st.write(f"{i}. 🤖 {source}")
@@ -1297,28 +1606,31 @@ def show_settings():
     st.markdown("---")
     st.subheader("📡 API 연결 상태")
     
+    # 상태 조회는 스냅샷 한 번으로 (rerun마다 Config 재조회 방지)
+    api_status = _api_status_snapshot()
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # OpenAI API 상태
-        openai_status = "✅ 연결됨" if Config.is_api_configured("openai") else "❌ 미연결"
+        openai_status = "✅ 연결됨" if api_status["openai"] else "❌ 미연결"
         st.write(f"**OpenAI API**: {openai_status}")
-        
+
         # 국가법령정보센터 API 상태
-        law_status = "✅ 연결됨" if Config.is_api_configured("law") else "❌ 미연결"
+        law_status = "✅ 연결됨" if api_status["law"] else "❌ 미연결"
         st.write(f"**국가법령정보센터**: {law_status}")
-    
+
     with col2:
         # 판례검색 API 상태
-        case_status = "✅ 연결됨" if Config.is_api_configured("case_search") else "❌ 미연결"
+        case_status = "✅ 연결됨" if api_status["case_search"] else "❌ 미연결"
         st.write(f"**판례검색 API**: {case_status}")
-        
+
         # 카카오 API 상태
-        kakao_status = "✅ 연결됨" if Config.is_api_configured("kakao") else "❌ 미연결"
+        kakao_status = "✅ 연결됨" if api_status["kakao"] else "❌ 미연결"
         st.write(f"**카카오 API**: {kakao_status}")
-    
+
     # API 설정 안내
-    if not Config.is_api_configured("openai"):
+    if not api_status["openai"]:
         st.warning("⚠️ OpenAI API가 설정되지 않았습니다. env_template.txt 파일을 참고하여 .env 파일을 설정하세요.")
         
         with st.expander("🔧 API 설정 방법"):
@@ -103,19 +103,20 @@ class AdvancedLegalVectorDB:
     def build_faiss_index(self, embeddings: np.ndarray) -> faiss.Index:
         """FAISS 인덱스 구축"""
         try:
-            # IVF + PQ 인덱스 (대용량 데이터에 효율적)
+            # HNSW + SQ8 인덱스 (대용량 데이터에서 O(log n) 그래프 탐색,
+            # int8 스칼라 양자화로 벡터 메모리 4배 절감)
             if len(embeddings) > 1000:
-                nlist = min(int(np.sqrt(len(embeddings))), 100)  # 클러스터 수
-                quantizer = faiss.IndexFlatIP(self.dimension)  # Inner Product (코사인 유사도)
-                index = faiss.IndexIVFFlat(quantizer, self.dimension, nlist)
-                
-                # 훈련
-                index.train(embeddings)
+                index = faiss.IndexHNSWSQ(
+                    self.dimension, faiss.ScalarQuantizer.QT_8bit, 32,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                index.hnsw.efConstruction = 200  # 구축 품질
+                index.hnsw.efSearch = 64  # 검색 시 탐색 폭
+                index.train(embeddings)  # 양자화 스케일 학습
                 index.add(embeddings)
-                index.nprobe = min(10, nlist)  # 검색 시 탐색할 클러스터 수
-                
-                self.logger.info(f"IVF 인덱스 구축 완료: {len(embeddings)}개 벡터, {nlist}개 클러스터")
-                
+
+                self.logger.info(f"HNSW+SQ8 인덱스 구축 완료: {len(embeddings)}개 벡터")
+
             else:
                 # 작은 데이터셋의 경우 Flat 인덱스
                 index = faiss.IndexFlatIP(self.dimension)
@@ -191,6 +192,8 @@ class AdvancedLegalVectorDB:
         try:
             if os.path.exists(self.index_path):
                 self.index = faiss.read_index(self.index_path)
+                if hasattr(self.index, 'hnsw'):
+                    self.index.hnsw.efSearch = 64
                 self.logger.info(f"인덱스 로드 완료: {self.index_path}")
                 return True
             return False
@@ -227,41 +230,86 @@ class AdvancedLegalVectorDB:
             
             # 유사도 검색
             scores, indices = self.index.search(query_embedding, top_k * 2)  # 여유분 확보
-            
-            results = []
-            added_cases = set()  # 중복 제거용
-            
-            for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-                if idx >= len(self.metadata):
-                    continue
-                
-                case_data = self.metadata[idx].copy()
-                case_data['similarity_score'] = float(score)
-                case_data['rank'] = i + 1
-                
-                # 사건 유형 필터링
-                if case_type and case_data.get('metadata', {}).get('type') != case_type:
-                    continue
-                
-                # 중복 제거 (같은 사건 ID)
-                case_id = case_data.get('metadata', {}).get('case_id', '')
-                if case_id and case_id in added_cases:
-                    continue
-                
-                results.append(case_data)
-                if case_id:
-                    added_cases.add(case_id)
-                
-                if len(results) >= top_k:
-                    break
-            
+
+            results = self._collect_results(scores[0], indices[0], top_k, case_type)
+
             self.logger.info(f"유사 사례 검색 완료: {len(results)}건 반환")
             return results
-            
+
         except Exception as e:
             self.logger.error(f"유사 사례 검색 오류: {e}")
             return []
-    
+
+    def _collect_results(self, scores, indices, top_k: int, case_type: Optional[str]) -> List[Dict]:
+        """검색 결과를 메타데이터와 결합하고 필터링/중복 제거"""
+        results = []
+        added_cases = set()  # 중복 제거용
+
+        for i, (score, idx) in enumerate(zip(scores, indices)):
+            if idx >= len(self.metadata):
+                continue
+
+            case_data = self.metadata[idx].copy()
+            case_data['similarity_score'] = float(score)
+            case_data['rank'] = i + 1
+
+            # 사건 유형 필터링
+            if case_type and case_data.get('metadata', {}).get('type') != case_type:
+                continue
+
+            # 중복 제거 (같은 사건 ID)
+            case_id = case_data.get('metadata', {}).get('case_id', '')
+            if case_id and case_id in added_cases:
+                continue
+
+            results.append(case_data)
+            if case_id:
+                added_cases.add(case_id)
+
+            if len(results) >= top_k:
+                break
+
+        return results
+
+    def search_similar_cases_batch(self,
+                                   queries: List[str],
+                                   top_k: int = 5,
+                                   case_types: Optional[List[Optional[str]]] = None) -> List[List[Dict]]:
+        """여러 쿼리 유사 사례 일괄 검색
+
+        쿼리 전체를 한 번에 임베딩하고 FAISS 검색도 행렬 단위로 한 번만
+        수행하므로, 쿼리별 개별 호출보다 왕복/연산 비용이 적다.
+        """
+        if not queries:
+            return []
+
+        if self.model is None or self.index is None:
+            self.logger.error("모델 또는 인덱스가 준비되지 않음")
+            return [[] for _ in queries]
+
+        if case_types is None:
+            case_types = [None] * len(queries)
+
+        try:
+            # 쿼리 일괄 임베딩 (인코딩 1회)
+            embeddings = self.model.encode(list(queries), convert_to_tensor=False)
+            embeddings = np.array(embeddings).astype('float32')
+
+            # 행렬 단위 유사도 검색 (인덱스 호출 1회)
+            scores, indices = self.index.search(embeddings, top_k * 2)  # 여유분 확보
+
+            results = [
+                self._collect_results(scores[i], indices[i], top_k, case_types[i])
+                for i in range(len(queries))
+            ]
+
+            self.logger.info(f"일괄 유사 사례 검색 완료: {len(queries)}개 쿼리")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"일괄 유사 사례 검색 오류: {e}")
+            return [[] for _ in queries]
+
     def get_case_statistics(self) -> Dict:
         """데이터베이스 통계 정보"""
         if not self.metadata:
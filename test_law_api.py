@@ -82,6 +82,36 @@ def test_multiple_laws():
     
     return results
 
+def test_unknown_case_number():
+    """미등록 판례 번호 검증 테스트 (TTL 캐시 deepcopy 회귀 확인)"""
+    print("\n🔍 미등록 판례 번호 검증 테스트 시작...")
+
+    law_api = LawAPI()
+
+    try:
+        # 형식은 유효하지만 시스템에 없는 번호 — not-found 템플릿 경로를
+        # 지나며, 캐시 래퍼의 deepcopy에서 예외가 나면 안 된다
+        result = law_api.verify_case_number("2099도99999", use_ai_search=False)
+    except Exception as e:
+        print(f"❌ 미등록 판례 번호 검증 중 예외 발생: {e}")
+        return False
+
+    if result.get('exists'):
+        print("❌ 미등록 번호가 존재하는 것으로 판정되었습니다!")
+        return False
+    if not result.get('search_links'):
+        print("❌ not-found 응답에 search_links가 없습니다!")
+        return False
+
+    # 캐시 히트 경로도 동일하게 예외 없이 사본을 돌려줘야 한다
+    cached = law_api.verify_case_number("2099도99999", use_ai_search=False)
+    if cached.get('search_links') is result.get('search_links'):
+        print("❌ 캐시가 search_links를 같은 객체로 반환했습니다!")
+        return False
+
+    print("✅ 미등록 판례 번호 검증 성공 (not-found 응답 + 캐시 사본)")
+    return True
+
 def main():
     """메인 테스트 함수"""
     print("🚀 법률 API 종합 테스트 시작")
@@ -92,8 +122,11 @@ def main():
     
     # 2. 여러 법률 조항 테스트
     results = test_multiple_laws()
-    
-    # 3. 결과 요약
+
+    # 3. 미등록 판례 번호 검증 테스트
+    unknown_ok = test_unknown_case_number()
+
+    # 4. 결과 요약
     print("\n" + "=" * 50)
     print("📊 테스트 결과 요약")
     print("=" * 50)
@@ -102,6 +135,11 @@ def main():
         print("✅ 민법 제750조 검색: 성공")
     else:
         print("❌ 민법 제750조 검색: 실패 - 이것이 주요 문제입니다!")
+
+    if unknown_ok:
+        print("✅ 미등록 판례 번호 검증: 성공")
+    else:
+        print("❌ 미등록 판례 번호 검증: 실패")
     
     success_count = 0
     total_count = len(results)
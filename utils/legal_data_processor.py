@@ -11,6 +11,19 @@ from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import logging
 
+# 선택적 의존성: orjson (설치 시 대용량 JSON 파싱/직렬화 가속)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_json(raw: bytes):
+    """JSON 바이트 파싱 — orjson이 있으면 C 구현 사용"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class LegalDataProcessor:
     """형사법 LLM 데이터 처리 클래스"""
     
@@ -139,7 +152,7 @@ class LegalDataProcessor:
                 for file_name in zip_ref.namelist():
                     if file_name.endswith('.json'):
                         with zip_ref.open(file_name) as json_file:
-                            data = json.load(json_file)
+                            data = _loads_json(json_file.read())
                             qa_data.extend(self._process_qa_json(data))
             
             self.logger.info(f"{data_type} QA 데이터 {len(qa_data)}건 추출 완료")
@@ -198,9 +211,13 @@ class LegalDataProcessor:
     def save_knowledge_base(self, knowledge_base: Dict, output_path: str = "legal_knowledge_base.json"):
         """지식베이스를 JSON 파일로 저장"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(knowledge_base, f, ensure_ascii=False, indent=2)
-            
+            if orjson is not None:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(knowledge_base, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(knowledge_base, f, ensure_ascii=False, indent=2)
+
             self.logger.info(f"지식베이스 저장 완료: {output_path}")
             
         except Exception as e:
@@ -1,9 +1,104 @@
+import os
 import re
+import functools
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 import warnings
 warnings.filterwarnings("ignore")
 
+# 선택적 의존성: ONNX Runtime (설치 시 더 빠른 CPU 인코딩 경로 사용)
+try:
+    import onnxruntime as _ort
+except ImportError:
+    _ort = None
+
+# 선택적 의존성: pyahocorasick (설치 시 법률 용어를 1패스로 스캔)
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+# 법률 용어 패턴 — 숫자 캡처가 필요한 패턴만 정규식으로 유지
+_LEGAL_TERM_RES = (
+    re.compile(r'(형법|민법|상법|행정법|형사소송법|민사소송법)\s*제?\s*(\d+조)'),  # 법령 조문
+    re.compile(r'(징역|벌금|과료|구류|과태료|집행유예|선고유예)\s*(\d+년?\s*\d*개월?|\d+만원?)'),  # 형량
+)
+
+# 고정 문자열 용어 — 패턴 수와 무관하게 한 번의 스캔으로 전부 탐지
+_LEGAL_TERM_LITERALS = (
+    '고발', '고소', '기소', '체포', '구속', '영장', '수사', '재판', '판결', '선고',  # 법적 절차
+    '사기', '절도', '강도', '살인', '폭행', '상해', '협박', '공갈', '모욕', '명예훼손', '도박', '음주운전',  # 범죄 유형
+    '위자료', '손해배상', '정신적피해', '재산피해', '피해보상',  # 피해 관련
+    '증거', '증인', '진술', '자백', '묵비권', '변호사', '검사', '판사',  # 법정 관련
+)
+
+
+def _build_term_automaton():
+    """고정 용어용 Aho-Corasick 자동자 구축 (의존성 없으면 None)"""
+    if _ahocorasick is None:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for term in _LEGAL_TERM_LITERALS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+_LEGAL_TERM_AC = _build_term_automaton()
+_LEGAL_TERM_FALLBACK_RE = re.compile('|'.join(_LEGAL_TERM_LITERALS))
+
+
+class _OnnxEncoder:
+    """ONNX Runtime 기반 문장 인코더
+
+    export_onnx_model.py로 내보낸 feature-extraction ONNX 모델을 실행하고
+    mean pooling으로 문장 임베딩을 생성한다. SentenceTransformer.encode와
+    호환되는 인터페이스를 제공하므로 호출부 수정 없이 교체 가능하다.
+    """
+
+    def __init__(self, model_path: str, tokenizer_name: str):
+        from transformers import AutoTokenizer
+
+        so = _ort.SessionOptions()
+        so.graph_optimization_level = _ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = os.cpu_count() or 1
+
+        self.session = _ort.InferenceSession(
+            model_path, sess_options=so, providers=['CPUExecutionProvider']
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+
+        # 동일 문자열 재인코딩 시 토크나이즈 비용 절감
+        self._tokenize = functools.lru_cache(maxsize=1024)(self._tokenize_uncached)
+
+    def _tokenize_uncached(self, text: str):
+        encoded = self.tokenizer(
+            text, truncation=True, max_length=256, return_tensors='np'
+        )
+        return encoded['input_ids'], encoded['attention_mask']
+
+    def encode(self, texts, **kwargs) -> np.ndarray:
+        """문장 리스트를 임베딩 행렬로 변환 (mean pooling)"""
+        if isinstance(texts, str):
+            texts = [texts]
+
+        embeddings = []
+        for text in texts:
+            input_ids, attention_mask = self._tokenize(text)
+            hidden = self.session.run(
+                None,
+                {
+                    'input_ids': input_ids.astype(np.int64),
+                    'attention_mask': attention_mask.astype(np.int64),
+                }
+            )[0][0]
+
+            mask = attention_mask[0][:, None].astype(np.float32)
+            embeddings.append((hidden * mask).sum(axis=0) / max(mask.sum(), 1e-9))
+
+        return np.array(embeddings, dtype=np.float32)
+
+
 class TextAnalyzer:
     """텍스트 분석 및 유사도 계산 클래스"""
     
@@ -15,14 +110,28 @@ class TextAnalyzer:
             model_name: 사용할 sentence transformer 모델명
         """
         self.model = None
+        self.model_name = model_name
         self._try_load_model()
-        
+
         self.index = None
         self.precedent_embeddings = None
         self.precedent_data = None
     
+    # export_onnx_model.py로 내보낸(int8 양자화) 모델이 있으면 우선 사용
+    ONNX_MODEL_PATH = "models/text_analyzer.onnx"
+
     def _try_load_model(self):
         """SentenceTransformer 모델 로딩 시도"""
+        # ONNX Runtime 경로: 내보낸 모델이 있으면 더 빠른 CPU 추론 사용
+        if _ort is not None and os.path.exists(self.ONNX_MODEL_PATH):
+            try:
+                self.model = _OnnxEncoder(self.ONNX_MODEL_PATH, self.model_name)
+                print(f"✅ ONNX Runtime 인코더 로드 완료: {self.ONNX_MODEL_PATH}")
+                return
+            except Exception as e:
+                print(f"⚠️ ONNX 인코더 로딩 실패: {e}")
+                print("💡 SentenceTransformer 경로로 전환합니다.")
+
         try:
             # transformers 버전 호환성 문제 해결을 위한 환경 설정
             import os
@@ -99,28 +208,22 @@ class TextAnalyzer:
             추출된 법률 용어 리스트
         """
         try:
-            # 법률 용어 패턴들
-            patterns = [
-                r'(형법|민법|상법|행정법|형사소송법|민사소송법)\s*제?\s*(\d+조)',  # 법령 조문
-                r'(징역|벌금|과료|구류|과태료|집행유예|선고유예)\s*(\d+년?\s*\d*개월?|\d+만원?)',  # 형량
-                r'(고발|고소|기소|고발|체포|구속|영장|수사|재판|판결|선고)',  # 법적 절차
-                r'(사기|절도|강도|살인|폭행|상해|협박|공갈|모욕|명예훼손|도박|음주운전)',  # 범죄 유형
-                r'(위자료|손해배상|정신적피해|재산피해|피해보상)',  # 피해 관련
-                r'(증거|증인|진술|자백|묵비권|변호사|검사|판사)',  # 법정 관련
-            ]
-            
             legal_terms = []
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        legal_terms.extend([term for term in match if term])
-                    else:
-                        legal_terms.append(match)
-            
+
+            # 숫자 캡처가 필요한 패턴 (조문/형량)
+            for pattern in _LEGAL_TERM_RES:
+                for match in pattern.findall(text):
+                    legal_terms.extend(term for term in match if term)
+
+            # 고정 용어: 자동자 1패스 스캔 (미설치 시 결합 정규식 1회)
+            if _LEGAL_TERM_AC is not None:
+                legal_terms.extend(term for _, term in _LEGAL_TERM_AC.iter(text))
+            else:
+                legal_terms.extend(_LEGAL_TERM_FALLBACK_RE.findall(text))
+
             # 중복 제거
             legal_terms = list(set(legal_terms))
-            
+
             return legal_terms
             
         except Exception as e:
@@ -147,22 +250,65 @@ class TextAnalyzer:
             text1 = self.preprocess_text(text1)
             text2 = self.preprocess_text(text2)
             
-            # 임베딩 생성
-            embeddings = self.model.encode([text1, text2])
-            
-            # 코사인 유사도 계산 (sklearn 없이)
-            emb1, emb2 = embeddings[0], embeddings[1]
-            dot_product = np.dot(emb1, emb2)
-            norm_a = np.linalg.norm(emb1)
-            norm_b = np.linalg.norm(emb2)
-            similarity = dot_product / (norm_a * norm_b)
-            
-            return float(similarity)
+            # 임베딩 생성 (float32로 변환해 BLAS 단정밀도 커널 사용)
+            embeddings = self.model.encode([text1, text2], convert_to_numpy=True)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+
+            # L2 정규화 후에는 코사인 유사도가 단순 내적(np.dot)이 된다
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+            return float(embeddings[0] @ embeddings[1])
             
         except Exception as e:
             print(f"유사도 계산 오류: {e}")
             return self._calculate_basic_similarity(text1, text2)
     
+    def calculate_similarity_batch(self, query: str, docs: List[str]) -> np.ndarray:
+        """
+        쿼리와 여러 문서 간 유사도 일괄 계산
+
+        문서마다 임베딩을 따로 생성하지 않고 한 번의 encode 호출로
+        전체를 임베딩한 뒤, 정규화된 행렬의 내적으로 코사인 유사도를
+        한꺼번에 계산한다.
+
+        Args:
+            query: 기준 텍스트
+            docs: 비교할 문서 리스트
+
+        Returns:
+            문서별 유사도 점수 배열 (0-1)
+        """
+        try:
+            if not docs:
+                return np.zeros(0, dtype=np.float32)
+
+            if self.model is None:
+                # 기본 텍스트 기반 유사도 계산 (Jaccard 유사도)
+                return np.array(
+                    [self._calculate_basic_similarity(query, doc) for doc in docs],
+                    dtype=np.float32
+                )
+
+            # 텍스트 전처리
+            texts = [self.preprocess_text(query)] + [self.preprocess_text(doc) for doc in docs]
+
+            # 쿼리 + 문서를 한 번에 임베딩
+            embeddings = self.model.encode(texts, batch_size=32, convert_to_numpy=True)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+
+            # 정규화 후 행렬 내적 한 번으로 코사인 유사도 계산
+            embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+            similarities = embeddings[1:] @ embeddings[0]
+
+            return similarities.astype(np.float32)
+
+        except Exception as e:
+            print(f"일괄 유사도 계산 오류: {e}")
+            return np.array(
+                [self._calculate_basic_similarity(query, doc) for doc in docs],
+                dtype=np.float32
+            )
+
     def build_precedent_index(self, precedents: List[Dict]):
         """
         판례 검색을 위한 인덱스 구축
@@ -184,11 +330,12 @@ class TextAnalyzer:
                 texts.append(self.preprocess_text(text))
             
             # 임베딩 생성
-            embeddings = self.model.encode(texts)
-            
-            # 정규화
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+
+            # 정규화 (이후 검색은 내적만으로 코사인 유사도 계산)
             embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-            
+
             # 참조 데이터 저장 (FAISS 없이 numpy 배열 사용)
             self.precedent_embeddings = embeddings
             self.precedent_data = precedents